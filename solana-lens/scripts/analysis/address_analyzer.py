@@ -1,6 +1,8 @@
 import json
+import functools
 import pandas as pd
-from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import time
 import logging # Use logging for better control
@@ -8,6 +10,29 @@ import logging # Use logging for better control
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+def _memoized(method: Callable) -> Callable:
+    """
+    Remember a method's results per analyzer and arguments for the rest of the run.
+
+    Results with a top-level "error" are not kept, so a failed analysis is retried on the
+    next call. Cached result dicts are shared between callers and must not be modified.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        cache = self._results
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+        result = method(self, *args, **kwargs)
+        if isinstance(result, dict) and "error" not in result:
+            cache[key] = result
+            if len(cache) > self.RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+    return wrapper
+
 class AddressAnalyzer:
     """
     Analyzer for detecting suspicious patterns in blockchain addresses.
@@ -16,6 +41,10 @@ class AddressAnalyzer:
     address poisoning, and other suspicious activities.
     """
     
+    # Analysis results remembered per (method, arguments), so call sites revisiting an address
+    # within a run don't repeat its API requests
+    RESULT_CACHE_SIZE = 4096
+    
     def __init__(self, range_client=None, helius_client=None, rugcheck_client=None, vybe_client=None):
         """
         Initialize the AddressAnalyzer.
@@ -30,7 +59,9 @@ class AddressAnalyzer:
         self.helius_client = helius_client
         self.rugcheck_client = rugcheck_client
         self.vybe_client = vybe_client
+        self._results = OrderedDict()  # (method, args, kwargs) -> result, LRU order
     
+    @_memoized
     def analyze_address(self, address: str) -> Dict:
         """
         Perform comprehensive analysis of an address.
@@ -190,6 +221,7 @@ class AddressAnalyzer:
 
         return results
     
+    @_memoized
     def detect_money_laundering_routes(self, address: str, max_depth: int = 3, days_history: int = 90) -> Dict:
         """
         Detect potential money laundering routes originating from an address.
@@ -311,6 +343,7 @@ class AddressAnalyzer:
         
         return results
     
+    @_memoized
     def detect_layering_patterns(self, address: str, days_history: int = 90) -> Dict:
         """
         Detect fund layering patterns (splitting and recombining funds).
@@ -1,7 +1,10 @@
 import json
+from array import array
+import numpy as np
 import pandas as pd
 import networkx as nx
-from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from datetime import datetime
 import time
 import logging # Use logging
@@ -10,6 +13,25 @@ import logging # Use logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
+@dataclass
+class GraphNode:
+    """An address node of exported transaction graph data."""
+    __slots__ = ("id", "type")
+    id: str
+    type: str
+
+
+@dataclass
+class GraphLink:
+    """A sender -> receiver edge of exported transaction graph data, aggregating its transfers."""
+    __slots__ = ("source", "target", "transactions", "weight", "total_amount")
+    source: str
+    target: str
+    transactions: List[Dict]
+    weight: int
+    total_amount: Any
+
+
 class NetworkBuilder:
     """
     Builder for creating network graphs from blockchain data.
@@ -19,7 +41,8 @@ class NetworkBuilder:
     relationships, and money laundering networks.
     """
     
-    def __init__(self, range_client=None, helius_client=None, rugcheck_client=None, vybe_client=None):
+    def __init__(self, range_client=None, helius_client=None, rugcheck_client=None, vybe_client=None,
+                 backend: str = "networkx"):
         """
         Initialize the NetworkBuilder.
         
@@ -28,11 +51,16 @@ class NetworkBuilder:
             helius_client: Helius API client
             rugcheck_client: RugCheck API client
             vybe_client: Vybe API client
+            backend (str, optional): Graph library used by build_transaction_graph: "networkx",
+                or "graph_tool" to keep very large graphs in graph-tool's C++ arrays (a few bytes
+                per edge instead of hundreds). graph-tool is installed separately.
+                Defaults to "networkx".
         """
         self.range_client = range_client
         self.helius_client = helius_client
         self.rugcheck_client = rugcheck_client
         self.vybe_client = vybe_client
+        self.backend = backend
     
     def build_transaction_graph(self, transactions: List[Dict]) -> nx.DiGraph:
         """
@@ -42,8 +70,11 @@ class NetworkBuilder:
             transactions (List[Dict]): List of transactions from Helius getTransaction.
 
         Returns:
-            nx.DiGraph: Transaction graph
+            nx.DiGraph: Transaction graph (a graph_tool.Graph with the "graph_tool" backend)
         """
+        if self.backend == "graph_tool":
+            return self._build_transaction_graph_gt(transactions)
+
         G = nx.DiGraph()
         logging.info(f"Building transaction graph from {len(transactions)} transactions...")
 
@@ -92,6 +123,104 @@ class NetworkBuilder:
         logging.info(f"Built graph with {G.number_of_nodes()} nodes and {G.number_of_edges()} edges.")
         return G
 
+    def _build_transaction_graph_gt(self, transactions: List[Dict]):
+        """
+        Build the transaction graph with graph-tool from columnar edge arrays.
+
+        Vertices carry an "address" property; each (sender, receiver) pair becomes one edge with
+        "weight" (transfer count) and "total_amount" properties, as in the NetworkX graph. The
+        per-transfer lists are not stored; use build_graph_data_from_arrays for those.
+
+        Args:
+            transactions (List[Dict]): List of transactions from Helius getTransaction.
+
+        Returns:
+            graph_tool.Graph: Directed transaction graph
+        """
+        try:
+            import graph_tool
+        except ImportError as e:
+            raise ImportError("The graph_tool backend requires graph-tool (https://graph-tool.skewed.de)") from e
+
+        src, dst, attrs, addresses = self._extract_edge_ids(transactions)
+        g = graph_tool.Graph(directed=True)
+        address = g.new_vertex_property("string")
+        if addresses:
+            g.add_vertex(len(addresses))
+            for vertex, addr in enumerate(addresses):
+                address[vertex] = addr
+        g.vertex_properties["address"] = address
+
+        weight = g.new_edge_property("int64_t")
+        total_amount = g.new_edge_property("double")
+        if len(src):
+            # One edge per (sender, receiver) pair, in order of first appearance
+            node_count = len(addresses)
+            edge_ids, pairs = pd.factorize(src.astype(np.int64) * node_count + dst)
+            g.add_edge_list(np.column_stack((pairs // node_count, pairs % node_count)))
+            weight.a = np.bincount(edge_ids)
+            total_amount.a = np.bincount(edge_ids, weights=attrs["amount"].to_numpy(dtype=np.float64))
+        g.edge_properties["weight"] = weight
+        g.edge_properties["total_amount"] = total_amount
+
+        logging.info(f"Built graph-tool graph with {g.num_vertices()} vertices and {g.num_edges()} edges.")
+        return g
+
+    def build_graph_data_from_arrays(self, src: np.ndarray, dst: np.ndarray, attrs: pd.DataFrame,
+                                     addresses: Optional[List[str]] = None) -> Dict:
+        """
+        Build D3 node/link data straight from columnar transfer edges.
+
+        Produces the same nodes and links as exporting build_transaction_graph's result, but
+        keeps the edges as arrays (int32 node ids plus one attribute frame) instead of a
+        NetworkX graph of per-node and per-edge dicts, which is far lighter for large graphs.
+
+        Args:
+            src (np.ndarray): Sender of each transfer, as an address or (with addresses) an id
+            dst (np.ndarray): Receiver of each transfer, as an address or (with addresses) an id
+            attrs (pd.DataFrame): One row per transfer with 'tx_hash', 'amount', 'mint' and
+                'block_time' columns, as returned by _extract_edge_ids
+            addresses (List[str], optional): Address of each id when src and dst hold int32 ids
+                from an address table, as returned by _extract_edge_ids. Addresses are only
+                looked up here, when the nodes and links are written out.
+
+        Returns:
+            Dict: {"nodes": [GraphNode], "links": [GraphLink]} with one link per (sender, receiver)
+                pair. The records serialize as the same JSON objects exporting the NetworkX graph
+                gives, without a dict per node and link.
+        """
+        if len(src) == 0:
+            return {"nodes": [], "links": []}
+
+        # Interleave endpoints so node ids follow first appearance, as nodes are added to the graph.
+        # This also compacts ids from a shared address table down to the nodes actually present.
+        codes, uniques = pd.factorize(np.column_stack((src, dst)).ravel())
+        codes = codes.astype(np.int32)
+        src_ids = codes[0::2]
+        dst_ids = codes[1::2]
+        addresses = uniques.tolist() if addresses is None else [addresses[i] for i in uniques.tolist()]
+
+        # One edge per (sender, receiver) pair, numbered in order of first appearance
+        edge_ids, _ = pd.factorize(src_ids.astype(np.int64) * len(addresses) + dst_ids)
+        first_rows = np.unique(edge_ids, return_index=True)[1]
+        weights = np.bincount(edge_ids).tolist()
+        totals = attrs["amount"].groupby(edge_ids, sort=True).sum().tolist()
+
+        edge_transactions = [[] for _ in range(len(first_rows))]
+        for edge_id, record in zip(edge_ids.tolist(), attrs.to_dict("records")):
+            edge_transactions[edge_id].append(record)
+
+        nodes = [GraphNode(address, "address") for address in addresses]
+        links = [
+            GraphLink(addresses[source], addresses[target], transactions, weight, total)
+            for source, target, transactions, weight, total in zip(
+                src_ids[first_rows].tolist(), dst_ids[first_rows].tolist(), edge_transactions, weights, totals
+            )
+        ]
+
+        logging.info(f"Built graph data with {len(nodes)} nodes and {len(links)} links.")
+        return {"nodes": nodes, "links": links}
+
     def build_token_creator_network(self, tokens_analysis: List[Dict]) -> nx.Graph:
         """
         Build a network of token creators and their tokens from analysis results.
@@ -501,6 +630,11 @@ class NetworkBuilder:
         account_keys = tx_detail.get("transaction", {}).get("message", {}).get("accountKeys", [])
         log_messages = meta.get("logMessages", [])
         
+        # Group inner instructions by their outer instruction once, instead of rescanning per instruction
+        inner_by_index = {}
+        for inner_ix_group in inner_instructions:
+            inner_by_index.setdefault(inner_ix_group.get("index"), []).extend(inner_ix_group.get("instructions", []))
+        
         # Process outer instructions
         for ix_idx, ix in enumerate(instructions):
             program_id_idx = ix.get("programIdIndex")
@@ -516,25 +650,109 @@ class NetworkBuilder:
                 self._extract_system_transfers(ix, account_keys, transfers)
             
             # Process corresponding inner instructions
-            for inner_ix_group in inner_instructions:
-                if inner_ix_group.get("index") == ix_idx:
-                    for inner_ix in inner_ix_group.get("instructions", []):
-                        inner_program_id_idx = inner_ix.get("programIdIndex")
-                        if inner_program_id_idx is None or inner_program_id_idx >= len(account_keys):
-                            continue
-                            
-                        inner_program_id = account_keys[inner_program_id_idx]
-                        
-                        if inner_program_id == "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA":
-                            self._extract_spl_token_transfers(inner_ix, account_keys, transfers)
-                        elif inner_program_id == "11111111111111111111111111111111":
-                            self._extract_system_transfers(inner_ix, account_keys, transfers)
+            for inner_ix in inner_by_index.get(ix_idx, ()):
+                inner_program_id_idx = inner_ix.get("programIdIndex")
+                if inner_program_id_idx is None or inner_program_id_idx >= len(account_keys):
+                    continue
+                    
+                inner_program_id = account_keys[inner_program_id_idx]
+                
+                if inner_program_id == "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA":
+                    self._extract_spl_token_transfers(inner_ix, account_keys, transfers)
+                elif inner_program_id == "11111111111111111111111111111111":
+                    self._extract_system_transfers(inner_ix, account_keys, transfers)
         
         # Look for balance changes to catch any transfers we missed through instruction parsing
         self._extract_transfers_from_balance_changes(meta, account_keys, transfers)
         
         return transfers
     
+    def _extract_transfer_arrays(self, transactions: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Extract the transfers of many transactions as parallel column arrays.
+        
+        Args:
+            transactions (List[Dict]): Transaction details from Helius API
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Sources and destinations (object arrays)
+                and raw amounts (float64), one entry per transfer
+        """
+        sources = []
+        destinations = []
+        amounts = []
+        add_source = sources.append
+        add_destination = destinations.append
+        add_amount = amounts.append
+        
+        for tx in transactions:
+            for t in self._extract_transfers(tx):
+                add_source(t.get("source"))
+                add_destination(t.get("destination"))
+                add_amount(t.get("amount", 0))
+        
+        return (np.array(sources, dtype=object), np.array(destinations, dtype=object),
+                np.array(amounts, dtype=np.float64))
+    
+    def _extract_edge_ids(self, transactions: Iterable[Dict], address_ids: Optional[Dict[str, int]] = None
+                          ) -> Tuple[np.ndarray, np.ndarray, pd.DataFrame, List[str]]:
+        """
+        Extract the graph edges of many transactions as columnar arrays of address ids.
+
+        Each distinct address is stored once and referred to by an int32 id everywhere else, so
+        the edge arrays don't hold a separate string object per occurrence. Only transfers with
+        a known sender and receiver are kept, matching build_transaction_graph. Ids are appended
+        to typed arrays as transactions arrive, so a deduplicating generator can be fed straight
+        in and the whole stream is parsed in one pass.
+
+        Args:
+            transactions (Iterable[Dict]): Transaction details from Helius API, consumed once
+            address_ids (Dict[str, int], optional): Address-to-id table to extend, so ids stay
+                consistent across calls. A new table is used if not provided.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, pd.DataFrame, List[str]]: Sender and receiver ids
+                (int32), a frame of per-transfer 'tx_hash', 'amount', 'mint' and 'block_time',
+                and the address of every id in the table
+        """
+        if address_ids is None:
+            address_ids = {}
+        mint_pool = {}
+        # C int buffers (4 bytes per id) instead of lists of int objects
+        sources = array('i')
+        destinations = array('i')
+        tx_hashes = []
+        amounts = []
+        mints = []
+        block_times = []
+
+        for tx_detail in transactions:
+            tx_hash = tx_detail.get("transaction", {}).get("signatures", [None])[0]
+            block_time = tx_detail.get("blockTime")
+
+            for transfer in self._extract_transfers(tx_detail):
+                sender = transfer.get("source")
+                receiver = transfer.get("destination")
+                if sender and receiver and sender != 'unknown' and receiver != 'unknown':
+                    sources.append(address_ids.setdefault(sender, len(address_ids)))
+                    destinations.append(address_ids.setdefault(receiver, len(address_ids)))
+                    tx_hashes.append(tx_hash)
+                    amounts.append(transfer.get("amount", 0))
+                    # Few distinct mints; share one string object per mint
+                    mint = transfer.get("mint", "SOL")
+                    mints.append(mint_pool.setdefault(mint, mint))
+                    block_times.append(block_time)
+
+        attrs = pd.DataFrame({
+            "tx_hash": pd.Series(tx_hashes, dtype=object),
+            "amount": amounts,
+            "mint": pd.Series(mints, dtype=object),
+            # object dtype keeps missing block times as None rather than NaN
+            "block_time": pd.Series(block_times, dtype=object)
+        })
+        return (np.array(sources, dtype=np.int32), np.array(destinations, dtype=np.int32), attrs,
+                list(address_ids))
+
     def _extract_spl_token_transfers(self, instruction: Dict, account_keys: List[str], transfers: List[Dict]) -> None:
         """Extract SPL token transfers from an instruction."""
         parsed = instruction.get("parsed", {})
@@ -577,6 +795,10 @@ class NetworkBuilder:
         pre_balances = meta.get("preTokenBalances", [])
         post_balances = meta.get("postTokenBalances", [])
         
+        # A transfer needs both a sender's pre-balance and a receiver's post-balance
+        if not pre_balances or not post_balances:
+            return
+        
         # Create maps for pre and post balances
         pre_map = {}  # {owner: {mint: {account_idx: amount}}}
         post_map = {}  # {owner: {mint: {account_idx: amount}}}
@@ -1,12 +1,27 @@
+import os
 import json
+import heapq
+import numpy as np
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import time
 import logging # Use logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Range labels that mark a token creator as suspicious
+SUSPICIOUS_CREATOR_LABELS = frozenset({"scammer", "suspicious_creator"})
+
+
+def _get_nested(data: Any, path: Tuple[str, ...], default: Any = None) -> Any:
+    """Follow a key path through nested dicts without allocating empty dicts for missing levels."""
+    try:
+        for key in path:
+            data = data[key]
+    except (KeyError, TypeError, IndexError):
+        return default
+    return data
+
 
 class TokenAnalyzer:
     """
@@ -16,10 +31,25 @@ class TokenAnalyzer:
     insider activity, and token security patterns.
     """
     
+    # Key paths into nested Vybe response fields, resolved with _get_nested
+    _PRICE_USD = ("price", "usd")
+    _MARKET_CAP_USD = ("market_cap", "usd")
+    _AMOUNT_USD = ("amount", "usd")
+    _FROM_ADDRESS = ("from", "address")
+    _TO_ADDRESS = ("to", "address")
+    
+    # Worker pool for concurrent API calls, shared by all TokenAnalyzer instances.
+    # Sized for I/O-bound work rather than the CPU-count default.
+    _executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 5),
+                                   thread_name_prefix="token-analyzer")
+    
     def __init__(self, range_client=None, helius_client=None, rugcheck_client=None, vybe_client=None):
         """
         Initialize the TokenAnalyzer.
         
+        To reuse connections across the clients, construct them with the same
+        requests.Session (they all accept session=).
+        
         Args:
             range_client: Range API client
             helius_client: Helius API client
@@ -31,6 +61,11 @@ class TokenAnalyzer:
         self.rugcheck_client = rugcheck_client
         self.vybe_client = vybe_client
         
+        # RugCheck full reports are heavy, so keep them for the session
+        self._token_report_cache = {}
+        # Creator pattern analysis keyed by creator, stored with the token list it was built from
+        self._creator_pattern_cache = {}
+        
         # Known risk factors for tokens
         self.risk_factors = {
             "mint_authority": {
@@ -59,16 +94,22 @@ class TokenAnalyzer:
             }
         }
     
-    def analyze_token(self, token_mint: str) -> Dict:
+    def analyze_token(self, token_mint: str, depth: str = "full") -> Dict:
         """
         Perform comprehensive analysis of a token.
         
         Args:
             token_mint (str): Token mint address
+            depth (str, optional): "full" fetches the RugCheck full report for creator
+                and liquidity analysis, "quick" derives them from the summary only.
+                Defaults to "full".
             
         Returns:
             Dict: Analysis results
         """
+        if depth not in ("quick", "full"):
+            raise ValueError(f"Unsupported analysis depth: {depth}")
+
         results = {
             "token_mint": token_mint,
             "timestamp": datetime.now().isoformat(),
@@ -80,35 +121,53 @@ class TokenAnalyzer:
             "historical_activity": {}
         }
         
+        # Dispatch the independent API calls up front so they run concurrently;
+        # each section below waits on its own result
+        pending = {}
+        if self.vybe_client:
+            pending["token_info"] = self._executor.submit(self.vybe_client.get_token_details, token_mint)
+            # Note: Vybe might require pagination for full holder list
+            pending["holders"] = self._executor.submit(
+                self.vybe_client.get_token_top_holders, token_mint, query_params={"limit": 100}) # Limit for example
+            # Get OHLCV data (e.g., daily for last 90 days)
+            ohlcv_params = {"resolution": "1D", "limit": 90} # Example: Daily, 90 data points
+            pending["ohlcv"] = self._executor.submit(
+                self.vybe_client.get_token_ohlcv, token_mint, query_params=ohlcv_params)
+        if self.rugcheck_client:
+            pending["risk_summary"] = self._executor.submit(self.rugcheck_client.get_token_report_summary, token_mint)
+            if depth == "full":
+                pending["token_report"] = self._executor.submit(self._get_token_report, token_mint)
+        
         # Get token information if Vybe client is available
         if self.vybe_client:
             try:
-                token_info = self.vybe_client.get_token_details(token_mint)
+                token_info = pending["token_info"].result()
                 # Assuming Vybe response structure, adjust keys as needed
                 results["token_info"] = {
                     "name": token_info.get("name", ""),
                     "symbol": token_info.get("symbol", ""),
                     "decimals": token_info.get("decimals", 0),
                     "supply": token_info.get("supply", 0),
-                    "price_usd": token_info.get("price", {}).get("usd", 0), # Nested price
-                    "market_cap": token_info.get("market_cap", {}).get("usd", 0), # Nested market cap
+                    "price_usd": _get_nested(token_info, self._PRICE_USD, 0), # Nested price
+                    "market_cap": _get_nested(token_info, self._MARKET_CAP_USD, 0), # Nested market cap
                     "description": token_info.get("description", ""),
                     "image_uri": token_info.get("image_uri", ""),
                     "website": token_info.get("website", ""),
                     "tags": token_info.get("tags", [])
                 }
-                logging.info(f"Vybe token info fetched for {token_mint}")
+                logging.info("Vybe token info fetched for %s", token_mint)
             except Exception as e:
-                logging.error(f"Error getting Vybe token info for {token_mint}: {e}")
+                logging.error("Error getting Vybe token info for %s: %s", token_mint, e)
                 results["token_info"] = {"error": str(e)}
         else:
             logging.warning("Vybe client not available for token info.")
 
         # Get risk assessment if RugCheck client is available
+        risk_summary = {}
         if self.rugcheck_client:
             try:
                 # Use summary first for efficiency
-                risk_summary = self.rugcheck_client.get_token_report_summary(token_mint)
+                risk_summary = pending["risk_summary"].result()
                 results["risk_assessment"] = {
                     "score": risk_summary.get("score", 0),
                     "score_normalized": risk_summary.get("score_normalised", 0), # Note spelling
@@ -117,14 +176,10 @@ class TokenAnalyzer:
                     "is_verified": risk_summary.get("verified", False),
                     "rugcheck_url": f"https://rugcheck.xyz/tokens/{token_mint}"
                 }
-                logging.info(f"RugCheck risk summary fetched for {token_mint}: Score {results['risk_assessment'].get('score')}")
-
-                # Fetch full report for more details if needed later
-                # token_report = self.rugcheck_client.get_token_report(token_mint)
-                # results["risk_assessment"]["full_report_data"] = token_report # Store if needed
+                logging.info("RugCheck risk summary fetched for %s: Score %s", token_mint, results['risk_assessment'].get('score'))
 
             except Exception as e:
-                logging.error(f"Error getting RugCheck risk assessment for {token_mint}: {e}")
+                logging.error("Error getting RugCheck risk assessment for %s: %s", token_mint, e)
                 results["risk_assessment"] = {"error": str(e)}
         else:
             logging.warning("RugCheck client not available for risk assessment.")
@@ -132,12 +187,11 @@ class TokenAnalyzer:
         # Get holder analysis if Vybe client is available
         if self.vybe_client:
             try:
-                # Note: Vybe might require pagination for full holder list
-                holders_data = self.vybe_client.get_token_top_holders(token_mint, query_params={"limit": 100}) # Limit for example
+                holders_data = pending["holders"].result()
                 results["holder_analysis"] = self._analyze_token_holders(holders_data)
-                logging.info(f"Vybe holder analysis for {token_mint}: Found {results['holder_analysis'].get('total_holders')} holders.")
+                logging.info("Vybe holder analysis for %s: Found %s holders.", token_mint, results['holder_analysis'].get('total_holders'))
             except Exception as e:
-                logging.error(f"Error getting Vybe holder analysis for {token_mint}: {e}")
+                logging.error("Error getting Vybe holder analysis for %s: %s", token_mint, e)
                 results["holder_analysis"] = {"error": str(e)}
         else:
             logging.warning("Vybe client not available for holder analysis.")
@@ -145,12 +199,14 @@ class TokenAnalyzer:
         # Get creator and liquidity analysis using RugCheck (if available)
         if self.rugcheck_client:
             try:
-                # Fetch full report only if needed and not already fetched
-                if "full_report_data" not in results["risk_assessment"]:
-                     token_report = self.rugcheck_client.get_token_report(token_mint)
-                     logging.info(f"RugCheck full report fetched for {token_mint}")
+                if depth == "full":
+                    token_report = pending["token_report"].result()
+                    logging.info("RugCheck full report fetched for %s", token_mint)
                 else:
-                     token_report = results["risk_assessment"]["full_report_data"] # Reuse if fetched
+                    # Quick mode: work with whatever the summary already provides
+                    token_report = risk_summary
+                    populated = [key for key in ("creator", "creatorTokens", "markets") if key in token_report]
+                    logging.info("RugCheck quick analysis for %s: summary provided %s", token_mint, populated or 'no creator/liquidity fields')
 
                 # Extract creator information
                 creator = token_report.get("creator", "")
@@ -163,15 +219,16 @@ class TokenAnalyzer:
                     # "creator_tokens_summary": [{"mint": t.get("mint"), "name": t.get("name")} for t in creator_tokens_data[:5]], # Example summary
                     "is_suspicious": self._is_creator_suspicious(creator, creator_tokens_data)
                 }
-                logging.info(f"RugCheck creator analysis for {token_mint}: Creator {creator}, {len(creator_tokens_data)} other tokens.")
+                logging.info("RugCheck creator analysis for %s: Creator %s, %s other tokens.", token_mint, creator, len(creator_tokens_data))
 
-                # Extract liquidity information
-                markets = token_report.get("markets", [])
-                results["liquidity_analysis"] = self._analyze_token_liquidity(markets)
-                logging.info(f"RugCheck liquidity analysis for {token_mint}: Total Liq ${results['liquidity_analysis'].get('total_liquidity_usd'):.2f}, Locked {results['liquidity_analysis'].get('liquidity_locked_pct'):.1f}%")
+                # Extract liquidity information (quick mode only if the summary had markets)
+                if depth == "full" or "markets" in token_report:
+                    markets = token_report.get("markets", [])
+                    results["liquidity_analysis"] = self._analyze_token_liquidity(markets)
+                    logging.info("RugCheck liquidity analysis for %s: Total Liq $%.2f, Locked %.1f%%", token_mint, results['liquidity_analysis'].get('total_liquidity_usd'), results['liquidity_analysis'].get('liquidity_locked_pct'))
 
             except Exception as e:
-                logging.error(f"Error getting RugCheck creator/liquidity analysis for {token_mint}: {e}")
+                logging.error("Error getting RugCheck creator/liquidity analysis for %s: %s", token_mint, e)
                 # Avoid overwriting if only one part failed
                 if "creator_analysis" not in results: results["creator_analysis"] = {"error": str(e)}
                 if "liquidity_analysis" not in results: results["liquidity_analysis"] = {"error": str(e)}
@@ -182,9 +239,7 @@ class TokenAnalyzer:
         # Get historical activity if Vybe client is available
         if self.vybe_client:
             try:
-                # Get OHLCV data (e.g., daily for last 90 days)
-                ohlcv_params = {"resolution": "1D", "limit": 90} # Example: Daily, 90 data points
-                ohlcv_data = self.vybe_client.get_token_ohlcv(token_mint, query_params=ohlcv_params)
+                ohlcv_data = pending["ohlcv"].result()
 
                 # Get token holder count time series if available (Vybe might not have this specific endpoint)
                 # holder_ts_data = {} # Placeholder
@@ -193,17 +248,13 @@ class TokenAnalyzer:
                     "price_data": ohlcv_data.get("data", []), # Assuming 'data' contains OHLCV list
                     # "holder_data": holder_ts_data.get("data", [])
                 }
-                logging.info(f"Vybe historical activity fetched for {token_mint}")
+                logging.info("Vybe historical activity fetched for %s", token_mint)
             except Exception as e:
-                logging.error(f"Error getting Vybe historical activity for {token_mint}: {e}")
+                logging.error("Error getting Vybe historical activity for %s: %s", token_mint, e)
                 results["historical_activity"] = {"error": str(e)}
         else:
             logging.warning("Vybe client not available for historical activity.")
 
-        # Clean up potentially large data from full report if stored
-        if "full_report_data" in results.get("risk_assessment", {}):
-            del results["risk_assessment"]["full_report_data"]
-
         return results
 
     def analyze_token_creator(self, creator_address: str) -> Dict:
@@ -233,9 +284,9 @@ class TokenAnalyzer:
                     "labels": address_info.get("labels", []),
                     "entity": address_info.get("entity", {})
                 }
-                logging.info(f"Range creator info fetched for {creator_address}")
+                logging.info("Range creator info fetched for %s", creator_address)
             except Exception as e:
-                logging.error(f"Error getting Range creator info for {creator_address}: {e}")
+                logging.error("Error getting Range creator info for %s: %s", creator_address, e)
                 results["creator_info"] = {"error": str(e)}
         else:
             logging.warning("Range client not available for creator info.")
@@ -252,28 +303,30 @@ class TokenAnalyzer:
              try:
                  recent_tokens = self.rugcheck_client.get_recently_detected_tokens()
                  creator_tokens_list = [t for t in recent_tokens if t.get("creator") == creator_address]
-                 logging.info(f"Found {len(creator_tokens_list)} tokens potentially created by {creator_address} in recent RugCheck stats.")
+                 logging.info("Found %s tokens potentially created by %s in recent RugCheck stats.", len(creator_tokens_list), creator_address)
              except Exception as e:
-                 logging.error(f"Error fetching recent tokens from RugCheck for creator analysis: {e}")
+                 logging.error("Error fetching recent tokens from RugCheck for creator analysis: %s", e)
         else:
              logging.warning("RugCheck client not available to fetch creator's tokens.")
 
         results["tokens_created"] = creator_tokens_list # Store summary or full data
 
         # Analyze token creation patterns based on the fetched list
-        results["pattern_analysis"] = self._analyze_creator_patterns(results["tokens_created"])
+        results["pattern_analysis"] = self._get_creator_patterns(creator_address, results["tokens_created"])
 
         # Assess creator risk based on available info
         results["risk_assessment"] = self._assess_creator_risk(creator_address, results)
 
         return results
 
-    def detect_token_rug_patterns(self, token_mint: str) -> Dict:
+    def detect_token_rug_patterns(self, token_mint: str, early_exit_at: Optional[int] = None) -> Dict:
         """
         Detect patterns associated with rug pulls for a token.
         
         Args:
             token_mint (str): Token mint address
+            early_exit_at (int, optional): Stop checking once the rug score reaches this
+                value and flag the result with "early_exit". Defaults to None (run all checks).
             
         Returns:
             Dict: Detected rug patterns
@@ -292,17 +345,31 @@ class TokenAnalyzer:
             return results
 
         try:
-            token_report = self.rugcheck_client.get_token_report(token_mint)
-            logging.info(f"Fetched RugCheck full report for rug pattern analysis of {token_mint}")
+            token_report = self._get_token_report(token_mint)
+            logging.info("Fetched RugCheck full report for rug pattern analysis of %s", token_mint)
 
             # Extract risk factors from the report
             risks = token_report.get("risks", []) # Assuming 'risks' is the key for detailed factors
 
             # --- Pattern Detection Logic ---
+            # Checks run cheapest first so an early exit skips the heavier ones
             patterns = []
             evidence = {}
             rug_score_contribution = 0
 
+            def threshold_reached() -> bool:
+                return early_exit_at is not None and rug_score_contribution >= early_exit_at
+
+            def finish(early_exit: bool = False) -> Dict:
+                # Calculate final rug risk score (capped at 100)
+                results["rug_risk_score"] = min(100, int(rug_score_contribution))
+                results["detected_patterns"] = patterns
+                results["evidence"] = evidence
+                if early_exit:
+                    results["early_exit"] = True
+                logging.info("Rug pattern analysis for %s: Score %s, Patterns %s", token_mint, results['rug_risk_score'], patterns)
+                return results
+
             # 1. Mint Authority Check
             mint_authority = token_report.get("mintAuthority")
             if mint_authority:
@@ -312,6 +379,7 @@ class TokenAnalyzer:
                     "description": "Mint authority is enabled, allowing unlimited minting."
                 }
                 rug_score_contribution += 25 # High risk
+                if threshold_reached(): return finish(early_exit=True)
 
             # 2. Freeze Authority Check
             freeze_authority = token_report.get("freezeAuthority")
@@ -322,19 +390,9 @@ class TokenAnalyzer:
                     "description": "Freeze authority is enabled, allowing token account freezing."
                 }
                 rug_score_contribution += 15 # Medium risk
+                if threshold_reached(): return finish(early_exit=True)
 
-            # 3. Liquidity Analysis (using helper)
-            markets = token_report.get("markets", [])
-            liquidity_info = self._analyze_token_liquidity(markets)
-            evidence["liquidity"] = liquidity_info
-            if liquidity_info.get("total_liquidity_usd", 0) < 5000: # Arbitrary low liquidity threshold
-                 patterns.append("low_liquidity")
-                 rug_score_contribution += 20
-            elif liquidity_info.get("liquidity_locked_pct", 100) < 80: # Arbitrary lock threshold
-                 patterns.append("unlocked_liquidity")
-                 rug_score_contribution += 25 # High risk if significant liquidity is unlocked
-
-            # 4. Ownership Concentration (using RugCheck's top holders if available)
+            # 3. Ownership Concentration (using RugCheck's top holders if available)
             top_holders = token_report.get("topHolders", []) # Assuming RugCheck provides this
             if top_holders:
                 # Exclude known CEX/DEX/Bridge addresses if possible (requires label checking)
@@ -347,8 +405,9 @@ class TokenAnalyzer:
                         "description": "Token ownership is highly concentrated among a few wallets (excluding known infra)."
                     }
                     rug_score_contribution += 20
+                    if threshold_reached(): return finish(early_exit=True)
 
-            # 5. Insider Networks (using RugCheck's data)
+            # 4. Insider Networks (using RugCheck's data)
             insider_networks = token_report.get("insiderNetworks", []) # Assuming this key exists
             if insider_networks:
                  total_insider_supply_pct = sum(net.get("supplyPct", 0) for net in insider_networks) # Check key name
@@ -360,24 +419,32 @@ class TokenAnalyzer:
                           "description": "Significant portion of supply held by potential insider networks."
                       }
                       rug_score_contribution += 25
+                      if threshold_reached(): return finish(early_exit=True)
 
-            # 6. Socials/Verification Check (from RugCheck)
+            # 5. Socials/Verification Check (from RugCheck)
             is_verified = token_report.get("verified", False)
             has_socials = any(token_report.get(link) for link in ["website", "twitter", "telegram", "discord"]) # Check common links
             if not is_verified and not has_socials:
                  patterns.append("missing_socials_or_verification")
                  evidence["socials"] = {"verified": is_verified, "has_socials": has_socials}
                  rug_score_contribution += 10
+                 if threshold_reached(): return finish(early_exit=True)
 
+            # 6. Liquidity Analysis (using helper) - walks every market, so it runs last
+            markets = token_report.get("markets", [])
+            liquidity_info = self._analyze_token_liquidity(markets)
+            evidence["liquidity"] = liquidity_info
+            if liquidity_info.get("total_liquidity_usd", 0) < 5000: # Arbitrary low liquidity threshold
+                 patterns.append("low_liquidity")
+                 rug_score_contribution += 20
+            elif liquidity_info.get("liquidity_locked_pct", 100) < 80: # Arbitrary lock threshold
+                 patterns.append("unlocked_liquidity")
+                 rug_score_contribution += 25 # High risk if significant liquidity is unlocked
 
-            # Calculate final rug risk score (capped at 100)
-            results["rug_risk_score"] = min(100, int(rug_score_contribution))
-            results["detected_patterns"] = patterns
-            results["evidence"] = evidence
-            logging.info(f"Rug pattern analysis for {token_mint}: Score {results['rug_risk_score']}, Patterns {patterns}")
+            return finish()
 
         except Exception as e:
-            logging.error(f"Error detecting rug patterns for {token_mint}: {e}")
+            logging.error("Error detecting rug patterns for %s: %s", token_mint, e)
             results["error"] = str(e)
 
         return results
@@ -410,7 +477,7 @@ class TokenAnalyzer:
 
         try:
             # Set up query parameters for time period
-            end_time = int(datetime.now().timestamp())
+            end_time = int(time.time())
             start_time = end_time - (days * 24 * 60 * 60)
 
             # Fetch transfers using Vybe (might need pagination)
@@ -420,20 +487,21 @@ class TokenAnalyzer:
                 "timeEnd": end_time,
                 "limit": 1000 # Adjust limit as needed, handle pagination if necessary
             }
-            logging.info(f"Fetching Vybe token transfers for {token_mint} (last {days} days)...")
+            logging.info("Fetching Vybe token transfers for %s (last %s days)...", token_mint, days)
             transfers_data = self.vybe_client.get_token_transfers(query_params=query_params)
             # Adjust key based on actual Vybe response structure
             transfers = transfers_data.get("data", []) # Assuming 'data' holds the list
 
             if not transfers:
-                 logging.info(f"No transfers found for {token_mint} in the last {days} days.")
+                 logging.info("No transfers found for %s in the last %s days.", token_mint, days)
                  return results
 
-            logging.info(f"Analyzing {len(transfers)} transfers...")
+            logging.info("Analyzing %s transfers...", len(transfers))
             results["transfer_count"] = len(transfers)
 
             # Volume statistics (ensure keys match Vybe response)
-            volumes = [tx.get("amount", {}).get("usd", 0) for tx in transfers if tx.get("amount", {}).get("usd") is not None] # Use USD amount if available
+            usd_amounts = (_get_nested(tx, self._AMOUNT_USD) for tx in transfers)
+            volumes = [usd for usd in usd_amounts if usd is not None] # Use USD amount if available
             results["volume_stats"] = {
                 "total_volume_usd": sum(volumes),
                 "average_transfer_usd": sum(volumes) / len(volumes) if volumes else 0,
@@ -447,8 +515,8 @@ class TokenAnalyzer:
             receivers = {}
             for tx in transfers:
                 # Adjust keys based on Vybe response for sender/receiver
-                sender = tx.get("from", {}).get("address") # Example key
-                receiver = tx.get("to", {}).get("address") # Example key
+                sender = _get_nested(tx, self._FROM_ADDRESS) # Example key
+                receiver = _get_nested(tx, self._TO_ADDRESS) # Example key
                 if sender: senders[sender] = senders.get(sender, 0) + 1
                 if receiver: receivers[receiver] = receivers.get(receiver, 0) + 1
 
@@ -472,16 +540,52 @@ class TokenAnalyzer:
             # Detect suspicious patterns (implement specific logic)
             suspicious_patterns = self._detect_suspicious_transfer_patterns(transfers)
             results["suspicious_patterns"] = suspicious_patterns
-            logging.info(f"Transfer analysis for {token_mint} complete. Found {len(suspicious_patterns)} suspicious patterns.")
+            logging.info("Transfer analysis for %s complete. Found %s suspicious patterns.", token_mint, len(suspicious_patterns))
 
         except Exception as e:
-            logging.error(f"Error analyzing token transfers for {token_mint}: {e}")
+            logging.error("Error analyzing token transfers for %s: %s", token_mint, e)
             results["error"] = str(e)
 
         return results
 
+    def close(self) -> None:
+        """
+        Shut down the worker pool used for concurrent API calls.
+        
+        The pool is shared by all TokenAnalyzer instances, so only call this
+        once no analyzer in the process needs it anymore.
+        """
+        self._executor.shutdown(wait=True)
+    
     # Helper methods
     
+    def _get_token_report(self, token_mint: str) -> Dict:
+        """Fetch the RugCheck full report for a token, reusing it within the session."""
+        if token_mint not in self._token_report_cache:
+            self._token_report_cache[token_mint] = self.rugcheck_client.get_token_report(token_mint)
+        return self._token_report_cache[token_mint]
+    
+    def _get_creator_patterns(self, creator_address: str, tokens: List[Dict]) -> Dict:
+        """
+        Analyze a creator's token patterns, reusing the previous result while the token list is unchanged.
+        
+        Args:
+            creator_address (str): Creator's address
+            tokens (List[Dict]): Tokens attributed to the creator
+            
+        Returns:
+            Dict: Pattern analysis results
+        """
+        # Any new, removed or re-scored token changes the fingerprint and invalidates the entry
+        fingerprint = tuple((t.get("mint"), t.get("createdAt"), t.get("score")) for t in tokens)
+        cached = self._creator_pattern_cache.get(creator_address)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        patterns = self._analyze_creator_patterns(tokens)
+        self._creator_pattern_cache[creator_address] = (fingerprint, patterns)
+        return patterns
+    
     def _analyze_token_holders(self, holders_data: Dict) -> Dict:
         """Analyze token holder distribution."""
         holders = holders_data.get("holders", [])
@@ -512,6 +616,10 @@ class TokenAnalyzer:
             pct = holder.get("percentage", 0)
             cumulative_pct += pct
             
+            # Holders are sorted, so once past 50% no later holder can count
+            if cumulative_pct > 50:
+                break
+            
             if cumulative_pct <= 10:
                 top_10_count += 1
             
@@ -545,21 +653,20 @@ class TokenAnalyzer:
         
         # Check if creator has many short-lived tokens
         short_lived_count = 0
+        recent_cutoff = datetime.now() - timedelta(days=30)
         for token in creator_tokens:
             created_at = token.get("createdAt", "")
             
             try:
                 created_date = datetime.strptime(created_at, "%Y-%m-%dT%H:%M:%SZ")
-                age_days = (datetime.now() - created_date).days
                 
-                if age_days < 30:
+                if created_date > recent_cutoff:
                     short_lived_count += 1
+                    if short_lived_count > 5:
+                        return True
             except:
                 pass
         
-        if short_lived_count > 5:
-            return True
-        
         # More sophisticated checks would go here
         
         return False
@@ -631,7 +738,7 @@ class TokenAnalyzer:
                           created_at = datetime.strptime(created_at_str, "%Y-%m-%dT%H:%M:%SZ")
                           creation_times.append(created_at.timestamp())
                      except ValueError:
-                          logging.warning(f"Could not parse creation date: {created_at_str}")
+                          logging.warning("Could not parse creation date: %s", created_at_str)
 
 
             # Placeholder for success metric (e.g., using RugCheck score)
@@ -639,14 +746,15 @@ class TokenAnalyzer:
 
         patterns = {}
         if creation_times:
-            creation_times.sort()
-            time_diffs = [creation_times[i+1] - creation_times[i] for i in range(len(creation_times)-1)]
-            patterns["token_creation_frequency_median_seconds"] = self._median(time_diffs) if time_diffs else None
-            patterns["token_creation_frequency_avg_seconds"] = sum(time_diffs) / len(time_diffs) if time_diffs else None
-            patterns["creation_time_span_days"] = (max(creation_times) - min(creation_times)) / 86400 if len(creation_times) > 1 else 0
+            sorted_times = np.sort(np.asarray(creation_times, dtype=np.float64))
+            time_diffs = np.diff(sorted_times)
+            patterns["token_creation_frequency_median_seconds"] = self._median(time_diffs) if time_diffs.size else None
+            patterns["token_creation_frequency_avg_seconds"] = float(time_diffs.mean()) if time_diffs.size else None
+            patterns["creation_time_span_days"] = float(sorted_times[-1] - sorted_times[0]) / 86400 if sorted_times.size > 1 else 0
 
         # patterns["average_token_lifespan"] = ... # Hard to calculate
-        patterns["average_rugcheck_score"] = sum(success_metrics) / len(success_metrics) if success_metrics else 0
+        scores = np.fromiter(success_metrics, dtype=np.float64, count=len(success_metrics))
+        patterns["average_rugcheck_score"] = float(scores.mean()) if scores.size else 0
 
         return patterns
 
@@ -676,7 +784,7 @@ class TokenAnalyzer:
 
         # Factor 4: Creator Labels (from Range)
         creator_labels = analysis_results.get("creator_info", {}).get("labels", [])
-        if any(lbl in ['scammer', 'suspicious_creator'] for lbl in creator_labels): # Example labels
+        if not SUSPICIOUS_CREATOR_LABELS.isdisjoint(creator_labels):
              risk_score += 50
              risk_factors.append({"factor": "suspicious_creator_labels", "labels": creator_labels})
 
@@ -698,21 +806,22 @@ class TokenAnalyzer:
     
     def _get_top_items(self, items: Dict, count: int) -> List[Dict]:
         """Get top items from a dictionary by value."""
-        sorted_items = sorted(items.items(), key=lambda x: x[1], reverse=True)
-        return [{"address": k, "count": v} for k, v in sorted_items[:count]]
+        top_items = heapq.nlargest(count, items.items(), key=lambda x: x[1])
+        return [{"address": k, "count": v} for k, v in top_items]
     
     def _median(self, values: List[float]) -> float:
-        """Calculate median of a list of values."""
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        
+        """Calculate median of a list of values using O(n) selection instead of a full sort."""
+        n = len(values)
         if n == 0:
             return 0.0
         
+        k = n // 2
         if n % 2 == 1:
-            return sorted_values[n // 2]
-        else:
-            return (sorted_values[n // 2 - 1] + sorted_values[n // 2]) / 2
+            return float(np.partition(np.asarray(values, dtype=np.float64), k)[k])
+        
+        # Even length: partition around both middle positions in one call
+        partitioned = np.partition(np.asarray(values, dtype=np.float64), [k - 1, k])
+        return float((partitioned[k - 1] + partitioned[k]) / 2)
     
     def _detect_suspicious_transfer_patterns(self, transfers: List[Dict]) -> List[Dict]:
         """Detect suspicious patterns in token transfers (basic examples)."""
@@ -722,12 +831,20 @@ class TokenAnalyzer:
         # Pattern 1: Wash Trading (Self-transfers or back-and-forth between few wallets)
         # This requires more sophisticated analysis tracking flows between specific pairs.
         # Placeholder: Detect direct self-transfers
-        self_transfers = [tx for tx in transfers if tx.get("from", {}).get("address") == tx.get("to", {}).get("address")]
-        if len(self_transfers) > 5: # Arbitrary threshold
+        # Count in one pass and keep only the first match as a sample
+        self_transfer_count = 0
+        self_transfer_sample = None
+        for tx in transfers:
+            from_address = _get_nested(tx, self._FROM_ADDRESS)
+            if from_address and from_address == _get_nested(tx, self._TO_ADDRESS):
+                self_transfer_count += 1
+                if self_transfer_count == 1:
+                    self_transfer_sample = tx.get("signature") # Example key
+        if self_transfer_count > 5: # Arbitrary threshold
              patterns.append({
                  "type": "potential_wash_trading_self",
-                 "count": len(self_transfers),
-                 "sample_tx": self_transfers[0].get("signature") # Example key
+                 "count": self_transfer_count,
+                 "sample_tx": self_transfer_sample
              })
 
         # Pattern 2: Pump and Dump Indicators (Rapid volume/price increase followed by large sell-offs from early holders)
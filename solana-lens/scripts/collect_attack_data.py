@@ -4,6 +4,11 @@ import logging
 import argparse
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 # Import custom API clients
 from collectors.helius_client import HeliusClient
 # Import analysis utilities
@@ -54,8 +59,12 @@ try:
     logging.info(f"Saving detected attacks to {output_path}...")
     # Use exporter or simple json dump
     try:
-        with open(output_path, 'w') as f:
-            json.dump(detected_attacks, f, indent=2)
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(detected_attacks, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(detected_attacks, f, indent=2)
         # exporter.save_json(detected_attacks, args.filename) # If using exporter
         logging.info("Data saved successfully.")
     except Exception as e:
@@ -1,36 +1,60 @@
 import logging
 import asyncio
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
 
+from .rate_limiter import AsyncRateLimiter
+
 class AddressPoisoningCollector:
     """
     Collector for data related to address poisoning attempts on Solana.
     Detects small dust transfers that might be attempts to trick users.
     """
     
-    def __init__(self, helius_client=None):
+    # Helius accepts up to 100 mints per metadata request
+    _METADATA_BATCH_SIZE = 100
+    # Upper bound on cached per-transaction transfers so long scans stay bounded in memory
+    _TRANSFERS_CACHE_SIZE = 10000
+    
+    def __init__(self, helius_client=None, requests_per_second: float = 10):
         """
         Initialize the AddressPoisoningCollector.
         
         Args:
             helius_client: Helius API client instance for fetching transaction data
+            requests_per_second: Helius request budget shared by the concurrent fetches
         """
         if not helius_client:
             raise ValueError("HeliusClient is required for AddressPoisoningCollector")
             
         self.helius_client = helius_client
-        self.token_metadata_cache = {}  # Cache token metadata to avoid repeated lookups
+        self.requests_per_second = requests_per_second
+        # Token bucket shared by every fetch, created per event loop
+        self._rate_limiter = None
+        self._rate_limiter_loop = None
+        self.token_metadata_cache = {}  # mint -> metadata dict (None if the token has none)
+        self._transfers_cache = OrderedDict()  # tx signature -> extracted transfers, LRU order
         
         logging.info("AddressPoisoningCollector initialized")
     
-    async def collect_address_transactions(self, addresses: List[str], limit_per_address: int = 200) -> List[Dict]:
+    def _get_rate_limiter(self) -> AsyncRateLimiter:
+        """Return the token bucket shared by all fetches, creating one per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._rate_limiter_loop is not loop:
+            self._rate_limiter = AsyncRateLimiter(self.requests_per_second)
+            self._rate_limiter_loop = loop
+        return self._rate_limiter
+    
+    async def collect_address_transactions(self, addresses: List[str], limit_per_address: int = 200,
+                                           concurrency: int = 10) -> List[Dict]:
         """
         Collect recent transactions for a list of addresses.
         
         Args:
             addresses: List of addresses to collect transactions for
             limit_per_address: Maximum number of transactions per address
+            concurrency: Maximum number of requests in flight at once
             
         Returns:
             List of transaction details
@@ -38,22 +62,34 @@ class AddressPoisoningCollector:
         from scripts.collectors.sandwich_collector import SandwichCollector
         
         sandwich_collector = SandwichCollector(self.helius_client)
-        transactions_to_check = []
+        semaphore = asyncio.Semaphore(concurrency)  # Bounds in-flight requests instead of fixed sleeps
+        limiter = self._get_rate_limiter()  # Bounds request starts per second
         
-        for address in addresses:
-            try:
-                # Get recent signatures for this address
-                signatures_result = self.helius_client.get_signatures_for_address(address, limit=limit_per_address)
-                signatures = signatures_result.get("result", [])
-                
-                # Fetch transaction details
-                for sig in signatures:
-                    tx_detail = sandwich_collector.fetch_transaction_details(sig['signature'])
-                    if tx_detail:
-                        transactions_to_check.append(tx_detail)
-                        await asyncio.sleep(0.1)  # Rate limit
-            except Exception as e:
-                logging.warning(f"Error fetching transactions for {address}: {e}")
+        async def fetch_signatures(address: str) -> List[Dict]:
+            async with semaphore, limiter:
+                try:
+                    # Get recent signatures for this address
+                    signatures_result = await asyncio.to_thread(
+                        self.helius_client.get_signatures_for_address, address, limit=limit_per_address
+                    )
+                    return signatures_result.get("result", [])
+                except Exception as e:
+                    logging.warning(f"Error fetching transactions for {address}: {e}")
+                    return []
+        
+        async def fetch_details(signature: str) -> Optional[Dict]:
+            async with semaphore, limiter:
+                return await asyncio.to_thread(sandwich_collector.fetch_transaction_details, signature)
+        
+        signature_lists = await asyncio.gather(*(fetch_signatures(address) for address in addresses))
+        # A transaction touching several watched addresses only needs to be fetched once
+        signatures = list(dict.fromkeys(
+            sig['signature'] for address_sigs in signature_lists for sig in address_sigs
+        ))
+        
+        # Fetch transaction details
+        tx_details = await asyncio.gather(*(fetch_details(signature) for signature in signatures))
+        transactions_to_check = [tx_detail for tx_detail in tx_details if tx_detail]
                 
         logging.info(f"Collected {len(transactions_to_check)} transactions for analysis")
         return transactions_to_check
@@ -81,6 +117,8 @@ class AddressPoisoningCollector:
         potential_count = 0
         processed_tx_sigs = set()
         
+        # First pass: extract transfers once and keep only dust transfers as candidates
+        candidates = []  # (tx, tx_hash, transfer)
         for tx in transactions:
             tx_hash = tx.get("transaction", {}).get("signatures", [None])[0]
             if not tx_hash or tx_hash in processed_tx_sigs:
@@ -89,30 +127,46 @@ class AddressPoisoningCollector:
             processed_tx_sigs.add(tx_hash)
             checked_count += 1
             
-            transfers = network_builder._extract_transfers(tx)
-            for t in transfers:
-                # Heuristic: Small amount (e.g., 1 smallest unit) of an SPL token
-                if t.get('type') == 'SPL' and t.get('amount') == 1:
-                    mint = t.get('mint')
-                    if not mint:
-                        continue
-                        
-                    # Check token metadata (use cache)
-                    is_suspicious_token = await self._check_token_suspicious(mint)
-                    
-                    if is_suspicious_token:
-                        results["potential_poisoning_txs"].append({
-                            "tx_hash": tx_hash,
-                            "sender": t.get('source'),
-                            "receiver": t.get('destination'),
-                            "mint": mint,
-                            "amount": t.get('amount'),
-                            "timestamp": tx.get("blockTime"),
-                            "token_symbol": await self._get_token_symbol(mint)
-                        })
-                        potential_count += 1
-                        logging.info(f"Potential poisoning tx found: {tx_hash} (mint: {mint})")
-                        break  # Flag transaction once
+            # Reuse transfers extracted for this transaction in an earlier run
+            transfers = self._transfers_cache.get(tx_hash)
+            if transfers is None:
+                transfers = network_builder._extract_transfers(tx)
+                self._transfers_cache[tx_hash] = transfers
+                if len(self._transfers_cache) > self._TRANSFERS_CACHE_SIZE:
+                    self._transfers_cache.popitem(last=False)  # Evict least recently used
+            else:
+                self._transfers_cache.move_to_end(tx_hash)
+                
+            # Heuristic: Small amount (e.g., 1 smallest unit) of an SPL token
+            candidates.extend(
+                (tx, tx_hash, t) for t in transfers
+                if t.get('type') == 'SPL' and t.get('amount') == 1 and t.get('mint')
+            )
+        
+        if candidates:
+            # Fetch metadata for all candidate mints in batched requests
+            await self._prefetch_metadata({t['mint'] for _, _, t in candidates})
+        
+        # Second pass: flag transactions using the cached metadata
+        flagged_tx_sigs = set()
+        for tx, tx_hash, t in candidates:
+            if tx_hash in flagged_tx_sigs:
+                continue  # Flag transaction once
+                
+            mint = t['mint']
+            if self._check_token_suspicious(mint):
+                results["potential_poisoning_txs"].append({
+                    "tx_hash": tx_hash,
+                    "sender": t.get('source'),
+                    "receiver": t.get('destination'),
+                    "mint": mint,
+                    "amount": t.get('amount'),
+                    "timestamp": tx.get("blockTime"),
+                    "token_symbol": self._get_token_symbol(mint)
+                })
+                flagged_tx_sigs.add(tx_hash)
+                potential_count += 1
+                logging.info(f"Potential poisoning tx found: {tx_hash} (mint: {mint})")
                         
         results["statistics"]["checked_tx_count"] = checked_count
         results["statistics"]["potential_count"] = potential_count
@@ -120,45 +174,54 @@ class AddressPoisoningCollector:
         logging.info(f"Checked {checked_count} transactions, found {potential_count} potential poisoning attempts")
         return results
     
-    async def _check_token_suspicious(self, mint: str) -> bool:
-        """Check if a token is suspicious based on its metadata."""
-        if mint in self.token_metadata_cache:
-            return self.token_metadata_cache[mint]
+    async def _prefetch_metadata(self, mints: Set[str]) -> None:
+        """Fetch metadata for all uncached mints, batching up to 100 mints per request."""
+        missing = [mint for mint in mints if mint not in self.token_metadata_cache]
+        if not missing:
+            return
             
-        try:
-            # Use Helius method to get metadata
-            if hasattr(self.helius_client, 'get_token_metadata_async'):
-                metadata_res = await self.helius_client.get_token_metadata_async([mint])
-            else:
-                # Mock implementation if method doesn't exist
-                # In real implementation, we would use a synchronous alternative
-                metadata_res = {"result": [None]}
-                
-            metadata = metadata_res.get("result", [None])[0]
+        if not hasattr(self.helius_client, 'get_token_metadata_async'):
+            # No metadata endpoint available, so treat these tokens as having no metadata
+            for mint in missing:
+                self.token_metadata_cache[mint] = None
+            return
             
-            # Criteria for suspicious: No metadata, no symbol, no name, etc.
-            if not metadata or (not metadata.get('name') and not metadata.get('symbol')):
-                is_suspicious = True
-            else:
-                is_suspicious = False
+        batch_size = self._METADATA_BATCH_SIZE
+        batches = [missing[i:i + batch_size] for i in range(0, len(missing), batch_size)]
+        limiter = self._get_rate_limiter()
+        
+        async def fetch_batch(batch: List[str]) -> Dict:
+            async with limiter:
+                return await self.helius_client.get_token_metadata_async(batch)
+        
+        responses = await asyncio.gather(
+            *(fetch_batch(batch) for batch in batches),
+            return_exceptions=True
+        )
+        
+        for batch, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                # Leave these mints uncached; lookups treat them as not suspicious
+                logging.debug(f"Failed to get metadata for {len(batch)} mints: {response}")
+                continue
                 
-            self.token_metadata_cache[mint] = is_suspicious
-            await asyncio.sleep(0.05)  # Rate limit metadata calls
-            return is_suspicious
+            metadata_list = response.get("result") or []
+            for i, mint in enumerate(batch):
+                self.token_metadata_cache[mint] = metadata_list[i] if i < len(metadata_list) else None
+    
+    def _check_token_suspicious(self, mint: str) -> bool:
+        """Check if a token is suspicious based on its prefetched metadata."""
+        if mint not in self.token_metadata_cache:
+            return False  # Metadata lookup failed; assume not suspicious
             
-        except Exception as e:
-            logging.debug(f"Failed to get metadata for mint {mint}: {e}")
-            self.token_metadata_cache[mint] = False  # Assume not suspicious on error
-            return False
+        metadata = self.token_metadata_cache[mint]
+        
+        # Criteria for suspicious: No metadata, no symbol, no name, etc.
+        return not metadata or (not metadata.get('name') and not metadata.get('symbol'))
     
-    async def _get_token_symbol(self, mint: str) -> str:
-        """Get token symbol from metadata if available."""
-        try:
-            if hasattr(self.helius_client, 'get_token_metadata_async'):
-                metadata_res = await self.helius_client.get_token_metadata_async([mint])
-                metadata = metadata_res.get("result", [None])[0]
-                if metadata and metadata.get('symbol'):
-                    return metadata.get('symbol')
-            return mint[:6]  # Return first 6 chars of mint address as fallback
-        except:
-            return mint[:6]
+    def _get_token_symbol(self, mint: str) -> str:
+        """Get token symbol from prefetched metadata if available."""
+        metadata = self.token_metadata_cache.get(mint)
+        if metadata and metadata.get('symbol'):
+            return metadata.get('symbol')
+        return mint[:6]  # Return first 6 chars of mint address as fallback
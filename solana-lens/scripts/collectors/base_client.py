@@ -0,0 +1,334 @@
+import asyncio
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode()
+
+from .connection_pool import get_connector
+from .rate_limiter import AsyncRateLimiter
+from .ttl_cache import TTLCache
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:  # aiohttp is optional; async methods fall back to worker threads
+    aiohttp = None
+
+
+class BaseApiClient:
+    """
+    HTTP transport shared by the REST API clients.
+
+    Provides pooled sync (requests) and async (aiohttp) sessions, a per-event-loop token
+    bucket, retries of rate-limited and transient failures, and a TTL cache for idempotent
+    GETs. Subclasses supply the base URL, headers and fixed endpoints, and add the
+    endpoint methods.
+    """
+
+    # Statuses worth retrying, and how many times the async methods retry them
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    MAX_RETRIES = 4
+
+    # Endpoints with a fixed path, whose URLs are built once per client
+    _ENDPOINTS: Tuple[str, ...] = ()
+
+    # (connect, read) timeout in seconds for the synchronous requests
+    REQUEST_TIMEOUT = (5, 30)
+
+    # Methods the default requests session may retry; only idempotent ones unless a subclass
+    # knows its POSTs are safe to repeat
+    RETRY_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+
+    # Keep-alive pools of the default requests session, and cached GET responses kept
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 64
+    CACHE_SIZE = 10000
+
+    def __init__(self, base_url: str, headers: Dict[str, str], session: Optional[requests.Session] = None,
+                 requests_per_second: float = 20, shared_pool: bool = False):
+        """
+        Initialize the transport.
+
+        Args:
+            base_url (str): Base URL for the API
+            headers (Dict[str, str]): Headers sent with every request
+            session (requests.Session, optional): Session to reuse connections from.
+                A new session is created if not provided.
+            requests_per_second (float, optional): Request budget for the async methods.
+                Defaults to 20.
+            shared_pool (bool, optional): Open async connections from the connector shared by
+                all API clients (see connection_pool) instead of a private pool. Defaults to False.
+        """
+        self.base_url = base_url
+        self._urls = {endpoint: f"{base_url}/{endpoint}" for endpoint in self._ENDPOINTS}
+        # Pre-parsed URLs for aiohttp, so fixed endpoints are not re-parsed on every request
+        self._parsed_urls = (
+            {endpoint: yarl.URL(url) for endpoint, url in self._urls.items()} if aiohttp is not None else {}
+        )
+        self.headers = headers
+        if session is None:
+            # Pooled keep-alive connections, retrying rate-limited and transient failures
+            session = requests.Session()
+            retry = Retry(total=3, backoff_factor=0.5, status_forcelist=sorted(self.RETRY_STATUSES),
+                          allowed_methods=self.RETRY_METHODS, raise_on_status=False)
+            session.mount("https://", HTTPAdapter(pool_connections=self.POOL_CONNECTIONS,
+                                                  pool_maxsize=self.POOL_MAXSIZE, max_retries=retry))
+        self.session = session
+        # Pooled aiohttp session for the *_async methods, created on first use per event loop
+        self._async_session = None
+        self._async_session_loop = None
+        # Token bucket pacing the async methods, created per event loop like the session
+        self.requests_per_second = requests_per_second
+        self.shared_pool = shared_pool
+        self._rate_limiter = None
+        self._rate_limiter_loop = None
+        # Responses of idempotent GETs, shared by the sync and async methods
+        self._cache = TTLCache(maxsize=self.CACHE_SIZE)
+
+    @staticmethod
+    def _request_error(e: requests.exceptions.RequestException) -> Tuple[Exception, Optional[int]]:
+        """Return the exception to raise for a failed sync request, and the HTTP status if there was one."""
+        error_msg = f"API request failed: {str(e)}"
+        status = None
+        if hasattr(e, 'response') and e.response is not None:
+            # Report the body as received instead of parsing and re-serializing it
+            details = e.response.text
+            error_msg += f". Details: {details}" if details else f". Status code: {e.response.status_code}"
+            status = e.response.status_code
+        return Exception(error_msg), status
+
+    def _send(self, method: str, url: str, params: Optional[Dict] = None, data: Optional[Dict] = None) -> Any:
+        """
+        Send one sync request and decode the response.
+
+        Raises:
+            ValueError: If method is not GET or POST
+            requests.exceptions.RequestException: If the request fails
+        """
+        if method == "GET":
+            response = self.session.get(url, headers=self.headers, params=params, timeout=self.REQUEST_TIMEOUT)
+        elif method == "POST":
+            response = self.session.post(url, headers=self.headers, params=params,
+                                         data=_json_dumps(data) if data is not None else None,
+                                         timeout=self.REQUEST_TIMEOUT)
+        else:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def _make_request(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None,
+                     data: Optional[Dict] = None) -> Dict:
+        """
+        Make a request to the API.
+
+        Args:
+            endpoint (str): API endpoint to call
+            method (str, optional): HTTP method. Defaults to "GET".
+            params (Dict, optional): Query parameters. Defaults to None.
+            data (Dict, optional): Request body. Defaults to None.
+
+        Returns:
+            Dict: Response from the API
+
+        Raises:
+            Exception: If the API request fails
+        """
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
+        try:
+            return self._send(method, url, params, data)
+        except requests.exceptions.RequestException as e:
+            raise self._request_error(e)[0]
+
+    async def _ensure_session(self) -> "aiohttp.ClientSession":
+        """
+        Return the aiohttp session for the running event loop, creating it if needed.
+
+        Returns:
+            aiohttp.ClientSession: Session with a keep-alive connection pool
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_session is None or self._async_session.closed or self._async_session_loop is not loop:
+            timeout = self._async_timeout()
+            options = {"timeout": timeout} if timeout is not None else {}
+            self._async_session = aiohttp.ClientSession(
+                connector=get_connector(self.shared_pool),
+                connector_owner=not self.shared_pool,
+                **options
+            )
+            self._async_session_loop = loop
+        return self._async_session
+
+    def _async_timeout(self) -> Optional["aiohttp.ClientTimeout"]:
+        """Return the timeout for the aiohttp session, or None for aiohttp's default."""
+        return None
+
+    def _get_rate_limiter(self) -> AsyncRateLimiter:
+        """Return the token bucket shared by the async methods, creating one per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._rate_limiter_loop is not loop:
+            self._rate_limiter = AsyncRateLimiter(self.requests_per_second)
+            self._rate_limiter_loop = loop
+        return self._rate_limiter
+
+    async def warm_up(self, connections: int = 8) -> None:
+        """
+        Open pooled keep-alive connections ahead of a burst of async requests.
+
+        Each connection pays its TCP/TLS handshake here instead of on the first real request.
+        Failures are ignored; the requests that follow simply open their own connections.
+
+        Args:
+            connections (int, optional): Number of connections to open. Defaults to 8.
+        """
+        if aiohttp is None:
+            return
+        session = await self._ensure_session()
+        timeout = aiohttp.ClientTimeout(total=2)
+
+        async def open_connection() -> None:
+            async with session.head(self.base_url, timeout=timeout) as response:
+                await response.read()
+
+        await asyncio.gather(*(open_connection() for _ in range(connections)), return_exceptions=True)
+
+    async def _send_async(self, session: "aiohttp.ClientSession", limiter: AsyncRateLimiter, method: str,
+                          url: Any, params: Optional[Dict], body: Optional[bytes]) -> Tuple[int, Any]:
+        """
+        Send one async request, retrying rate-limited and transient server errors.
+
+        Each attempt is paced by limiter; retries back off exponentially, honoring Retry-After.
+
+        Returns:
+            Tuple[int, Any]: The final status, with the decoded body on success or the raw
+                error body otherwise
+
+        Raises:
+            aiohttp.ClientError: If the connection fails
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            await limiter.acquire()
+            async with session.request(method, url, headers=self.headers, params=params, data=body) as response:
+                if response.status in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                    retry_after = response.headers.get("Retry-After", "")
+                    delay = float(retry_after) if retry_after.isdigit() else 0.5 * 2 ** attempt
+                    await asyncio.sleep(delay)
+                    continue
+                if response.status >= 400:
+                    return response.status, await response.text()
+                if response.headers.get("X-RateLimit-Remaining") == "0":
+                    limiter.drain()
+                return response.status, _json_loads(await response.read())
+
+    async def _make_request_async(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None,
+                                  data: Optional[Dict] = None) -> Dict:
+        """
+        Async version of _make_request using a pooled aiohttp session.
+
+        Requests are paced by the shared token bucket. Rate-limited (429) and transient
+        server errors are retried with exponential backoff, honoring Retry-After.
+
+        Args:
+            endpoint (str): API endpoint to call
+            method (str, optional): HTTP method. Defaults to "GET".
+            params (Dict, optional): Query parameters. Defaults to None.
+            data (Dict, optional): Request body. Defaults to None.
+
+        Returns:
+            Dict: Response from the API
+
+        Raises:
+            Exception: If the API request fails
+        """
+        if aiohttp is None:
+            await self._get_rate_limiter().acquire()
+            return await asyncio.to_thread(self._make_request, endpoint, method, params, data)
+
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        url = self._parsed_urls.get(endpoint) or f"{self.base_url}/{endpoint}"
+        body = _json_dumps(data) if method == "POST" and data is not None else None
+        session = await self._ensure_session()
+        try:
+            status, payload = await self._send_async(session, self._get_rate_limiter(), method, url, params, body)
+        except aiohttp.ClientError as e:
+            raise Exception(f"API request failed: {str(e)}")
+        if status >= 400:
+            raise Exception(f"API request failed: status code {status}. Details: {payload}")
+        return payload
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict]) -> Tuple[str, Optional[frozenset]]:
+        return (endpoint, frozenset(params.items()) if params else None)
+
+    def _cached_request(self, endpoint: str, params: Optional[Dict] = None, ttl: float = 600) -> Dict:
+        """
+        GET an endpoint, reusing a cached response for identical requests made within ttl seconds.
+
+        Args:
+            endpoint (str): API endpoint to call
+            params (Dict, optional): Query parameters. Defaults to None.
+            ttl (float, optional): Seconds to keep the response. Defaults to 600.
+
+        Returns:
+            Dict: Response from the API
+        """
+        key = self._cache_key(endpoint, params)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._make_request(endpoint, params=params)
+            self._cache.set(key, result, ttl)
+        return result
+
+    async def _get_async(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """GET an endpoint for _cached_request_async on a cache miss."""
+        return await self._make_request_async(endpoint, params=params)
+
+    async def _cached_request_async(self, endpoint: str, params: Optional[Dict] = None, ttl: float = 600) -> Dict:
+        """
+        Async version of _cached_request; shares the same cache.
+
+        Args:
+            endpoint (str): API endpoint to call
+            params (Dict, optional): Query parameters. Defaults to None.
+            ttl (float, optional): Seconds to keep the response. Defaults to 600.
+
+        Returns:
+            Dict: Response from the API
+        """
+        key = self._cache_key(endpoint, params)
+        result = self._cache.get(key)
+        if result is None:
+            result = await self._get_async(endpoint, params=params)
+            self._cache.set(key, result, ttl)
+        return result
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    async def close_async_session(self) -> None:
+        """
+        Close the aiohttp session used by the async methods, leaving the HTTP session open.
+
+        Call it on the event loop the async methods ran on before that loop ends, e.g. when
+        a sync wrapper drives them with asyncio.run.
+        """
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self._async_session_loop = None
+
+    async def close_async(self) -> None:
+        """Close both the aiohttp session used by the async methods and the HTTP session."""
+        await self.close_async_session()
+        self.session.close()
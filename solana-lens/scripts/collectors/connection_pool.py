@@ -0,0 +1,51 @@
+import asyncio
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional; async methods fall back to worker threads
+    aiohttp = None
+
+# Keep-alive pool limits for the API clients' aiohttp sessions: a client's own pool, and the
+# pool shared by every client when they opt in (about two clients' worth of connections)
+CONNECTION_LIMIT = 128
+SHARED_CONNECTION_LIMIT = 256
+CONNECTION_LIMIT_PER_HOST = 64
+
+_shared_connector = None
+_shared_connector_loop = None
+
+
+def _new_connector(limit: int) -> "aiohttp.TCPConnector":
+    return aiohttp.TCPConnector(limit=limit, limit_per_host=CONNECTION_LIMIT_PER_HOST,
+                                ttl_dns_cache=300, keepalive_timeout=60, enable_cleanup_closed=True)
+
+
+def get_connector(shared: bool = False) -> "aiohttp.TCPConnector":
+    """
+    Return a TCP connector for an API client's aiohttp session.
+
+    Args:
+        shared: Return the connector shared by every client on the running event loop
+            (one pool, one DNS cache and one global connection limit) instead of a new one.
+            Sessions using it must pass connector_owner=False.
+
+    Returns:
+        aiohttp.TCPConnector: Keep-alive connection pool
+    """
+    global _shared_connector, _shared_connector_loop
+    if not shared:
+        return _new_connector(CONNECTION_LIMIT)
+    loop = asyncio.get_running_loop()
+    if _shared_connector is None or _shared_connector.closed or _shared_connector_loop is not loop:
+        _shared_connector = _new_connector(SHARED_CONNECTION_LIMIT)
+        _shared_connector_loop = loop
+    return _shared_connector
+
+
+async def close_shared_connector() -> None:
+    """Close the shared connector, after the clients using it have closed their sessions."""
+    global _shared_connector, _shared_connector_loop
+    if _shared_connector is not None and not _shared_connector.closed:
+        await _shared_connector.close()
+    _shared_connector = None
+    _shared_connector_loop = None
@@ -1,8 +1,11 @@
+import asyncio
 import requests
 import json
-from typing import Dict, List, Any, Optional, Union
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, Union
 
-class HeliusClient:
+from .base_client import BaseApiClient, _json_dumps, _json_loads, aiohttp
+
+class HeliusClient(BaseApiClient):
     """
     Client for interacting with the Helius API for Solana blockchain data.
     
@@ -10,18 +13,80 @@ class HeliusClient:
     and other Solana blockchain data.
     """
     
-    def __init__(self, api_key: str):
+    # The JSON-RPC methods used here are all reads, so POSTs are safe to retry
+    RETRY_METHODS = frozenset({"POST"})
+    
+    # Keep-alive pools of the default requests session
+    POOL_CONNECTIONS = 32
+    
+    # Method -> encoded '{"jsonrpc":"2.0","method":...,"params":' prefix, filled on first use
+    _rpc_prefixes = {}
+    
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None,
+                 requests_per_second: float = 10, shared_pool: bool = False):
         """
         Initialize the Helius API client.
         
         Args:
             api_key (str): API key for authentication
+            session (requests.Session, optional): Session to reuse connections from.
+                A new session is created if not provided.
+            requests_per_second (float, optional): Request budget for the async methods.
+                Defaults to 10.
+            shared_pool (bool, optional): Open async connections from the connector shared by
+                all API clients (see connection_pool) instead of a private pool. Defaults to False.
         """
         self.api_key = api_key
-        self.base_url = f"https://mainnet.helius-rpc.com/?api-key={self.api_key}"
-        self.headers = {
-            "Content-Type": "application/json"
-        }
+        # JSON-RPC requests all go to the endpoint URL itself, which carries the API key
+        super().__init__(f"https://mainnet.helius-rpc.com/?api-key={self.api_key}", headers={
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate"
+        }, session=session, requests_per_second=requests_per_second, shared_pool=shared_pool)
+        self.ws_url = f"wss://mainnet.helius-rpc.com/?api-key={self.api_key}"
+    
+    @classmethod
+    def _rpc_prefix(cls, method: str) -> bytes:
+        """Return the pre-encoded JSON-RPC envelope for a method, up to its params value."""
+        prefix = cls._rpc_prefixes.get(method)
+        if prefix is None:
+            prefix = b'{"jsonrpc":"2.0","method":' + _json_dumps(method) + b',"params":'
+            cls._rpc_prefixes[method] = prefix
+        return prefix
+    
+    def _encode_request(self, method: str, params: List[Any]) -> bytes:
+        """Encode a single JSON-RPC request, reusing the method's cached envelope."""
+        return self._rpc_prefix(method) + _json_dumps(params) + b',"id":1}'
+    
+    def _encode_batch_request(self, method: str, params_list: List[List[Any]]) -> bytes:
+        """Encode a JSON-RPC batch of calls to one method, numbering the ids from 0."""
+        prefix = self._rpc_prefix(method)
+        return b'[' + b','.join(
+            prefix + _json_dumps(params) + b',"id":' + str(i).encode() + b'}'
+            for i, params in enumerate(params_list)
+        ) + b']'
+    
+    def _post(self, body: bytes) -> Any:
+        """
+        POST an encoded JSON-RPC request with the pooled requests session.
+        
+        Args:
+            body (bytes): Encoded single request object or batch array
+            
+        Returns:
+            Any: Decoded JSON response
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        try:
+            response = self.session.post(self.base_url, headers=self.headers, data=body, timeout=self.REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise self._request_error(e)[0]
+        result = _json_loads(response.content)
+        if isinstance(result, dict) and "error" in result:
+            raise Exception(f"API error: {json.dumps(result['error'])}")
+        return result
     
     def _make_request(self, method: str, params: List[Any]) -> Dict:
         """
@@ -37,31 +102,98 @@ class HeliusClient:
         Raises:
             Exception: If the API request fails
         """
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": method,
-            "params": params
-        }
+        return self._post(self._encode_request(method, params))
+    
+    def _make_batch_request(self, method: str, params_list: List[List[Any]]) -> List[Dict]:
+        """
+        Make several calls to the same RPC method in one JSON-RPC batch request.
         
+        Args:
+            method (str): The RPC method to call
+            params_list (List[List[Any]]): Parameters for each call
+            
+        Returns:
+            List[Dict]: One response per call, in the order of params_list. Calls that
+                failed individually keep their "error" entry instead of raising.
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        result = self._post(self._encode_batch_request(method, params_list))
+        # Batch responses may arrive in any order, so match them back up by id
+        responses_by_id = {item.get("id"): item for item in result}
+        return [responses_by_id.get(i, {}) for i in range(len(params_list))]
+    
+    def _async_timeout(self) -> "aiohttp.ClientTimeout":
+        """Bound connecting and each socket read like the sync requests, without a total limit."""
+        connect_timeout, read_timeout = self.REQUEST_TIMEOUT
+        return aiohttp.ClientTimeout(total=None, sock_connect=connect_timeout, sock_read=read_timeout)
+    
+    async def _post_async(self, body: bytes) -> Any:
+        """
+        POST an encoded JSON-RPC request with the pooled aiohttp session.
+        
+        Requests are paced by the shared token bucket. Rate-limited (429) and transient
+        server errors are retried with exponential backoff, honoring Retry-After.
+        
+        Args:
+            body (bytes): Encoded single request object or batch array
+            
+        Returns:
+            Any: Decoded JSON response
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        session = await self._ensure_session()
         try:
-            response = requests.post(self.base_url, headers=self.headers, json=payload)
-            response.raise_for_status()
-            result = response.json()
+            status, result = await self._send_async(session, self._get_rate_limiter(), "POST", self.base_url,
+                                                    None, body)
+        except aiohttp.ClientError as e:
+            raise Exception(f"API request failed: {str(e)}")
+        if status >= 400:
+            raise Exception(f"API request failed: status code {status}. Details: {result}")
+        if isinstance(result, dict) and "error" in result:
+            raise Exception(f"API error: {json.dumps(result['error'])}")
+        return result
+    
+    async def _make_request_async(self, method: str, params: List[Any]) -> Dict:
+        """
+        Async version of _make_request using a pooled aiohttp session.
+        
+        Args:
+            method (str): The RPC method to call
+            params (List[Any]): Parameters for the RPC method
             
-            if "error" in result:
-                raise Exception(f"API error: {json.dumps(result['error'])}")
-                
-            return result
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg += f". Details: {json.dumps(error_data)}"
-                except:
-                    error_msg += f". Status code: {e.response.status_code}"
-            raise Exception(error_msg)
+        Returns:
+            Dict: Response from the API
+        """
+        if aiohttp is None:
+            await self._get_rate_limiter().acquire()
+            return await asyncio.to_thread(self._make_request, method, params)
+        
+        body = self._encode_request(method, params)
+        return await self._post_async(body)
+    
+    async def _make_batch_request_async(self, method: str, params_list: List[List[Any]]) -> List[Dict]:
+        """
+        Async version of _make_batch_request using a pooled aiohttp session.
+        
+        Args:
+            method (str): The RPC method to call
+            params_list (List[List[Any]]): Parameters for each call
+            
+        Returns:
+            List[Dict]: One response per call, in the order of params_list
+        """
+        if aiohttp is None:
+            await self._get_rate_limiter().acquire()
+            return await asyncio.to_thread(self._make_batch_request, method, params_list)
+        
+        body = self._encode_batch_request(method, params_list)
+        result = await self._post_async(body)
+        responses_by_id = {item.get("id"): item for item in result}
+        return [responses_by_id.get(i, {}) for i in range(len(params_list))]
     
     # Account & Balance Endpoints
     
@@ -142,20 +274,227 @@ class HeliusClient:
         ]
         return self._make_request("getTransaction", params)
     
-    def get_signatures_for_address(self, address: str, limit: int = 100) -> Dict:
+    async def get_transaction_async(self, signature: str, encoding: str = "jsonParsed") -> Dict:
+        """
+        Async version of get_transaction.
+        
+        Args:
+            signature (str): Transaction signature
+            encoding (str, optional): Response encoding. Defaults to "jsonParsed".
+            
+        Returns:
+            Dict: Transaction details
+        """
+        params = [
+            signature, 
+            {"encoding": encoding, "maxSupportedTransactionVersion": 0}
+        ]
+        return await self._make_request_async("getTransaction", params)
+    
+    def get_transactions_batch(self, signatures: List[str], encoding: str = "jsonParsed", chunk_size: int = 100) -> List[Dict]:
+        """
+        Get details for many transactions using batched JSON-RPC requests.
+        
+        Args:
+            signatures (List[str]): Transaction signatures
+            encoding (str, optional): Response encoding. Defaults to "jsonParsed".
+            chunk_size (int, optional): Calls per HTTP request. Defaults to 100.
+            
+        Returns:
+            List[Dict]: Transaction details, one response per signature in input order
+        """
+        options = {"encoding": encoding, "maxSupportedTransactionVersion": 0}
+        responses = []
+        for i in range(0, len(signatures), chunk_size):
+            chunk = signatures[i:i + chunk_size]
+            responses.extend(self._make_batch_request("getTransaction", [[sig, options] for sig in chunk]))
+        return responses
+    
+    async def get_transactions_batch_async(self, signatures: List[str], encoding: str = "jsonParsed", chunk_size: int = 100) -> List[Dict]:
+        """
+        Async version of get_transactions_batch. Chunks are sent concurrently.
+        
+        Args:
+            signatures (List[str]): Transaction signatures
+            encoding (str, optional): Response encoding. Defaults to "jsonParsed".
+            chunk_size (int, optional): Calls per HTTP request. Defaults to 100.
+            
+        Returns:
+            List[Dict]: Transaction details, one response per signature in input order
+        """
+        options = {"encoding": encoding, "maxSupportedTransactionVersion": 0}
+        chunk_responses = await asyncio.gather(*(
+            self._make_batch_request_async("getTransaction", [[sig, options] for sig in signatures[i:i + chunk_size]])
+            for i in range(0, len(signatures), chunk_size)
+        ))
+        return [response for chunk in chunk_responses for response in chunk]
+    
+    def get_signatures_for_address(self, address: str, limit: int = 100, before: Optional[str] = None) -> Dict:
         """
         Get signatures for transactions involving an address.
         
         Args:
             address (str): The account address
             limit (int, optional): Maximum number of signatures. Defaults to 100.
+            before (str, optional): Start searching backwards from this signature. Defaults to None.
             
         Returns:
             Dict: List of transaction signatures
         """
-        params = [address, {"limit": limit}]
+        options = {"limit": limit}
+        if before:
+            options["before"] = before
+        params = [address, options]
         return self._make_request("getSignaturesForAddress", params)
     
+    async def get_signatures_for_address_async(self, address: str, limit: int = 100, before: Optional[str] = None) -> Dict:
+        """
+        Async version of get_signatures_for_address.
+        
+        Args:
+            address (str): The account address
+            limit (int, optional): Maximum number of signatures. Defaults to 100.
+            before (str, optional): Start searching backwards from this signature. Defaults to None.
+            
+        Returns:
+            Dict: List of transaction signatures
+        """
+        options = {"limit": limit}
+        if before:
+            options["before"] = before
+        params = [address, options]
+        return await self._make_request_async("getSignaturesForAddress", params)
+    
+    def get_signatures_for_addresses_batch(self, addresses: List[str], limit: int = 100, chunk_size: int = 100) -> List[Dict]:
+        """
+        Get the most recent signatures of many addresses using batched JSON-RPC requests.
+        
+        Args:
+            addresses (List[str]): The account addresses
+            limit (int, optional): Maximum number of signatures per address. Defaults to 100.
+            chunk_size (int, optional): Calls per HTTP request. Defaults to 100.
+            
+        Returns:
+            List[Dict]: One getSignaturesForAddress response per address in input order
+        """
+        responses = []
+        for i in range(0, len(addresses), chunk_size):
+            chunk = addresses[i:i + chunk_size]
+            responses.extend(self._make_batch_request("getSignaturesForAddress",
+                                                      [[address, {"limit": limit}] for address in chunk]))
+        return responses
+    
+    async def get_signatures_for_addresses_batch_async(self, addresses: List[str], limit: int = 100,
+                                                       chunk_size: int = 100) -> List[Dict]:
+        """
+        Async version of get_signatures_for_addresses_batch. Chunks are sent concurrently.
+        
+        Args:
+            addresses (List[str]): The account addresses
+            limit (int, optional): Maximum number of signatures per address. Defaults to 100.
+            chunk_size (int, optional): Calls per HTTP request. Defaults to 100.
+            
+        Returns:
+            List[Dict]: One getSignaturesForAddress response per address in input order
+        """
+        chunk_responses = await asyncio.gather(*(
+            self._make_batch_request_async("getSignaturesForAddress",
+                                           [[address, {"limit": limit}] for address in addresses[i:i + chunk_size]])
+            for i in range(0, len(addresses), chunk_size)
+        ))
+        return [response for chunk in chunk_responses for response in chunk]
+    
+    # Block Endpoints
+    
+    def get_block(self, slot: int, encoding: str = "jsonParsed") -> Dict:
+        """
+        Get a confirmed block with full transaction details.
+        
+        Args:
+            slot (int): Block slot number
+            encoding (str, optional): Response encoding. Defaults to "jsonParsed".
+            
+        Returns:
+            Dict: Block details
+        """
+        params = [
+            slot,
+            {"encoding": encoding, "maxSupportedTransactionVersion": 0,
+             "transactionDetails": "full", "rewards": False}
+        ]
+        return self._make_request("getBlock", params)
+    
+    async def get_block_async(self, slot: int, encoding: str = "jsonParsed") -> Dict:
+        """
+        Async version of get_block.
+        
+        Args:
+            slot (int): Block slot number
+            encoding (str, optional): Response encoding. Defaults to "jsonParsed".
+            
+        Returns:
+            Dict: Block details
+        """
+        params = [
+            slot,
+            {"encoding": encoding, "maxSupportedTransactionVersion": 0,
+             "transactionDetails": "full", "rewards": False}
+        ]
+        return await self._make_request_async("getBlock", params)
+    
+    # Subscription Endpoints
+    
+    async def logs_subscribe(self, mentions: List[str],
+                             commitment: str = "confirmed") -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Stream transactions mentioning any of the given addresses over one websocket.
+        
+        Opens a logsSubscribe subscription per address and yields notifications as they
+        arrive. The stream ends when the connection closes.
+        
+        Args:
+            mentions (List[str]): Addresses (e.g. program IDs) to watch
+            commitment (str, optional): Commitment level. Defaults to "confirmed".
+            
+        Yields:
+            Tuple[str, Dict]: The watched address, and the notification value
+                (signature, err, logs) with the notification's slot added
+            
+        Raises:
+            Exception: If aiohttp is not installed or a subscription is rejected
+        """
+        if aiohttp is None:
+            raise Exception("aiohttp is required for websocket subscriptions")
+        
+        session = await self._ensure_session()
+        async with session.ws_connect(self.ws_url, heartbeat=30) as ws:
+            for i, address in enumerate(mentions):
+                await ws.send_str(_json_dumps({
+                    "jsonrpc": "2.0", "id": i, "method": "logsSubscribe",
+                    "params": [{"mentions": [address]}, {"commitment": commitment}]
+                }).decode())
+            
+            subscriptions = {}  # subscription id -> watched address
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    if msg.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                        break
+                    continue
+                message = _json_loads(msg.data)
+                if "error" in message:
+                    raise Exception(f"API error: {json.dumps(message['error'])}")
+                if "id" in message:
+                    subscriptions[message["result"]] = mentions[message["id"]]
+                    continue
+                params = message.get("params", {})
+                address = subscriptions.get(params.get("subscription"))
+                if address is None:
+                    continue
+                result = params.get("result", {})
+                value = result.get("value", {})
+                value["slot"] = result.get("context", {}).get("slot")
+                yield address, value
+    
     def simulate_transaction(self, serialized_tx: str) -> Dict:
         """
         Simulate executing a transaction.
@@ -1,16 +1,31 @@
+import os
 import time
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Set
+import pandas as pd
+from typing import Dict, List, Any, Optional, Set, Tuple
+from collections import OrderedDict
 from datetime import datetime
 
+from .tx_cache import TransactionCache
+
 class MixerCollector:
     """
     Collector for data related to mixer services and money laundering patterns on Solana.
     Responsible for identifying mixers, collecting transaction data, and analyzing interactions.
     """
     
-    def __init__(self, helius_client=None, range_client=None, vybe_client=None):
+    # Signatures per JSON-RPC batch request when fetching transaction details
+    TX_BATCH_SIZE = 100
+    
+    # Detail-fetching workers per address; the shared semaphore still caps requests overall
+    DETAIL_WORKERS = 8
+    
+    # Upper bound on transaction details remembered across fetches, shared by all mixers
+    _TX_RESULTS_CACHE_SIZE = 10000
+    
+    def __init__(self, helius_client=None, range_client=None, vybe_client=None, max_concurrency: int = 32,
+                 tx_cache_path: Optional[str] = None):
         """
         Initialize the MixerCollector.
         
@@ -18,11 +33,35 @@ class MixerCollector:
             helius_client: Helius API client instance for fetching transaction data
             range_client: Range API client for risk assessment
             vybe_client: Vybe API client for analytics data
+            max_concurrency: Cap on in-flight transaction detail requests across all mixers
+            tx_cache_path: SQLite file caching finalized transaction details across runs.
+                Defaults to $HELIUS_TX_CACHE or .cache/helius_tx.sqlite3; an empty string disables it.
         """
         self.helius_client = helius_client
         self.range_client = range_client
         self.vybe_client = vybe_client
         
+        # Detect the Helius client's capabilities once instead of per page / per signature
+        self._has_async_sigs = hasattr(helius_client, 'get_signatures_for_address_async')
+        self._has_async_tx = hasattr(helius_client, 'get_transaction_async')
+        self._has_batch = hasattr(helius_client, 'get_transactions_batch')
+        self._has_async_batch = hasattr(helius_client, 'get_transactions_batch_async')
+        self._has_warm_up = hasattr(helius_client, 'warm_up')
+        
+        self.max_concurrency = max_concurrency
+        self._tx_semaphore = None
+        self._tx_semaphore_loop = None
+        
+        if tx_cache_path is None:
+            tx_cache_path = os.getenv("HELIUS_TX_CACHE", os.path.join(".cache", "helius_tx.sqlite3"))
+        self._tx_cache = TransactionCache(tx_cache_path) if tx_cache_path else None
+        
+        # Signatures seen by one mixer's fetch are not fetched again for another
+        self._tx_results = OrderedDict()  # signature -> transaction details, LRU order
+        self._tx_pending = {}  # signature -> future resolved by the fetch that owns it
+        
+        self._network_builder = None  # Created on first use; see _get_network_builder
+        
         # Known mixer service addresses
         self.known_mixers = {
             "tor1xzb2Zyy1cUxXmyJfR8aNXuWnwHG8AwgaG7UGD4K": "Tornado Cash Router (Wormhole)",
@@ -30,6 +69,8 @@ class MixerCollector:
             "CJsLwbP1iu5DuUikHEJnLfANgKy6stB2uFgvBBHoyxwz": "Cyclos Mixer",
             # More mixers can be added here
         }
+        # Frozen view of the mixer addresses for membership tests in the transfer loops
+        self._mixer_keys = frozenset(self.known_mixers)
         
         # Known exchange addresses to filter out from potential mixer users
         self.known_exchanges = set([
@@ -37,13 +78,62 @@ class MixerCollector:
             "CEXaddr1111111111111111111111111111111111111",
             "CEXaddr2222222222222222222222222222222222222",
         ])
+        # Addresses never reported as mixer users; refreshed whenever known_exchanges is reloaded
+        self._excluded_addresses = self._mixer_keys | frozenset(self.known_exchanges)
         
         logging.info(f"MixerCollector initialized with {len(self.known_mixers)} known mixer services")
     
+    def _get_tx_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore capping transaction detail requests, creating one per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._tx_semaphore_loop is not loop:
+            self._tx_semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._tx_semaphore_loop = loop
+        return self._tx_semaphore
+    
+    def _get_network_builder(self):
+        """Return the NetworkBuilder used to extract transfers, creating it on first use."""
+        if self._network_builder is None:
+            from scripts.analysis.network_builder import NetworkBuilder
+            self._network_builder = NetworkBuilder(helius_client=self.helius_client)
+        return self._network_builder
+    
+    async def _get_transaction(self, signature: str) -> Dict:
+        """Fetch one transaction's details while holding a concurrency slot."""
+        async with self._get_tx_semaphore():
+            return await self.helius_client.get_transaction_async(signature)
+    
+    async def _get_transactions_batch(self, signatures: List[str]) -> List[Dict]:
+        """Fetch a chunk of transactions in one batched request while holding a concurrency slot."""
+        async with self._get_tx_semaphore():
+            if self._has_async_batch:
+                return await self.helius_client.get_transactions_batch_async(signatures)
+            return await asyncio.to_thread(self.helius_client.get_transactions_batch, signatures)
+    
+    async def _fetch_transaction_unit(self, signatures: List[str]) -> List[Dict]:
+        """Fetch one unit of work (a batch, or a single signature) using the best available client method."""
+        if self._has_batch:
+            return await self._get_transactions_batch(signatures)
+        if self._has_async_tx:
+            return [await self._get_transaction(signatures[0])]
+        # Fallback to the sync method in a worker thread so requests still overlap
+        async with self._get_tx_semaphore():
+            return [await asyncio.to_thread(self.helius_client.get_transaction, signatures[0])]
+    
+    def _remember_tx(self, signature: str, tx: Dict) -> None:
+        """Keep fetched transaction details for other fetches, evicting the least recently used."""
+        self._tx_results[signature] = tx
+        self._tx_results.move_to_end(signature)
+        if len(self._tx_results) > self._TX_RESULTS_CACHE_SIZE:
+            self._tx_results.popitem(last=False)
+    
     async def fetch_transactions_paginated(self, address: str, limit_total: int = 1000) -> List[Dict]:
         """
         Fetch transactions with pagination support for a specific address.
         
+        Signature pages are produced into a queue while workers fetch the details of
+        earlier pages, so listing and detail fetching overlap.
+        
         Args:
             address: Address to fetch transactions for
             limit_total: Maximum number of transactions to fetch
@@ -53,67 +143,123 @@ class MixerCollector:
         """
         if not self.helius_client:
             raise ValueError("HeliusClient is required for transaction fetching")
-            
-        all_signatures = []
-        last_signature = None
-        pages = 0
-        max_pages = (limit_total // 100) + 1  # Helius limit is usually 100 per page
         
-        logging.debug(f"Fetching up to {limit_total} signatures for {address}...")
-        while len(all_signatures) < limit_total and pages < max_pages:
+        sig_infos = {}  # signature -> signature info, in page order
+        fetched_txs = {}  # signature -> transaction details
+        awaiting = {}  # signature -> future of a concurrent fetch already requesting it
+        owned = []  # signatures this call registered in self._tx_pending
+        unit_size = self.TX_BATCH_SIZE if self._has_batch else 1
+        queue = asyncio.Queue(maxsize=2 * self.DETAIL_WORKERS)
+        loop = asyncio.get_running_loop()
+        
+        async def produce() -> None:
+            last_signature = None
+            pages = 0
+            max_pages = (limit_total // 100) + 1  # Helius limit is usually 100 per page
+            
+            logging.debug(f"Fetching up to {limit_total} signatures for {address}...")
             try:
-                options = {"limit": 100}
-                if last_signature:
-                    options["before"] = last_signature
+                while len(sig_infos) < limit_total and pages < max_pages:
+                    try:
+                        options = {"limit": 100}
+                        if last_signature:
+                            options["before"] = last_signature
+                            
+                        # Use the async method if available, otherwise run the sync one in a worker thread
+                        if self._has_async_sigs:
+                            result = await self.helius_client.get_signatures_for_address_async(address, **options)
+                        else:
+                            result = await asyncio.to_thread(self.helius_client.get_signatures_for_address, address, **options)
+                    except Exception as e:
+                        logging.warning(f"Error fetching signatures page {pages+1} for {address}: {e}")
+                        break
+                        
+                    signatures = result.get("result", [])
+                    if not signatures:
+                        break
                     
-                # Use the async method if available, otherwise fallback to sync
-                if hasattr(self.helius_client, 'get_signatures_for_address_async'):
-                    result = await self.helius_client.get_signatures_for_address_async(address, **options)
-                else:
-                    result = self.helius_client.get_signatures_for_address(address, **options)
+                    # Pages can overlap when new transactions land mid-pagination; keep first sightings only
+                    page_signatures = []
+                    for sig_info in signatures:
+                        signature = sig_info['signature']
+                        if signature not in sig_infos:
+                            sig_infos[signature] = sig_info
+                            page_signatures.append(signature)
+                    last_signature = signatures[-1].get("signature")
+                    pages += 1
+                    logging.debug(f"Fetched page {pages}, total signatures: {len(sig_infos)}")
                     
-                signatures = result.get("result", [])
-                if not signatures:
-                    break
+                    # Reuse details already fetched, or being fetched, for another mixer
+                    unresolved = []
+                    for signature in page_signatures:
+                        tx = self._tx_results.get(signature)
+                        if tx is not None:
+                            fetched_txs[signature] = tx
+                        elif signature in self._tx_pending:
+                            awaiting[signature] = self._tx_pending[signature]
+                        else:
+                            unresolved.append(signature)
                     
-                all_signatures.extend(signatures)
-                last_signature = signatures[-1].get("signature")
-                pages += 1
-                logging.debug(f"Fetched page {pages}, total signatures: {len(all_signatures)}")
-                await asyncio.sleep(0.1)  # Rate limit
-                
-            except Exception as e:
-                logging.warning(f"Error fetching signatures page {pages+1} for {address}: {e}")
-                break
-                
-        logging.debug(f"Fetching details for {len(all_signatures)} signatures...")
-        transaction_details = []
-        
-        # Fetch details concurrently
-        tasks = []
-        for sig_info in all_signatures:
-            # Use async method if available
-            if hasattr(self.helius_client, 'get_transaction_async'):
-                tasks.append(self.helius_client.get_transaction_async(sig_info['signature']))
-            else:
-                # Use synchronous method as fallback
+                    # Finalized transactions never change, so reuse any fetched on previous runs
+                    if self._tx_cache and unresolved:
+                        try:
+                            fetched_txs.update(self._tx_cache.get_many(unresolved))
+                        except Exception as e:
+                            logging.warning(f"Failed to read transaction cache: {e}")
+                    missing = [sig for sig in unresolved if sig not in fetched_txs]
+                    for signature in missing:
+                        self._tx_pending[signature] = loop.create_future()
+                    owned.extend(missing)
+                    for i in range(0, len(missing), unit_size):
+                        await queue.put(missing[i:i + unit_size])
+            finally:
+                for _ in range(self.DETAIL_WORKERS):
+                    await queue.put(None)
+        
+        async def consume() -> None:
+            while (unit := await queue.get()) is not None:
                 try:
-                    tx_response = self.helius_client.get_transaction(sig_info['signature'])
-                    if tx_response and tx_response.get("result"):
-                        transaction_details.append(tx_response.get("result"))
-                    await asyncio.sleep(0.1)  # Rate limit for sync requests
+                    responses = await self._fetch_transaction_unit(unit)
                 except Exception as e:
                     logging.warning(f"Failed to fetch transaction detail: {e}")
+                    responses = []
+                
+                cacheable = []
+                for signature, tx_response in zip(unit, responses):
+                    if tx_response and tx_response.get("result"):
+                        tx = tx_response["result"]
+                        fetched_txs[signature] = tx
+                        self._remember_tx(signature, tx)
+                        if TransactionCache.is_cacheable(sig_infos[signature], tx):
+                            cacheable.append((signature, tx))
+                
+                # Hand the results to any concurrent fetch waiting on these signatures
+                for signature in unit:
+                    future = self._tx_pending.pop(signature, None)
+                    if future is not None and not future.done():
+                        future.set_result(fetched_txs.get(signature))
+                
+                if self._tx_cache and cacheable:
+                    try:
+                        self._tx_cache.set_many(cacheable)
+                    except Exception as e:
+                        logging.warning(f"Failed to update transaction cache: {e}")
+        
+        try:
+            await asyncio.gather(produce(), *(consume() for _ in range(self.DETAIL_WORKERS)))
+        finally:
+            # Never leave other fetches waiting on signatures this call did not get to
+            for signature in owned:
+                future = self._tx_pending.pop(signature, None)
+                if future is not None and not future.done():
+                    future.set_result(None)
         
-        # If using async methods, gather results
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for res in results:
-                if isinstance(res, Exception):
-                    logging.warning(f"Failed to fetch transaction detail: {res}")
-                elif res and res.get("result"):
-                    transaction_details.append(res["result"])
+        for signature, future in awaiting.items():
+            tx = await future
+            if tx is not None:
+                fetched_txs[signature] = tx
         
+        transaction_details = [fetched_txs[sig] for sig in sig_infos if sig in fetched_txs]
         logging.info(f"Fetched {len(transaction_details)} transaction details for {address}")
         return transaction_details
     
@@ -137,79 +283,73 @@ class MixerCollector:
             results["error"] = "HeliusClient required for mixer analysis"
             return results
             
-        all_mixer_interactions = []
-        mixer_fetch_tasks = []
+        users = set()
+        
+        # Open pooled connections before fanning out so handshakes stay off the critical path
+        if self._has_warm_up:
+            await self.helius_client.warm_up(min(self.max_concurrency, 8))
         
         # Start fetching transactions for all known mixers
-        for mixer_address, mixer_name in self.known_mixers.items():
+        mixers = list(self.known_mixers.items())
+        for mixer_address, mixer_name in mixers:
             logging.info(f"Fetching transactions for mixer: {mixer_name} ({mixer_address})")
-            mixer_fetch_tasks.append(self.fetch_transactions_paginated(mixer_address, limit_total=limit_per_mixer))
             
-        fetched_tx_lists = await asyncio.gather(*mixer_fetch_tasks, return_exceptions=True)
+        fetched_tx_lists = await asyncio.gather(
+            *(self.fetch_transactions_paginated(mixer_address, limit_total=limit_per_mixer) for mixer_address, _ in mixers),
+            return_exceptions=True
+        )
         
         # Process results for each mixer
-        for i, mixer_address in enumerate(self.known_mixers.keys()):
-            mixer_name = self.known_mixers[mixer_address]
-            mixer_summary = {"address": mixer_address, "name": mixer_name, "interactions": 0, "volume": 0.0, "error": None}
+        for (mixer_address, mixer_name), transactions in zip(mixers, fetched_tx_lists):
+            interactions = 0
+            total_volume = 0.0
+            error = None
             
-            if isinstance(fetched_tx_lists[i], Exception):
-                mixer_summary["error"] = str(fetched_tx_lists[i])
-                logging.error(f"Error fetching transactions for mixer {mixer_address}: {fetched_tx_lists[i]}")
+            if isinstance(transactions, Exception):
+                error = str(transactions)
+                logging.error(f"Error fetching transactions for mixer {mixer_address}: {transactions}")
             else:
-                transactions = fetched_tx_lists[i]
-                mixer_summary["interactions"] = len(transactions)
-                all_mixer_interactions.extend(transactions)
+                interactions = len(transactions)
                 
-                # Calculate volume from transactions
-                total_volume = await self._calculate_mixer_volume(mixer_address, transactions)
-                mixer_summary["volume"] = total_volume
+                # Calculate volume and identify potential users in one pass over the transfers
+                total_volume, mixer_users = await self._analyze_transfers(mixer_address, transactions)
+                users |= mixer_users
                 
-            results["mixer_services_summary"].append(mixer_summary)
+            results["mixer_services_summary"].append({
+                "address": mixer_address, "name": mixer_name, "interactions": interactions,
+                "volume": total_volume, "error": error
+            })
             
-        # Identify potential users by analyzing transfers
-        users = await self._identify_mixer_users(all_mixer_interactions)
-        
         # Filter out known exchanges and mixer addresses
-        filtered_users = users - set(self.known_mixers.keys()) - self.known_exchanges
+        filtered_users = users - self._excluded_addresses
         results["potential_mixer_users"] = list(filtered_users)
         
         logging.info(f"Identified {len(results['potential_mixer_users'])} potential unique mixer users")
         return results
     
-    async def _calculate_mixer_volume(self, mixer_address: str, transactions: List[Dict]) -> float:
-        """Calculate the total volume flowing through a mixer from transaction data."""
-        from scripts.analysis.network_builder import NetworkBuilder
-        
-        total_volume = 0.0
-        network_builder = NetworkBuilder(helius_client=self.helius_client)
-        
-        for tx in transactions:
-            transfers = network_builder._extract_transfers(tx)
-            for t in transfers:
-                if t.get('source') == mixer_address or t.get('destination') == mixer_address:
-                    # Convert amount to proper value based on decimals (simplified)
-                    amount_value = float(t.get('amount', 0)) / 1e9  # Assuming SOL or 9 decimals
-                    total_volume += amount_value
-                    
-        return total_volume
-    
-    async def _identify_mixer_users(self, mixer_transactions: List[Dict]) -> Set[str]:
-        """Identify potential mixer users from transaction data."""
-        from scripts.analysis.network_builder import NetworkBuilder
+    async def _analyze_transfers(self, mixer_address: str, transactions: List[Dict]) -> Tuple[float, Set[str]]:
+        """
+        Calculate a mixer's volume and collect potential mixer users from one columnar extraction.
         
-        users = set()
-        network_builder = NetworkBuilder(helius_client=self.helius_client)
-        
-        for tx in mixer_transactions:
-            transfers = network_builder._extract_transfers(tx)
-            for t in transfers:
-                # Check if source or destination is a known mixer
-                if t.get('source') in self.known_mixers:
-                    users.add(t.get('destination'))
-                if t.get('destination') in self.known_mixers:
-                    users.add(t.get('source'))
-                    
-        return users
+        Args:
+            mixer_address: Mixer whose volume is calculated
+            transactions: Transactions fetched for the mixer
+            
+        Returns:
+            Tuple of total volume flowing through the mixer and the counterparties of any known mixer
+        """
+        sources, destinations, amounts = self._get_network_builder()._extract_transfer_arrays(transactions)
+        
+        # Convert amounts to proper value based on decimals (simplified; assuming SOL or 9 decimals)
+        touches_mixer = (sources == mixer_address) | (destinations == mixer_address)
+        total_volume = float(amounts[touches_mixer].sum()) / 1e9
+        
+        # Counterparties of any known mixer; pandas' hash-table isin handles None entries, unlike np.isin
+        from_mixer = pd.Series(sources, copy=False).isin(self._mixer_keys).to_numpy()
+        to_mixer = pd.Series(destinations, copy=False).isin(self._mixer_keys).to_numpy()
+        users = set(destinations[from_mixer]) | set(sources[to_mixer])
+        
+        return total_volume, users
     
     def get_known_exchange_addresses(self) -> Set[str]:
         """Return the set of known exchange addresses to filter out from mixer users."""
@@ -220,7 +360,16 @@ class MixerCollector:
                 if exchange_data and "accounts" in exchange_data:
                     exchange_addresses = {account["address"] for account in exchange_data["accounts"]}
                     self.known_exchanges.update(exchange_addresses)
+                    self._excluded_addresses = self._mixer_keys | frozenset(self.known_exchanges)
             except Exception as e:
                 logging.warning(f"Failed to fetch exchange addresses from Vybe: {e}")
                 
         return self.known_exchanges
+    
+    async def prewarm(self) -> None:
+        """
+        Load exchange addresses ahead of analyze_mixers without blocking the event loop.
+        
+        The Vybe lookup is synchronous, so it runs in a worker thread.
+        """
+        await asyncio.to_thread(self.get_known_exchange_addresses)
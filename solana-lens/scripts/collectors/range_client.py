@@ -1,8 +1,9 @@
 import requests
-import json
 from typing import Dict, List, Any, Optional, Union
 
-class RangeClient:
+from .base_client import BaseApiClient
+
+class RangeClient(BaseApiClient):
     """
     Client for interacting with the Range API for blockchain research.
     
@@ -10,66 +11,59 @@ class RangeClient:
     transaction analysis, and cross-chain exploration.
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://api.range.org/v1"):
+    # Endpoints with a fixed path, whose URLs are built once per client
+    _ENDPOINTS = ("address", "risk/address", "address/counterparties", "address/transactions",
+                  "transaction", "risk/transaction")
+    
+    # Seconds to reuse cached responses; risk scores change faster than address metadata
+    ADDRESS_CACHE_TTL = 600
+    RISK_CACHE_TTL = 120
+    
+    def __init__(self, api_key: str, base_url: str = "https://api.range.org/v1",
+                 session: Optional[requests.Session] = None, requests_per_second: float = 20,
+                 shared_pool: bool = False):
         """
         Initialize the Range API client.
         
         Args:
             api_key (str): API key for authentication
             base_url (str, optional): Base URL for the API.
+            session (requests.Session, optional): Session to reuse connections from.
+                A new session is created if not provided.
+            requests_per_second (float, optional): Request budget for the async methods.
+                Defaults to 20.
+            shared_pool (bool, optional): Open async connections from the connector shared by
+                all API clients (see connection_pool) instead of a private pool. Defaults to False.
         """
         self.api_key = api_key
-        self.base_url = base_url
-        self.headers = {
+        super().__init__(base_url, headers={
             "X-API-KEY": self.api_key,
             "Content-Type": "application/json",
             "Accept": "application/json"
-        }
+        }, session=session, requests_per_second=requests_per_second, shared_pool=shared_pool)
     
-    def _make_request(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, 
-                     data: Optional[Dict] = None) -> Dict:
+    # Address Information Endpoints
+    
+    def get_address_info(self, address: str, network: str = "solana") -> Dict:
         """
-        Make a request to the Range API.
+        Get information about an address including network and labels.
         
         Args:
-            endpoint (str): API endpoint to call
-            method (str, optional): HTTP method. Defaults to "GET".
-            params (Dict, optional): Query parameters. Defaults to None.
-            data (Dict, optional): Request body. Defaults to None.
+            address (str): The blockchain address to query
+            network (str): The blockchain network
             
         Returns:
-            Dict: Response from the API
-            
-        Raises:
-            Exception: If the API request fails
+            Dict: Address information including labels
         """
-        url = f"{self.base_url}/{endpoint}"
-        
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=self.headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=self.headers, params=params, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg += f". Details: {json.dumps(error_data)}"
-                except:
-                    error_msg += f". Status code: {e.response.status_code}"
-            raise Exception(error_msg)
-    
-    # Address Information Endpoints
+        params = {
+            "address": address,
+            "network": network
+        }
+        return self._cached_request("address", params=params, ttl=self.ADDRESS_CACHE_TTL)
     
-    def get_address_info(self, address: str, network: str = "solana") -> Dict:
+    async def get_address_info_async(self, address: str, network: str = "solana") -> Dict:
         """
-        Get information about an address including network and labels.
+        Async version of get_address_info.
         
         Args:
             address (str): The blockchain address to query
@@ -82,7 +76,7 @@ class RangeClient:
             "address": address,
             "network": network
         }
-        return self._make_request("address", params=params)
+        return await self._cached_request_async("address", params=params, ttl=self.ADDRESS_CACHE_TTL)
     
     def get_address_risk_score(self, address: str, network: str = "solana") -> Dict:
         """
@@ -99,7 +93,24 @@ class RangeClient:
             "address": address,
             "network": network
         }
-        return self._make_request("risk/address", params=params)
+        return self._cached_request("risk/address", params=params, ttl=self.RISK_CACHE_TTL)
+    
+    async def get_address_risk_score_async(self, address: str, network: str = "solana") -> Dict:
+        """
+        Async version of get_address_risk_score.
+        
+        Args:
+            address (str): The blockchain address to assess
+            network (str): The blockchain network
+            
+        Returns:
+            Dict: Risk assessment data
+        """
+        params = {
+            "address": address,
+            "network": network
+        }
+        return await self._cached_request_async("risk/address", params=params, ttl=self.RISK_CACHE_TTL)
     
     def get_address_counterparties(self, address: str, network: str = "solana") -> Dict:
         """
@@ -116,7 +127,24 @@ class RangeClient:
             "address": address,
             "network": network
         }
-        return self._make_request("address/counterparties", params=params)
+        return self._cached_request("address/counterparties", params=params, ttl=self.ADDRESS_CACHE_TTL)
+    
+    async def get_address_counterparties_async(self, address: str, network: str = "solana") -> Dict:
+        """
+        Async version of get_address_counterparties.
+        
+        Args:
+            address (str): The blockchain address to query
+            network (str): The blockchain network
+            
+        Returns:
+            Dict: Counterparty information
+        """
+        params = {
+            "address": address,
+            "network": network
+        }
+        return await self._cached_request_async("address/counterparties", params=params, ttl=self.ADDRESS_CACHE_TTL)
     
     def get_address_transactions(self, address: str, network: str = "solana") -> Dict:
         """
@@ -193,4 +221,16 @@ class RangeClient:
         Returns:
             Dict: Cross-chain transaction data
         """
-        return self._make_request(f"transactions/address?address={address}")
\ No newline at end of file
+        return self._make_request(f"transactions/address?address={address}")
+    
+    async def get_transactions_by_address_async(self, address: str) -> Dict:
+        """
+        Async version of get_transactions_by_address.
+        
+        Args:
+            address (str): Blockchain address
+            
+        Returns:
+            Dict: Cross-chain transaction data
+        """
+        return await self._make_request_async(f"transactions/address?address={address}")
\ No newline at end of file
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket limiter for async code: up to `rate` requests may start per second,
+    with bursts of up to `rate` when the bucket is full.
+    """
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may start, then consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                # Wait just long enough for the next token instead of a fixed delay
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+    
+    def drain(self) -> None:
+        """Empty the bucket, e.g. when the server reports the quota is exhausted."""
+        self.tokens = 0
+        self.updated = time.monotonic()
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
@@ -1,9 +1,10 @@
-import datetime
+from datetime import datetime, timezone
 import requests
-import json
 from typing import Dict, List, Any, Optional, Union
 
-class RugCheckClient:
+from .base_client import BaseApiClient
+
+class RugCheckClient(BaseApiClient):
     """
     Client for interacting with the RugCheck API for Solana token analysis.
     
@@ -11,60 +12,36 @@ class RugCheckClient:
     and token verification.
     """
     
-    def __init__(self, jwt_token: str, base_url: str = "https://api.rugcheck.xyz/v1"):
+    # Endpoints with a fixed path, whose URLs are built once per client
+    _ENDPOINTS = ("tokens/verify/eligible", "tokens/verify", "stats/new_tokens", "stats/trending",
+                  "stats/verified")
+    
+    # Seconds to reuse cached token reports; summaries are refreshed more often
+    REPORT_CACHE_TTL = 1800
+    SUMMARY_CACHE_TTL = 600
+    
+    def __init__(self, jwt_token: str, base_url: str = "https://api.rugcheck.xyz/v1",
+                 session: Optional[requests.Session] = None, requests_per_second: float = 20,
+                 shared_pool: bool = False):
         """
         Initialize the RugCheck API client.
         
         Args:
             jwt_token (str): JWT token for authentication
             base_url (str, optional): Base URL for the API.
+            session (requests.Session, optional): Session to reuse connections from.
+                A new session is created if not provided.
+            requests_per_second (float, optional): Request budget for the async methods.
+                Defaults to 20.
+            shared_pool (bool, optional): Open async connections from the connector shared by
+                all API clients (see connection_pool) instead of a private pool. Defaults to False.
         """
         self.jwt_token = jwt_token
-        self.base_url = base_url
-        self.headers = {
+        super().__init__(base_url, headers={
             "Authorization": f"Bearer {self.jwt_token}",
             "Content-Type": "application/json",
             "Accept": "application/json"
-        }
-    
-    def _make_request(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, 
-                     data: Optional[Dict] = None) -> Dict:
-        """
-        Make a request to the RugCheck API.
-        
-        Args:
-            endpoint (str): API endpoint to call
-            method (str, optional): HTTP method. Defaults to "GET".
-            params (Dict, optional): Query parameters. Defaults to None.
-            data (Dict, optional): Request body. Defaults to None.
-            
-        Returns:
-            Dict: Response from the API
-            
-        Raises:
-            Exception: If the API request fails
-        """
-        url = f"{self.base_url}/{endpoint}"
-        
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=self.headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=self.headers, params=params, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg += f". Details: {json.dumps(error_data)}"
-                except:
-                    error_msg += f". Status code: {e.response.status_code}"
-            raise Exception(error_msg)
+        }, session=session, requests_per_second=requests_per_second, shared_pool=shared_pool)
     
     # Authentication
     
@@ -89,7 +66,7 @@ class RugCheckClient:
             "message": {
                 "message": message,
                 "publicKey": wallet,
-                "timestamp": int(datetime.now().timestamp())
+                "timestamp": int(datetime.now(timezone.utc).timestamp())
             },
             "signature": signature
         }
@@ -97,7 +74,7 @@ class RugCheckClient:
         headers = {"Content-Type": "application/json"}
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = requests.post(url, headers=headers, json=payload, timeout=cls.REQUEST_TIMEOUT)
             response.raise_for_status()
             result = response.json()
             token = result.get("token")
@@ -109,11 +86,9 @@ class RugCheckClient:
         except requests.exceptions.RequestException as e:
             error_msg = f"Login failed: {str(e)}"
             if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg += f". Details: {json.dumps(error_data)}"
-                except:
-                    error_msg += f". Status code: {e.response.status_code}"
+                # Report the body as received instead of parsing and re-serializing it
+                details = e.response.text
+                error_msg += f". Details: {details}" if details else f". Status code: {e.response.status_code}"
             raise Exception(error_msg)
     
     # Token Analysis Endpoints
@@ -128,7 +103,19 @@ class RugCheckClient:
         Returns:
             Dict: Detailed token report
         """
-        return self._make_request(f"tokens/{token_mint}/report")
+        return self._cached_request(f"tokens/{token_mint}/report", ttl=self.REPORT_CACHE_TTL)
+    
+    async def get_token_report_async(self, token_mint: str) -> Dict:
+        """
+        Async version of get_token_report.
+        
+        Args:
+            token_mint (str): Token mint address
+            
+        Returns:
+            Dict: Detailed token report
+        """
+        return await self._cached_request_async(f"tokens/{token_mint}/report", ttl=self.REPORT_CACHE_TTL)
     
     def get_token_report_summary(self, token_mint: str, cache_only: bool = False) -> Dict:
         """
@@ -142,7 +129,21 @@ class RugCheckClient:
             Dict: Token report summary
         """
         params = {"cacheOnly": "true" if cache_only else "false"}
-        return self._make_request(f"tokens/{token_mint}/report/summary", params=params)
+        return self._cached_request(f"tokens/{token_mint}/report/summary", params=params, ttl=self.SUMMARY_CACHE_TTL)
+    
+    async def get_token_report_summary_async(self, token_mint: str, cache_only: bool = False) -> Dict:
+        """
+        Async version of get_token_report_summary.
+        
+        Args:
+            token_mint (str): Token mint address
+            cache_only (bool, optional): Only return cached reports. Defaults to False.
+            
+        Returns:
+            Dict: Token report summary
+        """
+        params = {"cacheOnly": "true" if cache_only else "false"}
+        return await self._cached_request_async(f"tokens/{token_mint}/report/summary", params=params, ttl=self.SUMMARY_CACHE_TTL)
     
     def get_token_insider_graph(self, token_mint: str) -> Dict:
         """
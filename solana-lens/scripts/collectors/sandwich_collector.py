@@ -1,24 +1,52 @@
 import time
 import logging
-from typing import Dict, List, Any, Optional
+import asyncio
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from datetime import datetime
 
+from .connection_pool import close_shared_connector
+from .rate_limiter import AsyncRateLimiter
+
 class SandwichCollector:
     """
     Collector for data related to potential sandwich attacks on DEXs.
     Responsible for fetching and pre-processing transaction data from DEXs.
     """
     
-    def __init__(self, helius_client=None):
+    # Maximum number of block requests in flight at once
+    BLOCK_CONCURRENCY = 4
+    
+    # Number of fetched blocks remembered by slot; blocks hold thousands of transactions each
+    BLOCK_CACHE_SIZE = 64
+    
+    # Most recent streamed signatures kept for collect_potential_victim_txs in live mode
+    LIVE_BUFFER_SIZE = 50000
+    
+    def __init__(self, helius_client=None, block_requests_per_second: float = 2):
         """
         Initialize the SandwichCollector.
         
         Args:
             helius_client: Helius API client instance for fetching transaction data.
+            block_requests_per_second: Budget for the heavy getBlock requests, on top of
+                the Helius client's own pacing. Defaults to 2.
         """
         if not helius_client:
             raise ValueError("HeliusClient is required for SandwichCollector")
         self.helius_client = helius_client
+        self._has_async_sigs = hasattr(helius_client, 'get_signatures_for_address_async')
+        self._has_async_block = hasattr(helius_client, 'get_block_async')
+        
+        # Token bucket for block requests, created per event loop
+        self.block_requests_per_second = block_requests_per_second
+        self._block_limiter = None
+        self._block_limiter_loop = None
+        self._block_cache = OrderedDict()  # slot -> block transactions, LRU order
+        
+        # Signatures received by subscribe(), oldest first, and whether the stream is up
+        self._live_victims = deque(maxlen=self.LIVE_BUFFER_SIZE)
+        self._live = False
         
         # Known DEX program IDs (add more as needed)
         self.dex_programs = {
@@ -38,6 +66,9 @@ class SandwichCollector:
         """
         Collect recent transactions from DEXs that could be potential victims of sandwich attacks.
         
+        Synchronous wrapper around collect_potential_victim_txs_async; must not be called
+        from a running event loop.
+        
         Args:
             time_window_minutes: Time window in minutes to look back for transactions
             limit_per_dex: Maximum number of transactions to retrieve per DEX
@@ -45,34 +76,125 @@ class SandwichCollector:
         Returns:
             List of transaction signatures with metadata
         """
-        potential_victims = []
-        cutoff_time = time.time() - (time_window_minutes * 60)
+        return self._run_sync(self.collect_potential_victim_txs_async(time_window_minutes, limit_per_dex))
+    
+    def _run_sync(self, coro: Awaitable) -> Any:
+        """
+        Run coro with asyncio.run for the sync wrappers.
         
-        for program_id, dex_name in self.dex_programs.items():
+        The Helius client's aiohttp session is created on that throwaway loop, so it is closed
+        on the same loop before asyncio.run returns instead of leaking its connections.
+        """
+        async def run() -> Any:
             try:
-                logging.info(f"Collecting transactions from {dex_name} ({program_id})")
-                signatures_result = self.helius_client.get_signatures_for_address(program_id, limit=limit_per_dex)
-                signatures = signatures_result.get("result", [])
-                
-                # Filter recent, successful transactions
-                recent_signatures = [s for s in signatures if s.get('blockTime', 0) > cutoff_time and not s.get('err')]
-                
-                # Add DEX name to each signature for easier identification
-                for sig in recent_signatures:
-                    sig['dex_name'] = dex_name
-                    sig['program_id'] = program_id
-                
-                potential_victims.extend(recent_signatures)
-                logging.info(f"Found {len(recent_signatures)} recent signatures for {dex_name}")
-                
-                # Basic rate limiting
-                time.sleep(0.2)
-                
-            except Exception as e:
-                logging.error(f"Error fetching transactions from {dex_name}: {e}")
-        
-        # Deduplicate in case some transactions appeared in multiple DEXs
-        unique_victims = {v['signature']: v for v in potential_victims}
+                return await coro
+            finally:
+                close_session = getattr(self.helius_client, 'close_async_session', None)
+                if close_session is not None:
+                    await close_session()
+                if getattr(self.helius_client, 'shared_pool', False):
+                    await close_shared_connector()
+        
+        return asyncio.run(run())
+    
+    async def _fetch_dex_signatures(self, program_id: str, dex_name: str, limit: int, cutoff_time: float) -> List[Dict]:
+        """Fetch one DEX program's recent, successful signatures, tagged with the DEX they came from."""
+        logging.info(f"Collecting transactions from {dex_name} ({program_id})")
+        if self._has_async_sigs:
+            signatures_result = await self.helius_client.get_signatures_for_address_async(program_id, limit=limit)
+        else:
+            signatures_result = await asyncio.to_thread(
+                self.helius_client.get_signatures_for_address, program_id, limit=limit
+            )
+        signatures = signatures_result.get("result", [])
+        
+        # Keep recent, successful transactions, tagged with the DEX for easier identification
+        recent_signatures = [
+            {**s, 'dex_name': dex_name, 'program_id': program_id}
+            for s in signatures if s.get('blockTime', 0) > cutoff_time and not s.get('err')
+        ]
+        
+        logging.info(f"Found {len(recent_signatures)} recent signatures for {dex_name}")
+        return recent_signatures
+    
+    async def subscribe(self, on_tx: Optional[Callable[[Dict], Any]] = None) -> None:
+        """
+        Stream successful DEX transactions live instead of polling for them.
+        
+        Runs until cancelled or the connection drops. While it runs,
+        collect_potential_victim_txs serves its time window from the streamed buffer;
+        afterwards it falls back to polling.
+        
+        Args:
+            on_tx: Optional callback invoked with each signature (same fields as the polled ones)
+        """
+        self._live = True
+        try:
+            async for program_id, value in self.helius_client.logs_subscribe(list(self.dex_programs)):
+                if value.get('err'):
+                    continue
+                sig = {
+                    'signature': value.get('signature'),
+                    'slot': value.get('slot'),
+                    # Notifications carry no block time; arrival time is within a slot or two of it
+                    'blockTime': int(time.time()),
+                    'err': None,
+                    'dex_name': self.dex_programs[program_id],
+                    'program_id': program_id
+                }
+                self._live_victims.append(sig)
+                if on_tx is not None:
+                    on_tx(sig)
+        finally:
+            self._live = False
+    
+    def _buffered_victims(self, cutoff_time: float, limit_per_dex: int) -> List[Dict]:
+        """Return streamed signatures newer than cutoff_time, newest first, at most limit_per_dex per DEX."""
+        unique_victims: Dict[str, Dict] = {}
+        per_dex: Dict[str, int] = {}
+        for sig in reversed(self._live_victims):
+            if sig['blockTime'] <= cutoff_time:
+                break
+            program_id = sig['program_id']
+            if per_dex.get(program_id, 0) < limit_per_dex and sig['signature'] not in unique_victims:
+                per_dex[program_id] = per_dex.get(program_id, 0) + 1
+                unique_victims[sig['signature']] = sig
+        return list(unique_victims.values())
+    
+    async def collect_potential_victim_txs_async(self, time_window_minutes: int = 10, limit_per_dex: int = 500) -> List[Dict]:
+        """
+        Async version of collect_potential_victim_txs. While subscribe() is streaming, the
+        window is served from its buffer; otherwise all DEX programs are polled concurrently,
+        with request pacing left to the Helius client.
+        
+        Args:
+            time_window_minutes: Time window in minutes to look back for transactions
+            limit_per_dex: Maximum number of transactions to retrieve per DEX
+            
+        Returns:
+            List of transaction signatures with metadata
+        """
+        cutoff_time = time.time() - (time_window_minutes * 60)
+        
+        if self._live:
+            result = self._buffered_victims(cutoff_time, limit_per_dex)
+            logging.info(f"Collected {len(result)} unique potential victim transactions from the live stream")
+            return result
+        
+        dexes = list(self.dex_programs.items())
+        results = await asyncio.gather(
+            *(self._fetch_dex_signatures(program_id, dex_name, limit_per_dex, cutoff_time) for program_id, dex_name in dexes),
+            return_exceptions=True
+        )
+        
+        # Deduplicate as we go, in case some transactions appeared in multiple DEXs
+        unique_victims: Dict[str, Dict] = {}
+        for (program_id, dex_name), recent_signatures in zip(dexes, results):
+            if isinstance(recent_signatures, Exception):
+                logging.error(f"Error fetching transactions from {dex_name}: {recent_signatures}")
+                continue
+            for sig in recent_signatures:
+                unique_victims.setdefault(sig['signature'], sig)
         result = list(unique_victims.values())
         
         logging.info(f"Collected {len(result)} unique potential victim transactions across all DEXs")
@@ -90,16 +212,45 @@ class SandwichCollector:
         """
         try:
             tx_response = self.helius_client.get_transaction(signature)
-            if not tx_response or not tx_response.get("result"):
+            tx = tx_response.get("result") if tx_response else None
+            if not tx:
                 logging.warning(f"No data returned for transaction {signature}")
                 return None
             
-            return tx_response.get("result")
+            return tx
             
         except Exception as e:
             logging.error(f"Error fetching transaction {signature}: {e}")
             return None
     
+    def fetch_transactions_details(self, signatures: List[str]) -> List[Optional[Dict]]:
+        """
+        Fetch detailed transaction data for many signatures, batching the RPC calls when supported.
+        
+        Args:
+            signatures: Transaction signatures
+            
+        Returns:
+            Transaction details in input order, with None for any not found/error
+        """
+        if not hasattr(self.helius_client, 'get_transactions_batch'):
+            return [self.fetch_transaction_details(signature) for signature in signatures]
+        
+        try:
+            responses = self.helius_client.get_transactions_batch(signatures)
+        except Exception as e:
+            logging.error(f"Error fetching transaction batch of {len(signatures)}: {e}")
+            return [None] * len(signatures)
+        
+        details = []
+        for signature, tx_response in zip(signatures, responses):
+            tx = tx_response.get("result") if tx_response else None
+            if not tx:
+                logging.warning(f"No data returned for transaction {signature}")
+                tx = None
+            details.append(tx)
+        return details
+    
     def fetch_block_transactions(self, slot: int) -> List[Dict]:
         """
         Fetch all transactions in a specific block/slot to find related transactions.
@@ -110,24 +261,104 @@ class SandwichCollector:
         Returns:
             List of transaction details in the block
         """
+        cached = self._get_cached_block(slot)
+        if cached is not None:
+            return cached
+        
         try:
             block_response = self.helius_client.get_block(slot)
-            if not block_response or not block_response.get("result"):
+            block = block_response.get("result") if block_response else None
+            if not block:
                 logging.warning(f"No data returned for block {slot}")
                 return []
             
-            transactions = block_response.get("result", {}).get("transactions", [])
+            transactions = block.get("transactions", [])
             logging.info(f"Fetched {len(transactions)} transactions from block {slot}")
+            self._cache_block(slot, transactions)
             return transactions
             
         except Exception as e:
             logging.error(f"Error fetching block {slot}: {e}")
             return []
     
+    async def fetch_block_transactions_async(self, slot: int) -> List[Dict]:
+        """
+        Async version of fetch_block_transactions, paced by the block request token bucket.
+        
+        Args:
+            slot: Block slot number
+            
+        Returns:
+            List of transaction details in the block
+        """
+        cached = self._get_cached_block(slot)
+        if cached is not None:
+            return cached
+        
+        if not self._has_async_block:
+            async with self._get_block_limiter():
+                return await asyncio.to_thread(self.fetch_block_transactions, slot)
+        
+        try:
+            async with self._get_block_limiter():
+                block_response = await self.helius_client.get_block_async(slot)
+            block = block_response.get("result") if block_response else None
+            if not block:
+                logging.warning(f"No data returned for block {slot}")
+                return []
+            
+            transactions = block.get("transactions", [])
+            logging.info(f"Fetched {len(transactions)} transactions from block {slot}")
+            self._cache_block(slot, transactions)
+            return transactions
+            
+        except Exception as e:
+            logging.error(f"Error fetching block {slot}: {e}")
+            return []
+    
+    def _get_cached_block(self, slot: int) -> Optional[List[Dict]]:
+        """Return the transactions of a previously fetched block, or None if it isn't cached."""
+        transactions = self._block_cache.get(slot)
+        if transactions is not None:
+            self._block_cache.move_to_end(slot)
+        return transactions
+    
+    def _cache_block(self, slot: int, transactions: List[Dict]) -> None:
+        """Remember a fetched block's transactions, evicting the least recently used block if full."""
+        self._block_cache[slot] = transactions
+        self._block_cache.move_to_end(slot)
+        if len(self._block_cache) > self.BLOCK_CACHE_SIZE:
+            self._block_cache.popitem(last=False)
+    
+    def _get_block_limiter(self) -> AsyncRateLimiter:
+        """Return the token bucket pacing block requests, creating one per event loop."""
+        loop = asyncio.get_running_loop()
+        if self._block_limiter_loop is not loop:
+            self._block_limiter = AsyncRateLimiter(self.block_requests_per_second)
+            self._block_limiter_loop = loop
+        return self._block_limiter
+    
     def collect_swap_batch_data(self, time_window_minutes: int = 10, batch_size: int = 50) -> Dict:
         """
         Collect a batch of data for sandwich attack analysis, including potential victims and related transactions.
         
+        Synchronous wrapper around collect_swap_batch_data_async; must not be called
+        from a running event loop.
+        
+        Args:
+            time_window_minutes: Time window to look back
+            batch_size: Number of potential victim transactions to analyze deeply
+            
+        Returns:
+            Dictionary containing collected data
+        """
+        return self._run_sync(self.collect_swap_batch_data_async(time_window_minutes, batch_size))
+    
+    async def collect_swap_batch_data_async(self, time_window_minutes: int = 10, batch_size: int = 50) -> Dict:
+        """
+        Async version of collect_swap_batch_data. Blocks are fetched concurrently, at most
+        BLOCK_CONCURRENCY at a time and paced by a token bucket.
+        
         Args:
             time_window_minutes: Time window to look back
             batch_size: Number of potential victim transactions to analyze deeply
@@ -136,34 +367,34 @@ class SandwichCollector:
             Dictionary containing collected data
         """
         # Step 1: Get potential victim transactions
-        potential_victims = self.collect_potential_victim_txs(time_window_minutes)
+        potential_victims = await self.collect_potential_victim_txs_async(time_window_minutes)
         
         # Step 2: Sample a batch for detailed analysis
         analysis_batch = potential_victims[:batch_size] if len(potential_victims) > batch_size else potential_victims
         
-        # Step 3: Fetch transaction details for the batch
+        # Step 3: Fetch transaction details for the batch in one batched request
         tx_details = []
-        for victim in analysis_batch:
-            details = self.fetch_transaction_details(victim['signature'])
+        batch_details = await asyncio.to_thread(
+            self.fetch_transactions_details, [victim['signature'] for victim in analysis_batch]
+        )
+        for victim, details in zip(analysis_batch, batch_details):
             if details:
                 # Merge DEX info from the signature data
                 details['dex_name'] = victim.get('dex_name', 'Unknown DEX')
                 tx_details.append(details)
-            
-            # Rate limiting
-            time.sleep(0.1)
         
         # Step 4: Get associated block data for a smaller subset if needed
         # This is expensive, so we might limit it further
-        block_tx_details = {}
         sample_for_blocks = tx_details[:10]  # Analyze blocks for just a few transactions
+        slots = list(dict.fromkeys(tx["slot"] for tx in sample_for_blocks if tx.get("slot")))
+        semaphore = asyncio.Semaphore(self.BLOCK_CONCURRENCY)
+        
+        async def fetch_block(slot: int) -> List[Dict]:
+            async with semaphore:
+                return await self.fetch_block_transactions_async(slot)
         
-        for tx in sample_for_blocks:
-            slot = tx.get("slot")
-            if slot and slot not in block_tx_details:
-                block_transactions = self.fetch_block_transactions(slot)
-                block_tx_details[slot] = block_transactions
-                time.sleep(0.5)  # More aggressive rate limiting for block requests
+        block_results = await asyncio.gather(*(fetch_block(slot) for slot in slots))
+        block_tx_details = dict(zip(slots, block_results))
         
         return {
             "potential_victims_count": len(potential_victims),
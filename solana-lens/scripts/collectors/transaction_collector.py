@@ -1,29 +1,168 @@
+import os
+import json
+import hashlib
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Set, Union
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple, Union
 from datetime import datetime, timedelta
 
+from .tx_cache import TransactionCache
+
+
+def _extract_edge_shard(transactions: List[Dict]) -> Tuple[Any, Any, Any, List[str]]:
+    """Worker for build_transaction_graph_parallel: extract one shard's edges as address ids."""
+    from scripts.analysis.network_builder import NetworkBuilder
+    return NetworkBuilder()._extract_edge_ids(transactions)
+
+
 class TransactionCollector:
     """
     General-purpose collector for Solana transactions data.
     Provides methods for fetching and organizing transaction data.
     """
     
-    def __init__(self, helius_client=None, range_client=None):
+    # Signatures per detail batch (one batched JSON-RPC request), and how many batches are fetched concurrently
+    DETAIL_BATCH_SIZE = 20
+    DETAIL_WORKERS = 4
+    
+    # Recent transactions whose details fetch_address_data includes per address, and the
+    # most calls Helius accepts in one JSON-RPC batch
+    DETAILS_PER_ADDRESS = 30
+    RPC_BATCH_LIMIT = 100
+    
+    # Number of exported graphs remembered by build_transaction_graph
+    GRAPH_CACHE_SIZE = 16
+    
+    # Transactions sent to each worker by build_transaction_graph_parallel
+    GRAPH_SHARD_SIZE = 5000
+    
+    def __init__(self, helius_client=None, range_client=None, tx_cache_path: Optional[str] = None):
         """
         Initialize the TransactionCollector.
         
         Args:
             helius_client: Helius API client for transaction data
             range_client: Range API client for cross-chain data
+            tx_cache_path: SQLite file caching finalized transaction details across runs.
+                Defaults to $HELIUS_TX_CACHE or .cache/helius_tx.sqlite3; an empty string disables it.
         """
         self.helius_client = helius_client
         self.range_client = range_client
+        # Resolve which client capabilities exist once, instead of per page or per batch
+        self._has_async_sigs = hasattr(helius_client, 'get_signatures_for_address_async')
+        self._has_async_tx = hasattr(helius_client, 'get_transaction_async')
+        self._has_batch = hasattr(helius_client, 'get_transactions_batch')
+        self._has_async_batch = hasattr(helius_client, 'get_transactions_batch_async')
+        self._has_async_sigs_batch = hasattr(helius_client, 'get_signatures_for_addresses_batch_async')
+        
+        if tx_cache_path is None:
+            tx_cache_path = os.getenv("HELIUS_TX_CACHE", os.path.join(".cache", "helius_tx.sqlite3"))
+        self._tx_cache = TransactionCache(tx_cache_path) if tx_cache_path else None
+        
+        self._network_builder = None  # Created on first use; see _get_network_builder
+        self._graph_cache = OrderedDict()  # transaction set digest -> graph data, LRU order
         
         logging.info("TransactionCollector initialized")
     
+    def _read_tx_cache(self, signatures: List[str]) -> Dict[str, Dict]:
+        """Return cached transaction details for the given signatures, if caching is enabled."""
+        if not self._tx_cache or not signatures:
+            return {}
+        try:
+            return self._tx_cache.get_many(signatures)
+        except Exception as e:
+            logging.warning(f"Failed to read transaction cache: {e}")
+            return {}
+    
+    def _write_tx_cache(self, sig_infos: Dict[str, Dict], fetched: Iterable[Tuple[str, Dict]]) -> None:
+        """Store the fetched transactions that are finalized and succeeded, if caching is enabled."""
+        if not self._tx_cache:
+            return
+        cacheable = [(sig, tx) for sig, tx in fetched if TransactionCache.is_cacheable(sig_infos[sig], tx)]
+        if not cacheable:
+            return
+        try:
+            self._tx_cache.set_many(cacheable)
+        except Exception as e:
+            logging.warning(f"Failed to update transaction cache: {e}")
+    
+    async def _fetch_detail(self, signature: str) -> Dict:
+        """Fetch one transaction, using the client's async method if it has one."""
+        if self._has_async_tx:
+            return await self.helius_client.get_transaction_async(signature)
+        return await asyncio.to_thread(self.helius_client.get_transaction, signature)
+    
+    async def _fetch_details(self, sig_infos: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Fetch transaction details for many signatures with as few round-trips as possible.
+        
+        Cached transactions are served from disk; the rest go out as JSON-RPC batches of up
+        to RPC_BATCH_LIMIT calls (or one request per signature if the client cannot batch).
+        
+        Args:
+            sig_infos: Signature info from getSignaturesForAddress, keyed by signature
+            
+        Returns:
+            Mapping of signature to transaction details for the signatures that were found
+        """
+        fetched_txs = self._read_tx_cache(list(sig_infos))
+        missing = [sig for sig in sig_infos if sig not in fetched_txs]
+        if not missing:
+            return fetched_txs
+        
+        try:
+            if self._has_async_batch:
+                responses = await self.helius_client.get_transactions_batch_async(missing, chunk_size=self.RPC_BATCH_LIMIT)
+            elif self._has_batch:
+                responses = await asyncio.to_thread(self.helius_client.get_transactions_batch, missing,
+                                                    chunk_size=self.RPC_BATCH_LIMIT)
+            else:
+                responses = await asyncio.gather(*(self._fetch_detail(sig) for sig in missing), return_exceptions=True)
+        except Exception as e:
+            logging.warning(f"Failed to fetch transaction details: {e}")
+            return fetched_txs
+        
+        fetched = []
+        for signature, res in zip(missing, responses):
+            if isinstance(res, Exception):
+                logging.debug(f"Failed to fetch tx detail: {res}")
+            elif res and (tx := res.get("result")):
+                fetched.append((signature, tx))
+        self._write_tx_cache(sig_infos, fetched)
+        
+        fetched_txs.update(fetched)
+        return fetched_txs
+    
+    async def _fetch_signature_lists(self, addresses: List[str]) -> List[Optional[Union[Dict, Exception]]]:
+        """
+        Fetch the first page of signatures for many addresses in shared JSON-RPC batches.
+        
+        Args:
+            addresses: Addresses to look up
+            
+        Returns:
+            One getSignaturesForAddress response per address, or the error that address's call
+            returned. All entries are None if the client cannot batch or the batch failed, so
+            each address falls back to its own request.
+        """
+        if not self._has_async_sigs_batch or not addresses:
+            return [None] * len(addresses)
+        try:
+            responses = await self.helius_client.get_signatures_for_addresses_batch_async(
+                addresses, limit=100, chunk_size=self.RPC_BATCH_LIMIT)
+        except Exception as e:
+            logging.warning(f"Batched signature lookup failed, fetching per address: {e}")
+            return [None] * len(addresses)
+        return [Exception(f"API error: {json.dumps(res['error'])}") if "error" in res
+                else res if "result" in res else None
+                for res in responses]
+    
     async def fetch_address_data(self, address: str, fetch_details: bool = True, 
-                                days: int = 30) -> Dict:
+                                days: int = 30, now_iso: Optional[str] = None,
+                                signatures: Optional[Union[Dict, Exception]] = None) -> Dict:
         """
         Collect comprehensive data about an address.
         
@@ -31,13 +170,17 @@ class TransactionCollector:
             address: The address to analyze
             fetch_details: Whether to fetch detailed transaction data
             days: How many days of history to analyze
+            now_iso: Timestamp to record, so callers analyzing many addresses can compute
+                it once. Defaults to the current time.
+            signatures: getSignaturesForAddress response (or the error it failed with) already
+                fetched by the caller; fetched here if not provided
             
         Returns:
             Dictionary containing address data and analytics
         """
         result = {
             "address": address,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso or datetime.now().isoformat(),
             "basic_info": None,
             "risk_score": None,
             "transaction_summary": None,
@@ -45,42 +188,52 @@ class TransactionCollector:
             "detailed_transactions": []
         }
         
-        # Get basic address info using Range if available
-        if self.range_client:
-            try:
-                address_info = self.range_client.get_address_info(address)
-                risk_score = self.range_client.get_address_risk_score(address)
-                
-                result["basic_info"] = address_info
-                result["risk_score"] = risk_score
-            except Exception as e:
-                logging.warning(f"Failed to get address info from Range: {e}")
+        async def call(client, name: str, *args, **kwargs) -> Any:
+            # Prefer the client's async variant, otherwise run the sync method in a worker thread
+            method = getattr(client, f"{name}_async", None)
+            if method is not None:
+                return await method(*args, **kwargs)
+            return await asyncio.to_thread(getattr(client, name), *args, **kwargs)
+        
+        async def skip() -> None:
+            return None
+        
+        # Range info, risk score, signatures and token balances are independent; fetch them concurrently
+        address_info, risk_score, fetched_signatures, token_accounts = await asyncio.gather(
+            call(self.range_client, "get_address_info", address) if self.range_client else skip(),
+            call(self.range_client, "get_address_risk_score", address) if self.range_client else skip(),
+            call(self.helius_client, "get_signatures_for_address", address, limit=100)
+            if self.helius_client and signatures is None else skip(),
+            call(self.helius_client, "get_token_accounts_by_owner", address)
+            if hasattr(self.helius_client, 'get_token_accounts_by_owner') else skip(),
+            return_exceptions=True
+        )
+        if signatures is None:
+            signatures = fetched_signatures
         
-        # Get transaction signatures
-        if self.helius_client:
+        for key, value in (("basic_info", address_info), ("risk_score", risk_score)):
+            if isinstance(value, Exception):
+                logging.warning(f"Failed to get address info from Range: {value}")
+            else:
+                result[key] = value
+        
+        if isinstance(token_accounts, Exception):
+            logging.warning(f"Failed to get token balances for {address}: {token_accounts}")
+        elif token_accounts is not None:
+            result["balances"] = token_accounts
+        
+        if isinstance(signatures, Exception):
+            logging.error(f"Error fetching transaction data for {address}: {signatures}")
+            result["error"] = str(signatures)
+        elif signatures is not None:
             try:
-                # Get transaction signatures
-                signatures = self.helius_client.get_signatures_for_address(address, limit=100)
                 result["transaction_summary"] = signatures.get("result", [])
                 
-                # Get token balances
-                if hasattr(self.helius_client, 'get_token_accounts_by_owner'):
-                    token_accounts = self.helius_client.get_token_accounts_by_owner(address)
-                    result["balances"] = token_accounts
-                
                 # Optionally fetch detailed transaction data
                 if fetch_details and signatures.get("result"):
-                    detailed_txs = []
-                    for sig_info in signatures.get("result", [])[:30]:  # Limit to 30 for performance
-                        try:
-                            tx_detail = self.helius_client.get_transaction(sig_info['signature'])
-                            if tx_detail and tx_detail.get("result"):
-                                detailed_txs.append(tx_detail.get("result"))
-                            await asyncio.sleep(0.1)  # Rate limit
-                        except Exception as tx_err:
-                            logging.debug(f"Failed to fetch tx detail: {tx_err}")
-                    
-                    result["detailed_transactions"] = detailed_txs
+                    sig_infos = {s['signature']: s for s in signatures["result"][:self.DETAILS_PER_ADDRESS]}
+                    fetched_txs = await self._fetch_details(sig_infos)
+                    result["detailed_transactions"] = [fetched_txs[sig] for sig in sig_infos if sig in fetched_txs]
                 
             except Exception as e:
                 logging.error(f"Error fetching transaction data for {address}: {e}")
@@ -88,10 +241,73 @@ class TransactionCollector:
         
         return result
     
+    async def fetch_addresses_data(self, addresses: List[str], fetch_details: bool = True,
+                                   days: int = 30, now_iso: Optional[str] = None,
+                                   concurrency: int = 10) -> List[Dict]:
+        """
+        Collect data for many addresses, pooling their signature and detail requests.
+        
+        The signature lists of all addresses are requested up front in shared JSON-RPC
+        batches, and the remaining per-address lookups run concurrently; then the recent
+        signatures of every address are fetched together in shared batches, so N addresses
+        cost about ceil(N / RPC_BATCH_LIMIT) signature round-trips and
+        ceil(N * DETAILS_PER_ADDRESS / RPC_BATCH_LIMIT) detail round-trips instead of one
+        per address and per signature.
+        
+        Args:
+            addresses: Addresses to analyze
+            fetch_details: Whether to fetch detailed transaction data
+            days: How many days of history to analyze
+            now_iso: Timestamp to record on every result. Defaults to the current time.
+            concurrency: Maximum number of addresses looked up at the same time
+            
+        Returns:
+            One result per address, in input order, shaped like fetch_address_data's.
+            Addresses that failed entirely get a result with an "error" entry.
+        """
+        now_iso = now_iso or datetime.now().isoformat()
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        signature_lists = await self._fetch_signature_lists(addresses)
+        
+        async def fetch_one(address: str, signatures: Optional[Union[Dict, Exception]]) -> Dict:
+            async with semaphore:
+                return await self.fetch_address_data(address, fetch_details=False, days=days, now_iso=now_iso,
+                                                     signatures=signatures)
+        
+        gathered = await asyncio.gather(*(fetch_one(address, signatures)
+                                          for address, signatures in zip(addresses, signature_lists)),
+                                        return_exceptions=True)
+        results = []
+        for address, res in zip(addresses, gathered):
+            if isinstance(res, Exception):
+                logging.error(f"Error collecting data for address {address}: {res}")
+                res = {"address": address, "error": str(res), "timestamp": now_iso}
+            results.append(res)
+        
+        if fetch_details and self.helius_client:
+            per_address = [
+                {s['signature']: s for s in (res.get("transaction_summary") or [])[:self.DETAILS_PER_ADDRESS]}
+                for res in results
+            ]
+            pooled = {}
+            for sig_infos in per_address:
+                pooled.update(sig_infos)
+            
+            fetched_txs = await self._fetch_details(pooled) if pooled else {}
+            for res, sig_infos in zip(results, per_address):
+                res["detailed_transactions"] = [fetched_txs[sig] for sig in sig_infos if sig in fetched_txs]
+        
+        return results
+    
     async def fetch_transactions_paginated(self, address: str, limit_total: int = 1000) -> List[Dict]:
         """
         Fetch transactions with pagination support.
         
+        Signature pages are produced into a queue while workers fetch the details of
+        earlier pages, so listing and detail fetching overlap. Request pacing is left
+        to the Helius client's rate limiter, and finalized transactions fetched on
+        earlier runs are read from the on-disk cache.
+        
         Args:
             address: Address to fetch transactions for
             limit_total: Maximum number of transactions to fetch
@@ -101,90 +317,192 @@ class TransactionCollector:
         """
         if not self.helius_client:
             raise ValueError("HeliusClient is required for transaction fetching")
-            
-        all_signatures = []
-        last_signature = None
-        pages = 0
-        max_pages = (limit_total // 100) + 1
-        
-        logging.debug(f"Fetching up to {limit_total} signatures for {address}...")
-        while len(all_signatures) < limit_total and pages < max_pages:
-            try:
-                options = {"limit": 100}
-                if last_signature:
-                    options["before"] = last_signature
-                
-                # Use async method if available, otherwise fallback to sync
-                if hasattr(self.helius_client, 'get_signatures_for_address_async'):
-                    result = await self.helius_client.get_signatures_for_address_async(address, **options)
-                else:
-                    result = self.helius_client.get_signatures_for_address(address, **options)
-                
-                signatures = result.get("result", [])
-                if not signatures:
-                    break
-                    
-                all_signatures.extend(signatures)
-                last_signature = signatures[-1].get("signature")
-                pages += 1
-                logging.debug(f"Fetched page {pages}, total signatures: {len(all_signatures)}")
-                await asyncio.sleep(0.1)  # Rate limit
-                
-            except Exception as e:
-                logging.warning(f"Error fetching signatures page {pages+1} for {address}: {e}")
-                break
         
-        # Fetch transaction details
-        transaction_details = []
+        sig_infos = {}  # signature -> signature info, in page order
+        fetched_txs = {}  # signature -> transaction details
+        queue = asyncio.Queue(maxsize=2 * self.DETAIL_WORKERS)
         
-        # Process in batches to avoid overwhelming the API
-        batch_size = 20
-        for i in range(0, len(all_signatures), batch_size):
-            batch = all_signatures[i:i+batch_size]
-            batch_tasks = []
+        async def produce() -> None:
+            last_signature = None
+            pages = 0
+            max_pages = (limit_total // 100) + 1
             
-            for sig_info in batch:
-                if hasattr(self.helius_client, 'get_transaction_async'):
-                    batch_tasks.append(self.helius_client.get_transaction_async(sig_info['signature']))
-                else:
-                    # Fallback to sync method
+            logging.debug(f"Fetching up to {limit_total} signatures for {address}...")
+            try:
+                while len(sig_infos) < limit_total and pages < max_pages:
                     try:
-                        tx_detail = self.helius_client.get_transaction(sig_info['signature'])
-                        if tx_detail and tx_detail.get("result"):
-                            transaction_details.append(tx_detail.get("result"))
+                        options = {"limit": 100}
+                        if last_signature:
+                            options["before"] = last_signature
+                        
+                        # Use async method if available, otherwise run the sync one in a worker thread
+                        if self._has_async_sigs:
+                            result = await self.helius_client.get_signatures_for_address_async(address, **options)
+                        else:
+                            result = await asyncio.to_thread(self.helius_client.get_signatures_for_address, address, **options)
                     except Exception as e:
-                        logging.debug(f"Failed to fetch tx detail: {e}")
-            
-            if batch_tasks:
-                batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                for res in batch_results:
+                        logging.warning(f"Error fetching signatures page {pages+1} for {address}: {e}")
+                        break
+                    
+                    signatures = result.get("result", [])
+                    if not signatures:
+                        break
+                    
+                    page = [sig_info['signature'] for sig_info in signatures]
+                    sig_infos.update((sig_info['signature'], sig_info) for sig_info in signatures)
+                    last_signature = page[-1]
+                    pages += 1
+                    logging.debug(f"Fetched page {pages}, total signatures: {len(sig_infos)}")
+                    
+                    fetched_txs.update(self._read_tx_cache(page))
+                    missing = [sig for sig in page if sig not in fetched_txs]
+                    for i in range(0, len(missing), self.DETAIL_BATCH_SIZE):
+                        await queue.put(missing[i:i + self.DETAIL_BATCH_SIZE])
+            finally:
+                for _ in range(self.DETAIL_WORKERS):
+                    await queue.put(None)
+        
+        async def fetch_batch(batch: List[str]) -> List[Any]:
+            # One batched JSON-RPC request per batch where supported, otherwise one request per signature
+            if self._has_async_batch:
+                return await self.helius_client.get_transactions_batch_async(batch, chunk_size=self.DETAIL_BATCH_SIZE)
+            if self._has_batch:
+                return await asyncio.to_thread(self.helius_client.get_transactions_batch, batch,
+                                               chunk_size=self.DETAIL_BATCH_SIZE)
+            return await asyncio.gather(*(self._fetch_detail(sig) for sig in batch), return_exceptions=True)
+        
+        async def consume() -> None:
+            while (batch := await queue.get()) is not None:
+                try:
+                    batch_results = await fetch_batch(batch)
+                except Exception as e:
+                    logging.warning(f"Failed to fetch transaction details batch: {e}")
+                    continue
+                fetched = []
+                for signature, res in zip(batch, batch_results):
                     if isinstance(res, Exception):
                         logging.debug(f"Failed to fetch transaction detail: {res}")
-                    elif res and res.get("result"):
-                        transaction_details.append(res.get("result"))
-            
-            # Rate limit between batches
-            if i + batch_size < len(all_signatures):
-                await asyncio.sleep(0.5)
+                    elif res and (tx := res.get("result")):
+                        fetched_txs[signature] = tx
+                        fetched.append((signature, tx))
+                self._write_tx_cache(sig_infos, fetched)
+        
+        await asyncio.gather(produce(), *(consume() for _ in range(self.DETAIL_WORKERS)))
         
+        transaction_details = [fetched_txs[sig] for sig in sig_infos if sig in fetched_txs]
         logging.info(f"Fetched {len(transaction_details)} transaction details for {address}")
         return transaction_details
     
+    def _get_network_builder(self):
+        """Return the NetworkBuilder used to build graphs, creating it on first use."""
+        if self._network_builder is None:
+            from scripts.analysis.network_builder import NetworkBuilder
+            self._network_builder = NetworkBuilder(helius_client=self.helius_client)
+        return self._network_builder
+    
+    def build_from_arrays(self, src, dst, attrs, addresses: Optional[List[str]] = None) -> Dict:
+        """
+        Build graph data from columnar transfer edges.
+        
+        Args:
+            src: numpy array of senders, one per transfer (addresses, or int32 ids with addresses)
+            dst: numpy array of receivers, one per transfer (addresses, or int32 ids with addresses)
+            attrs: pandas DataFrame of per-transfer 'tx_hash', 'amount', 'mint' and 'block_time'
+            addresses: Address of each id, when src and dst hold ids
+            
+        Returns:
+            Network graph data structure
+        """
+        return self._get_network_builder().build_graph_data_from_arrays(src, dst, attrs, addresses)
+    
     def build_transaction_graph(self, transactions: List[Dict]) -> Dict:
         """
         Build a transaction graph from a list of transactions.
         
+        Transfers are extracted into columnar edge arrays and assembled with
+        build_from_arrays, without materializing a NetworkX graph. When every
+        transaction carries a signature the result is memoized, so repeated calls
+        with the same transactions reuse the previously built graph data.
+        
         Args:
             transactions: List of transaction details
             
+        Returns:
+            Network graph data structure. The nodes and links lists are fresh copies, but
+            the GraphNode and GraphLink objects in them may be shared with other calls and
+            must not be mutated.
+        """
+        # Transactions are immutable, so their first signatures identify the input; without
+        # a signature for every transaction there is no reliable key, so nothing is cached
+        signatures = [((tx.get("transaction") or {}).get("signatures") or [None])[0] for tx in transactions]
+        if not all(signatures):
+            src, dst, attrs, addresses = self._get_network_builder()._extract_edge_ids(transactions)
+            return self.build_from_arrays(src, dst, attrs, addresses)
+        
+        key = hashlib.blake2b(json.dumps([
+            [signature, tx.get("slot")] for signature, tx in zip(signatures, transactions)
+        ]).encode(), digest_size=16).digest()
+        graph_data = self._graph_cache.get(key)
+        if graph_data is None:
+            src, dst, attrs, addresses = self._get_network_builder()._extract_edge_ids(transactions)
+            graph_data = self.build_from_arrays(src, dst, attrs, addresses)
+            self._graph_cache[key] = graph_data
+            if len(self._graph_cache) > self.GRAPH_CACHE_SIZE:
+                self._graph_cache.popitem(last=False)
+        else:
+            self._graph_cache.move_to_end(key)
+        return {"nodes": list(graph_data["nodes"]), "links": list(graph_data["links"])}
+    
+    def build_transaction_graph_streaming(self, transactions: Iterable[Dict]) -> Dict:
+        """
+        Build a transaction graph from an iterable of transactions, consuming it in one pass.
+        
+        Unlike build_transaction_graph the result isn't memoized, so transactions can be a
+        generator and only the extracted edges are held while the graph is built.
+        
+        Args:
+            transactions: Iterable of transaction details
+            
+        Returns:
+            Network graph data structure
+        """
+        src, dst, attrs, addresses = self._get_network_builder()._extract_edge_ids(transactions)
+        return self.build_from_arrays(src, dst, attrs, addresses)
+    
+    def build_transaction_graph_parallel(self, transactions: Iterable[Dict], max_workers: Optional[int] = None) -> Dict:
+        """
+        Build a transaction graph, parsing transfers in a pool of worker processes.
+        
+        Transactions are split into shards of GRAPH_SHARD_SIZE; each worker returns its
+        shard's edges as int32 address ids plus its own address table, and the shards are
+        remapped onto one table and concatenated before the graph is assembled. Like
+        build_transaction_graph_streaming, the result isn't memoized.
+        
+        Args:
+            transactions: Iterable of transaction details
+            max_workers: Worker processes; defaults to the number of CPUs
+            
         Returns:
             Network graph data structure
         """
-        from scripts.analysis.network_builder import NetworkBuilder
+        import numpy as np
+        import pandas as pd
         
-        network_builder = NetworkBuilder(helius_client=self.helius_client)
+        iterator = iter(transactions)
+        shards = iter(lambda: list(islice(iterator, self.GRAPH_SHARD_SIZE)), [])
         
-        graph = network_builder.build_transaction_graph(transactions)
-        graph_data = network_builder._export_graph_to_d3_format_data(graph)
+        address_ids = {}
+        srcs, dsts, attrs_list = [], [], []
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            for src, dst, attrs, addresses in pool.map(_extract_edge_shard, shards):
+                # Map this shard's address ids onto the combined table
+                remap = np.fromiter((address_ids.setdefault(address, len(address_ids)) for address in addresses),
+                                    dtype=np.int32, count=len(addresses))
+                srcs.append(remap[src])
+                dsts.append(remap[dst])
+                attrs_list.append(attrs)
         
-        return graph_data
+        if not attrs_list:
+            return {"nodes": [], "links": []}
+        return self.build_from_arrays(np.concatenate(srcs), np.concatenate(dsts),
+                                      pd.concat(attrs_list, ignore_index=True), list(address_ids))
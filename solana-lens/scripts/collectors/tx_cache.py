@@ -0,0 +1,134 @@
+import os
+import json
+import sqlite3
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode()
+
+
+class TransactionCache:
+    """
+    On-disk cache of finalized transaction details keyed by signature.
+
+    Finalized transactions never change, so entries are kept indefinitely and
+    repeated runs only need to fetch signatures they have not seen before.
+    Recently used entries are also kept decoded in memory, shared by every cache
+    opened on the same file, so collectors revisiting the same signatures within
+    a run skip the SQLite read and JSON decode.
+    """
+
+    # SQLite limits the number of bound parameters per statement
+    _LOOKUP_CHUNK = 500
+
+    # In-memory LRU layers, one per database file: path -> OrderedDict(signature -> transaction)
+    _memory_layers: Dict[str, OrderedDict] = {}
+
+    def __init__(self, path: str, memory_size: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file; parent directories are created on first use
+            memory_size: Transactions kept decoded in memory; 0 disables the in-memory layer
+        """
+        self.path = path
+        self.memory_size = memory_size
+        self._memory = self._memory_layers.setdefault(os.path.abspath(path), OrderedDict())
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS transactions (signature TEXT PRIMARY KEY, data BLOB NOT NULL)"
+            )
+        return self._conn
+
+    @staticmethod
+    def is_cacheable(sig_info: Dict, tx: Dict) -> bool:
+        """Return True if a fetched transaction is finalized and succeeded, so it can be kept forever."""
+        return (
+            sig_info.get("confirmationStatus", "finalized") == "finalized"
+            and tx.get("blockTime") is not None
+            and (tx.get("meta") or {}).get("err") is None
+        )
+
+    def _remember(self, items: Iterable[Tuple[str, Dict]]) -> None:
+        """Put transactions in the in-memory layer, evicting the least recently used beyond memory_size."""
+        if self.memory_size <= 0:
+            return
+        memory = self._memory
+        for signature, tx in items:
+            memory[signature] = tx
+            memory.move_to_end(signature)
+        while len(memory) > self.memory_size:
+            memory.popitem(last=False)
+
+    def get_many(self, signatures: List[str]) -> Dict[str, Dict]:
+        """
+        Look up cached transactions.
+
+        Args:
+            signatures: Signatures to look up
+
+        Returns:
+            Mapping of signature to transaction for the signatures that were cached
+        """
+        found = {}
+        memory = self._memory
+        missing = []
+        for signature in signatures:
+            tx = memory.get(signature)
+            if tx is None:
+                missing.append(signature)
+            else:
+                memory.move_to_end(signature)
+                found[signature] = tx
+        if not missing:
+            return found
+
+        conn = self._connect()
+        loaded = []
+        for i in range(0, len(missing), self._LOOKUP_CHUNK):
+            chunk = missing[i:i + self._LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT signature, data FROM transactions WHERE signature IN ({placeholders})", chunk
+            )
+            for signature, data in rows:
+                loaded.append((signature, _json_loads(data)))
+        found.update(loaded)
+        self._remember(loaded)
+        return found
+
+    def set_many(self, items: Iterable[Tuple[str, Dict]]) -> None:
+        """
+        Store transactions.
+
+        Args:
+            items: (signature, transaction) pairs
+        """
+        items = list(items)
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO transactions (signature, data) VALUES (?, ?)",
+                ((signature, _json_dumps(tx)) for signature, tx in items)
+            )
+        self._remember(items)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,8 +1,11 @@
+import asyncio
+import time
 import requests
-import json
 from typing import Dict, List, Any, Optional, Union
 
-class VybeClient:
+from .base_client import BaseApiClient, _json_dumps, aiohttp
+
+class VybeClient(BaseApiClient):
     """
     Client for interacting with the Vybe API for Solana blockchain analytics.
     
@@ -10,32 +13,103 @@ class VybeClient:
     program analytics, and market/price data.
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://api.vybe.xyz/v1"):
+    # Endpoints without path parameters, whose full URLs are built once per base URL
+    _ENDPOINTS = ("account/known-accounts", "token/transfers", "token/trades", "price/markets")
+    
+    # Seconds to reuse cached responses: reference lists change hourly, activity overviews within a minute
+    REFERENCE_CACHE_TTL = 3600
+    DETAILS_CACHE_TTL = 30
+    OHLCV_CACHE_TTL = 300
+    
+    # Circuit breaker: consecutive failures after which a base URL is skipped, and for how many seconds
+    MIRROR_FAILURE_LIMIT = 5
+    MIRROR_COOLDOWN = 30
+    
+    # Keep-alive pools of the default requests session, and cached GET responses kept
+    POOL_CONNECTIONS = 32
+    CACHE_SIZE = 4096
+    
+    def __init__(self, api_key: str, base_url: str = "https://api.vybe.xyz/v1",
+                 session: Optional[requests.Session] = None, requests_per_second: float = 20,
+                 mirror_urls: Optional[List[str]] = None, hedge_delay: float = 0.08,
+                 shared_pool: bool = False):
         """
         Initialize the Vybe API client.
         
         Args:
             api_key (str): API key for authentication
             base_url (str, optional): Base URL for the API.
+            session (requests.Session, optional): Session to reuse connections from.
+                A new session is created if not provided.
+            requests_per_second (float, optional): Request budget for the async methods.
+                Defaults to 20.
+            mirror_urls (List[str], optional): Base URLs of equivalent deployments. Requests fail
+                over to them when a base URL errors or its circuit breaker is open, and async
+                cached reads are hedged: if base_url has not answered within hedge_delay, the
+                request is also sent to the first healthy mirror and the slower one is cancelled.
+            hedge_delay (float, optional): Seconds to wait before hedging. Defaults to 0.08.
+            shared_pool (bool, optional): Open async connections from the connector shared by
+                all API clients (see connection_pool) instead of a private pool. Defaults to False.
         """
         self.api_key = api_key
-        self.base_url = base_url
-        self.headers = {
+        super().__init__(base_url, headers={
             "X-API-KEY": self.api_key,
             "Content-Type": "application/json",
             "Accept": "application/json"
-        }
+        }, session=session, requests_per_second=requests_per_second, shared_pool=shared_pool)
+        self.base_urls = [base_url] + list(mirror_urls or [])
+        # Per base URL: fixed endpoint -> full URL
+        self._base_endpoint_urls = [
+            {endpoint: f"{url}/{endpoint}" for endpoint in self._ENDPOINTS} for url in self.base_urls
+        ]
+        self.hedge_delay = hedge_delay
+        # Consecutive failures and circuit-breaker cooldown deadline per base URL
+        self._url_failures = [0] * len(self.base_urls)
+        self._url_disabled_until = [0.0] * len(self.base_urls)
+    
+    def _open_urls(self, base_url: Optional[str] = None) -> List[int]:
+        """
+        Return the indices of the base URLs to try, in preference order.
+        
+        Base URLs whose circuit breaker is open are skipped; if every breaker is open,
+        all of them are tried again rather than failing without a request.
+        
+        Args:
+            base_url (str, optional): Restrict to this base URL. Defaults to None (all of them).
+        """
+        if base_url is not None:
+            return [self.base_urls.index(base_url)]
+        now = time.monotonic()
+        indices = [i for i in range(len(self.base_urls)) if self._url_disabled_until[i] <= now]
+        return indices or list(range(len(self.base_urls)))
+    
+    def _record_failure(self, index: int) -> None:
+        """Count a provider failure for base_urls[index], opening its breaker at the limit."""
+        self._url_failures[index] += 1
+        if self._url_failures[index] >= self.MIRROR_FAILURE_LIMIT:
+            self._url_disabled_until[index] = time.monotonic() + self.MIRROR_COOLDOWN
+            self._url_failures[index] = 0
+    
+    def _record_success(self, index: int) -> None:
+        """Reset the consecutive failure count for base_urls[index]."""
+        self._url_failures[index] = 0
     
     def _make_request(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None, 
-                     data: Optional[Dict] = None) -> Dict:
+                     data: Optional[Dict] = None, base_url: Optional[str] = None) -> Dict:
         """
         Make a request to the Vybe API.
         
+        Connection errors and server errors that survive the adapter's retries count
+        against the base URL's circuit breaker and fail over to the next base URL.
+        Other client errors are raised immediately, since every provider would reject
+        the same request.
+        
         Args:
             endpoint (str): API endpoint to call
             method (str, optional): HTTP method. Defaults to "GET".
             params (Dict, optional): Query parameters. Defaults to None.
             data (Dict, optional): Request body. Defaults to None.
+            base_url (str, optional): Only send the request to this base URL. Defaults to None.
             
         Returns:
             Dict: Response from the API
@@ -43,27 +117,125 @@ class VybeClient:
         Raises:
             Exception: If the API request fails
         """
-        url = f"{self.base_url}/{endpoint}"
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=self.headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=self.headers, params=params, json=data)
+        error = None
+        for index in self._open_urls(base_url):
+            url = self._base_endpoint_urls[index].get(endpoint) or f"{self.base_urls[index]}/{endpoint}"
+            try:
+                result = self._send(method, url, params, data)
+            except requests.exceptions.RequestException as e:
+                error, status = self._request_error(e)
+                if status is not None and status not in self.RETRY_STATUSES:
+                    raise error
+                self._record_failure(index)
+                continue
+            self._record_success(index)
+            return result
+        raise error
+    
+    async def _make_request_async(self, endpoint: str, method: str = "GET", params: Optional[Dict] = None,
+                                  data: Optional[Dict] = None, base_url: Optional[str] = None) -> Dict:
+        """
+        Async version of _make_request using a pooled aiohttp session.
+        
+        Requests are paced by the shared token bucket. Rate-limited (429) and transient
+        server errors are retried with exponential backoff, honoring Retry-After, and
+        fail over to the next base URL like the sync version once retries run out.
+        
+        Args:
+            endpoint (str): API endpoint to call
+            method (str, optional): HTTP method. Defaults to "GET".
+            params (Dict, optional): Query parameters. Defaults to None.
+            data (Dict, optional): Request body. Defaults to None.
+            base_url (str, optional): Only send the request to this base URL. Defaults to None.
+            
+        Returns:
+            Dict: Response from the API
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        if aiohttp is None:
+            await self._get_rate_limiter().acquire()
+            return await asyncio.to_thread(self._make_request, endpoint, method, params, data, base_url)
+        
+        if method not in ("GET", "POST"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        body = _json_dumps(data) if method == "POST" and data is not None else None
+        session = await self._ensure_session()
+        limiter = self._get_rate_limiter()
+        error = None
+        for index in self._open_urls(base_url):
+            url = self._base_endpoint_urls[index].get(endpoint) or f"{self.base_urls[index]}/{endpoint}"
+            try:
+                status, payload = await self._send_async(session, limiter, method, url, params, body)
+            except aiohttp.ClientError as e:
+                error = Exception(f"API request failed: {str(e)}")
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                if status < 400:
+                    self._record_success(index)
+                    return payload
+                error = Exception(f"API request failed: status code {status}. Details: {payload}")
+                if status not in self.RETRY_STATUSES:
+                    raise error
+            self._record_failure(index)
+        raise error
+    
+    async def _hedged_get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """
+        GET an idempotent endpoint, hedging slow or failed requests to a mirror.
+        
+        The request goes to the first healthy base URL. If it has not succeeded within
+        hedge_delay seconds, the same request is sent to the next healthy base URL and
+        whichever succeeds first wins; the other is cancelled.
+        
+        Args:
+            endpoint (str): API endpoint to call
+            params (Dict, optional): Query parameters. Defaults to None.
             
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg += f". Details: {json.dumps(error_data)}"
-                except:
-                    error_msg += f". Status code: {e.response.status_code}"
-            raise Exception(error_msg)
+        Returns:
+            Dict: Response from the API
+            
+        Raises:
+            Exception: If every attempted base URL fails
+        """
+        healthy = self._open_urls()
+        if len(healthy) < 2:
+            return await self._make_request_async(endpoint, params=params)
+        
+        primary, backup = (self.base_urls[i] for i in healthy[:2])
+        tasks = {asyncio.ensure_future(self._make_request_async(endpoint, params=params, base_url=primary))}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay)
+            if not done or next(iter(done)).exception() is not None:
+                tasks.add(asyncio.ensure_future(self._make_request_async(endpoint, params=params, base_url=backup)))
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _get_async(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """GET an endpoint for _cached_request_async on a cache miss, hedging across mirror_urls."""
+        return await self._hedged_get(endpoint, params=params)
+    
+    def invalidate(self, endpoint_prefix: str = "") -> None:
+        """
+        Drop cached responses for endpoints starting with endpoint_prefix.
+        
+        Args:
+            endpoint_prefix (str, optional): Endpoint prefix, e.g. "token/". Defaults to "" (everything).
+        """
+        self._cache.evict(lambda key: key[0].startswith(endpoint_prefix))
     
     # Account Endpoints
     
@@ -79,7 +251,19 @@ class VybeClient:
         Returns:
             Dict: List of known accounts
         """
-        return self._make_request("account/known-accounts", params=query_params)
+        return self._cached_request("account/known-accounts", params=query_params, ttl=self.REFERENCE_CACHE_TTL)
+    
+    async def get_known_accounts_async(self, query_params: Optional[Dict] = None) -> Dict:
+        """
+        Async version of get_known_accounts.
+        
+        Args:
+            query_params (Dict, optional): Query parameters for filtering. Defaults to None.
+                
+        Returns:
+            Dict: List of known accounts
+        """
+        return await self._cached_request_async("account/known-accounts", params=query_params, ttl=self.REFERENCE_CACHE_TTL)
     
     def get_token_balance(self, owner_address: str, query_params: Optional[Dict] = None) -> Dict:
         """
@@ -121,7 +305,19 @@ class VybeClient:
         Returns:
             Dict: Program details and metrics
         """
-        return self._make_request(f"program/{program_id}")
+        return self._cached_request(f"program/{program_id}", ttl=self.DETAILS_CACHE_TTL)
+    
+    async def get_program_details_async(self, program_id: str) -> Dict:
+        """
+        Async version of get_program_details.
+        
+        Args:
+            program_id (str): The program ID
+                
+        Returns:
+            Dict: Program details and metrics
+        """
+        return await self._cached_request_async(f"program/{program_id}", ttl=self.DETAILS_CACHE_TTL)
     
     def get_program_active_users(self, program_id: str, query_params: Optional[Dict] = None) -> Dict:
         """
@@ -163,7 +359,19 @@ class VybeClient:
         Returns:
             Dict: Token details and activity
         """
-        return self._make_request(f"token/{mint_address}")
+        return self._cached_request(f"token/{mint_address}", ttl=self.DETAILS_CACHE_TTL)
+    
+    async def get_token_details_async(self, mint_address: str) -> Dict:
+        """
+        Async version of get_token_details.
+        
+        Args:
+            mint_address (str): The token mint address
+                
+        Returns:
+            Dict: Token details and activity
+        """
+        return await self._cached_request_async(f"token/{mint_address}", ttl=self.DETAILS_CACHE_TTL)
     
     def get_token_top_holders(self, mint_address: str, query_params: Optional[Dict] = None) -> Dict:
         """
@@ -179,6 +387,19 @@ class VybeClient:
         """
         return self._make_request(f"token/{mint_address}/top-holders", params=query_params)
     
+    async def get_token_top_holders_async(self, mint_address: str, query_params: Optional[Dict] = None) -> Dict:
+        """
+        Async version of get_token_top_holders.
+        
+        Args:
+            mint_address (str): The token mint address
+            query_params (Dict, optional): Query parameters. Defaults to None.
+                
+        Returns:
+            Dict: List of top token holders
+        """
+        return await self._make_request_async(f"token/{mint_address}/top-holders", params=query_params)
+    
     def get_token_transfers(self, query_params: Optional[Dict] = None) -> Dict:
         """
         Get token transfer transactions with filtering options.
@@ -203,6 +424,18 @@ class VybeClient:
         """
         return self._make_request("token/trades", params=query_params)
     
+    async def get_token_trades_async(self, query_params: Optional[Dict] = None) -> Dict:
+        """
+        Async version of get_token_trades.
+        
+        Args:
+            query_params (Dict, optional): Query parameters for filtering. Defaults to None.
+                
+        Returns:
+            Dict: Token trade data
+        """
+        return await self._make_request_async("token/trades", params=query_params)
+    
     # Market/Price Endpoints
     
     def get_token_ohlcv(self, mint_address: str, query_params: Optional[Dict] = None) -> Dict:
@@ -217,7 +450,20 @@ class VybeClient:
         Returns:
             Dict: OHLC price data
         """
-        return self._make_request(f"price/{mint_address}/token-ohlcv", params=query_params)
+        return self._cached_request(f"price/{mint_address}/token-ohlcv", params=query_params, ttl=self.OHLCV_CACHE_TTL)
+    
+    async def get_token_ohlcv_async(self, mint_address: str, query_params: Optional[Dict] = None) -> Dict:
+        """
+        Async version of get_token_ohlcv.
+        
+        Args:
+            mint_address (str): The token mint address
+            query_params (Dict, optional): Query parameters. Defaults to None.
+                
+        Returns:
+            Dict: OHLC price data
+        """
+        return await self._cached_request_async(f"price/{mint_address}/token-ohlcv", params=query_params, ttl=self.OHLCV_CACHE_TTL)
     
     def get_markets(self) -> Dict:
         """
@@ -226,4 +472,13 @@ class VybeClient:
         Returns:
             Dict: List of market IDs
         """
-        return self._make_request("price/markets")
\ No newline at end of file
+        return self._cached_request("price/markets", ttl=self.REFERENCE_CACHE_TTL)
+    
+    async def get_markets_async(self) -> Dict:
+        """
+        Async version of get_markets.
+        
+        Returns:
+            Dict: List of market IDs
+        """
+        return await self._cached_request_async("price/markets", ttl=self.REFERENCE_CACHE_TTL)
\ No newline at end of file
@@ -1,23 +1,74 @@
 import csv
+import gzip
+from itertools import chain, islice
 
-def export_to_csv(data, filepath):
+# Below this many rows the per-row DictWriter is cheaper than importing pandas
+VECTORIZE_MIN_ROWS = 1000
+
+# gzip level for compressed exports; low levels already shrink repetitive CSV severalfold
+GZIP_COMPRESSLEVEL = 3
+
+def _iter_chunks(rows, size):
+    """Yield successive lists of up to size rows from an iterator."""
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+def export_to_csv(rows, filepath, compress=True, chunk=4096):
     """
-    Exports data to a CSV file.
+    Exports data to a CSV file, gzip-compressed by default.
+
+    Rows may be a list or any iterable (e.g. a generator), which is written in chunks
+    without being materialized. Large lists are serialized column-wise through pandas.
 
     Args:
-        data (list of dict): The data to be exported. Each dictionary represents a row.
-        filepath (str): The path to the CSV file.
+        rows (iterable of dict): The data to be exported. Each dictionary represents a row;
+            the first row's keys become the header.
+        filepath (str): The path to the CSV file. ".gz" is appended when compressing.
+        compress (bool): Whether to gzip the output. Defaults to True.
+        chunk (int): Number of rows written per batch when streaming. Defaults to 4096.
+
+    Returns:
+        str: The path written to.
     """
+    if compress and not filepath.endswith('.gz'):
+        filepath += '.gz'
     try:
-        with open(filepath, 'w', newline='') as f:
-            if data:
-                fieldnames = data[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(data)
-            print(f"Data successfully exported to {filepath}")
+        if isinstance(rows, list) and len(rows) >= VECTORIZE_MIN_ROWS:
+            import pandas as pd
+            fieldnames = list(rows[0].keys())
+            known = set(fieldnames)
+            for row in rows:
+                # Reject unknown keys like DictWriter does instead of silently dropping them
+                wrong_fields = row.keys() - known
+                if wrong_fields:
+                    raise ValueError("dict contains fields not in fieldnames: "
+                                     + ", ".join(repr(x) for x in wrong_fields))
+            # dtype=object keeps values as given (ints with gaps are not widened to float);
+            # missing keys and None are written as empty fields, matching DictWriter
+            df = pd.DataFrame(rows, columns=fieldnames, dtype=object)
+            compression = {'method': 'gzip', 'compresslevel': GZIP_COMPRESSLEVEL} if compress else None
+            # Use DictWriter's \r\n line endings, so the bytes written don't depend on the path taken
+            df.to_csv(filepath, index=False, chunksize=65536, compression=compression, lineterminator='\r\n')
+        else:
+            rows = iter(rows)
+            first = next(rows, None)
+            if compress:
+                f = gzip.open(filepath, 'wt', compresslevel=GZIP_COMPRESSLEVEL, newline='')
+            else:
+                f = open(filepath, 'w', newline='')
+            with f:
+                if first is not None:
+                    writer = csv.DictWriter(f, fieldnames=first.keys())
+                    writer.writeheader()
+                    for batch in _iter_chunks(chain((first,), rows), chunk):
+                        writer.writerows(batch)
+        print(f"Data successfully exported to {filepath}")
     except Exception as e:
         print(f"Error exporting to CSV: {e}")
+    return filepath
 
 if __name__ == '__main__':
     # Example usage
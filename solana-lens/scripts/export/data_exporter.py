@@ -1,11 +1,186 @@
-import json
 import csv
-import pandas as pd
+import dataclasses
+import gzip
+import html as html_lib
+import io
+import json
 import os
-from typing import Dict, List, Any, Optional, Union
+import shutil
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Any, Optional, Sequence, Union
 import logging
 from datetime import datetime
 
+if TYPE_CHECKING:
+    # pandas costs hundreds of milliseconds to import; the methods that need it import it on first call
+    import pandas as pd
+
+try:
+    import orjson
+    
+    def _encode_json(obj: Any, pretty: bool = True) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option)
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    def _json_default(obj: Any) -> Any:
+        # orjson encodes dataclass records (such as graph nodes and links) natively
+        if dataclasses.is_dataclass(obj):
+            return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+        return str(obj)
+    
+    def _encode_json(obj: Any, pretty: bool = True) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=2, default=_json_default).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+# Write buffer for text exports; large enough that row-by-row CSV writes rarely hit a syscall
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Directories already created by this process, so repeated exports skip the stat/mkdir syscalls
+_ensured_dirs = set()
+
+def _ensure_dir(directory: str) -> None:
+    """Create directory (and parents) unless this process already has."""
+    if directory and directory not in _ensured_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+def _write_text(text: str, path: str) -> None:
+    """Encode text as UTF-8 once and write it to path in one call."""
+    with open(path, 'wb') as f:
+        f.write(text.encode('utf-8'))
+
+def _open_csv(path: str) -> io.TextIOWrapper:
+    """Open path for csv writing through a large write buffer."""
+    return io.TextIOWrapper(open(path, 'wb', buffering=_WRITE_BUFFER_SIZE), encoding='utf-8', newline='')
+
+def _write_csv_rows(path: str, fields: Sequence[str], records: Iterable[Dict], extrasaction: str = 'raise') -> None:
+    """
+    Write dict records to path as CSV with the given columns.
+    
+    Rows are pulled out as tuples with one itemgetter call and fed to csv.writer, which avoids
+    DictWriter's per-cell dict lookups. Records missing a column get an empty cell. Like
+    DictWriter, a record with keys outside fields raises ValueError unless extrasaction is
+    'ignore'.
+    """
+    get = itemgetter(*fields)
+    single = len(fields) == 1
+    check_extras = extrasaction == 'raise'
+    field_set = frozenset(fields)
+    
+    def wrong_fields_error(record: Dict) -> ValueError:
+        return ValueError("dict contains fields not in fieldnames: "
+                          + ", ".join(repr(x) for x in record.keys() - field_set))
+    
+    def rows():
+        for record in records:
+            try:
+                values = get(record)
+            except KeyError:
+                if check_extras and record.keys() - field_set:
+                    raise wrong_fields_error(record)
+                yield tuple(record.get(field) for field in fields)
+                continue
+            # Every column is present, so any further key is one outside fields
+            if check_extras and len(record) > len(field_set):
+                raise wrong_fields_error(record)
+            yield (values,) if single else values
+    
+    with _open_csv(path) as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(fields)
+        writer.writerows(rows())
+
+# Cells per to_csv chunk: amortizes pandas' C formatter while bounding the string buffer in memory
+_CSV_CHUNK_CELLS = 1_000_000
+
+# Filename suffixes for which pandas' compression='infer' compresses the CSV
+_COMPRESSED_SUFFIXES = ('.gz', '.bz2', '.zip', '.xz', '.zst')
+
+def _csv_chunksize(df: 'pd.DataFrame') -> int:
+    """Rows per to_csv chunk for df, targeting about _CSV_CHUNK_CELLS cells."""
+    return max(1, _CSV_CHUNK_CELLS // max(1, len(df.columns)))
+
+# Fast gzip level for visualization JSON: most of the size win for little extra CPU
+_GZIP_COMPRESSLEVEL = 1
+
+@contextmanager
+def _atomic_open(path: str, buffering: int = -1, compress: bool = False):
+    """
+    Open a temporary sibling of path for binary writing and rename it over path on success.
+    
+    Readers polling path (e.g. a dashboard fetching *_latest.json) see either the old file or
+    the complete new one, never a half-written file. With compress, writes are gzipped.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb', buffering=buffering) as f:
+            if compress:
+                with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=_GZIP_COMPRESSLEVEL, mtime=0) as gz:
+                    yield gz
+            else:
+                yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _write_json(obj: Any, path: str, pretty: bool = True, compress: bool = False) -> None:
+    """Serialize obj to UTF-8 JSON bytes and atomically replace path with them in one write."""
+    with _atomic_open(path, compress=compress) as f:
+        f.write(_encode_json(obj, pretty))
+
+def _write_json_arrays(path: str, arrays: Dict[str, Iterable], extra: Optional[Dict] = None,
+                       compress: bool = False) -> None:
+    """
+    Write a JSON object of arrays (plus small extra fields) one item at a time.
+    
+    Only one array item is encoded at once, so memory stays proportional to the largest
+    item rather than the whole payload. Each item goes on its own line, and path is replaced
+    atomically once the object is complete.
+    """
+    with _atomic_open(path, _WRITE_BUFFER_SIZE, compress) as f:
+        separator = b'{'
+        for key, items in arrays.items():
+            f.write(separator + _encode_json(key, False) + b':[')
+            item_separator = b'\n'
+            for item in items:
+                f.write(item_separator + _encode_json(item, False))
+                item_separator = b',\n'
+            f.write(b'\n]')
+            separator = b',\n'
+        for key, value in (extra or {}).items():
+            f.write(separator + _encode_json(key, False) + b':' + _encode_json(value, False))
+            separator = b',\n'
+        f.write(b'}\n' if separator != b'{' else b'{}\n')
+
+def _require_pyarrow() -> None:
+    """Import pyarrow on first use of a columnar export; it is only needed for parquet/feather."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError("Parquet and Feather exports require pyarrow (pip install pyarrow)") from e
+
+def _link_latest(filepath: str, latest_filepath: str) -> None:
+    """
+    Point latest_filepath at the file just written: a hard link where possible, else a byte copy.
+    
+    The link or copy is made under a temporary name and renamed into place, so latest_filepath
+    never disappears or holds a partial file.
+    """
+    tmp_path = latest_filepath + '.tmp'
+    if os.path.lexists(tmp_path):
+        os.remove(tmp_path)
+    try:
+        os.link(filepath, tmp_path)
+    except OSError:
+        shutil.copyfile(filepath, tmp_path)
+    os.replace(tmp_path, latest_filepath)
+
 class DataExporter:
     """
     Utility for exporting analysis data to various formats for visualization and reporting.
@@ -14,19 +189,43 @@ class DataExporter:
     visualization tools and research reports.
     """
     
-    def __init__(self, output_dir: str = 'data'):
+    def __init__(self, output_dir: str = 'data', dataset_types: Iterable[str] = ('network', 'timeline'),
+                 run_ts: Optional[datetime] = None):
         """
         Initialize the data exporter with an output directory.
         
         Args:
             output_dir (str): Base directory for data output
+            dataset_types (Iterable[str], optional): Visualization subdirectories to create up front
+            run_ts (datetime, optional): Timestamp used for every export's file name and metadata,
+                so one run's files share it. Defaults to the time of each export.
         """
         self.output_dir = output_dir
+        self.run_ts = run_ts
         # Create shared data directory structure if needed
         self.viz_data_dir = os.path.join(output_dir, 'viz')
-        os.makedirs(self.viz_data_dir, exist_ok=True)
+        _ensure_dir(self.viz_data_dir)
+        
+        # Visualization subdirectories by dataset type, created once and reused by every export
+        self._dirs = {}
+        for dataset_type in dataset_types:
+            self._viz_dir(dataset_type)
+    
+    def _now(self) -> datetime:
+        """Return the run timestamp if one was given, else the current time."""
+        return self.run_ts or datetime.now()
+    
+    def _viz_dir(self, dataset_type: str) -> str:
+        """Return the visualization subdirectory for dataset_type, creating it on first use."""
+        directory = self._dirs.get(dataset_type)
+        if directory is None:
+            directory = os.path.join(self.viz_data_dir, dataset_type)
+            _ensure_dir(directory)
+            self._dirs[dataset_type] = directory
+        return directory
     
-    def export_for_visualization(self, data: Any, dataset_name: str, dataset_type: str = None):
+    def export_for_visualization(self, data: Any, dataset_name: str, dataset_type: str = None,
+                                 pretty: bool = False, compress: bool = False):
         """
         Export data specifically formatted for visualizations.
         
@@ -34,38 +233,39 @@ class DataExporter:
             data: The data to export (dict, list, etc.)
             dataset_name (str): Name of the dataset
             dataset_type (str, optional): Type of the dataset (e.g., 'network', 'timeline')
+            pretty (bool, optional): Indent the JSON for debugging. Defaults to compact output,
+                which the D3 frontends read just the same.
+            compress (bool, optional): Write gzipped '.json.gz' files that web servers can
+                serve with Content-Encoding: gzip. Defaults to False.
         
         Returns:
             str: Path to the exported file
         """
         # Create a subfolder for the specific visualization type if provided
-        target_dir = self.viz_data_dir
-        if dataset_type:
-            target_dir = os.path.join(self.viz_data_dir, dataset_type)
-            os.makedirs(target_dir, exist_ok=True)
+        target_dir = self._viz_dir(dataset_type) if dataset_type else self.viz_data_dir
         
         # Add timestamp to filename to avoid overwrites
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{dataset_name}_{timestamp}.json"
+        now = self._now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        suffix = ".json.gz" if compress else ".json"
+        filename = f"{dataset_name}_{timestamp}{suffix}"
         filepath = os.path.join(target_dir, filename)
         
         # Create a metadata wrapper for the data
         metadata = {
             "dataset_name": dataset_name,
             "dataset_type": dataset_type,
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
             "data": data
         }
         
         # Write to JSON file
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, default=str)
+            _write_json(metadata, filepath, pretty, compress)
             
             # Also create a "latest" version for easy access
-            latest_filepath = os.path.join(target_dir, f"{dataset_name}_latest.json")
-            with open(latest_filepath, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, default=str)
+            latest_filepath = os.path.join(target_dir, f"{dataset_name}_latest{suffix}")
+            _link_latest(filepath, latest_filepath)
                 
             logging.info(f"Data exported for visualization to {filepath}")
             return filepath
@@ -88,13 +288,12 @@ class DataExporter:
         directory = self.output_dir
         if subdirectory:
             directory = os.path.join(directory, subdirectory)
-            os.makedirs(directory, exist_ok=True)
+            _ensure_dir(directory)
             
         filepath = os.path.join(directory, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+            _write_json(data, filepath)
             logging.info(f"Data exported to {filepath}")
             return filepath
         except Exception as e:
@@ -120,15 +319,12 @@ class DataExporter:
         directory = self.output_dir
         if subdirectory:
             directory = os.path.join(directory, subdirectory)
-            os.makedirs(directory, exist_ok=True)
+            _ensure_dir(directory)
             
         filepath = os.path.join(directory, filename)
         
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
+            _write_csv_rows(filepath, list(data[0].keys()), data)
             logging.info(f"Data exported to {filepath}")
             return filepath
         except Exception as e:
@@ -139,45 +335,48 @@ class DataExporter:
                          nodes: List[Dict], 
                          links: List[Dict], 
                          name: str, 
-                         metadata: Dict = None) -> str:
+                         metadata: Dict = None,
+                         pretty: bool = False,
+                         compress: bool = False) -> str:
         """
         Export network graph data in the format expected by D3 visualizations.
         
         Args:
-            nodes (List[Dict]): List of node objects
-            links (List[Dict]): List of link objects
+            nodes (List[Dict]): List of node objects (dicts or dataclass records)
+            links (List[Dict]): List of link objects (dicts or dataclass records)
             name (str): Name of the graph
             metadata (Dict, optional): Additional metadata
+            pretty (bool, optional): Indent the JSON for debugging. Defaults to compact,
+                streamed output.
+            compress (bool, optional): Write gzipped '.json.gz' files. Defaults to False.
             
         Returns:
             str: Path to the exported file
         """
-        graph_data = {
-            "nodes": nodes,
-            "links": links,
-            "metadata": metadata or {
-                "name": name,
-                "generated_at": datetime.now().isoformat()
-            }
+        now = self._now()
+        metadata = metadata or {
+            "name": name,
+            "generated_at": now.isoformat()
         }
         
-        # Ensure the network directory exists
-        network_dir = os.path.join(self.viz_data_dir, 'network')
-        os.makedirs(network_dir, exist_ok=True)
+        network_dir = self._viz_dir('network')
         
         # Create timestamp and filename
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{name}_network_{timestamp}.json"
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        suffix = ".json.gz" if compress else ".json"
+        filename = f"{name}_network_{timestamp}{suffix}"
         filepath = os.path.join(network_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(graph_data, f, indent=2, default=str)
+            if pretty:
+                _write_json({"nodes": nodes, "links": links, "metadata": metadata}, filepath, True, compress)
+            else:
+                # Stream nodes and links instead of encoding the whole graph in memory at once
+                _write_json_arrays(filepath, {"nodes": nodes, "links": links}, {"metadata": metadata}, compress)
             
             # Also create a "latest" version
-            latest_filepath = os.path.join(network_dir, f"{name}_network_latest.json")
-            with open(latest_filepath, 'w', encoding='utf-8') as f:
-                json.dump(graph_data, f, indent=2, default=str)
+            latest_filepath = os.path.join(network_dir, f"{name}_network_latest{suffix}")
+            _link_latest(filepath, latest_filepath)
                 
             logging.info(f"Network graph data exported to {filepath}")
             return filepath
@@ -186,7 +385,8 @@ class DataExporter:
             return None
 
     @staticmethod
-    def export_to_csv(data: Union[List[Dict], pd.DataFrame], filename: str, index: bool = False) -> None:
+    def export_to_csv(data: Union[List[Dict], 'pd.DataFrame'], filename: str, index: bool = False,
+                      use_pandas: bool = False) -> None:
         """
         Export data to CSV file.
         
@@ -194,9 +394,23 @@ class DataExporter:
             data (Union[List[Dict], pd.DataFrame]): Data to export
             filename (str): Output filename
             index (bool, optional): Whether to include index. Defaults to False.
+            use_pandas (bool, optional): Route a list of dicts through a DataFrame even when
+                the plain csv writer could handle it. Defaults to False.
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
+        
+        # A list of dicts only needs row iteration, so skip the DataFrame transpose when
+        # no index column or compression is wanted
+        if (isinstance(data, list) and data and not use_pandas and not index
+                and not filename.endswith(_COMPRESSED_SUFFIXES)):
+            # Columns in order of first appearance, as pd.DataFrame would lay them out
+            fields = list(dict.fromkeys(key for record in data for key in record))
+            _write_csv_rows(filename, fields, data)
+            print(f"Data exported to CSV: {filename}")
+            return
+        
+        import pandas as pd
         
         # Convert list of dicts to DataFrame if necessary
         if isinstance(data, list):
@@ -204,10 +418,54 @@ class DataExporter:
         else:
             df = data
         
-        # Export to CSV
-        df.to_csv(filename, index=index)
+        # Export to CSV in bounded chunks; a .gz/.bz2/.zip suffix picks the compression
+        df.to_csv(filename, index=index, chunksize=_csv_chunksize(df), compression='infer')
         print(f"Data exported to CSV: {filename}")
 
+    @staticmethod
+    def export_to_parquet(data: Union[List[Dict], 'pd.DataFrame'], filename: str, compression: str = 'zstd') -> None:
+        """
+        Export data to a Parquet file.
+        
+        Parquet files are several times smaller than CSV and much faster to read back
+        with pandas, so prefer this format for anything re-loaded by later analysis.
+        
+        Args:
+            data (Union[List[Dict], pd.DataFrame]): Data to export
+            filename (str): Output filename
+            compression (str, optional): Parquet codec. Defaults to 'zstd'.
+        """
+        _require_pyarrow()
+        import pandas as pd
+        
+        # Ensure directory exists
+        _ensure_dir(os.path.dirname(filename))
+        
+        df = pd.DataFrame(data) if isinstance(data, list) else data
+        df.to_parquet(filename, engine='pyarrow', compression=compression, index=False)
+        print(f"Data exported to Parquet: {filename}")
+
+    @staticmethod
+    def export_to_feather(data: Union[List[Dict], 'pd.DataFrame'], filename: str, compression: str = 'lz4') -> None:
+        """
+        Export data to a Feather (Arrow IPC) file.
+        
+        Args:
+            data (Union[List[Dict], pd.DataFrame]): Data to export
+            filename (str): Output filename
+            compression (str, optional): Feather codec. Defaults to 'lz4'.
+        """
+        _require_pyarrow()
+        import pandas as pd
+        
+        # Ensure directory exists
+        _ensure_dir(os.path.dirname(filename))
+        
+        df = pd.DataFrame(data) if isinstance(data, list) else data
+        # Feather requires a default RangeIndex
+        df.reset_index(drop=True).to_feather(filename, compression=compression)
+        print(f"Data exported to Feather: {filename}")
+
     @staticmethod
     def export_to_json(data: Any, filename: str, pretty: bool = True) -> None:
         """
@@ -219,19 +477,15 @@ class DataExporter:
             pretty (bool, optional): Whether to format JSON with indentation. Defaults to True.
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
         
         # Export to JSON
-        with open(filename, 'w') as f:
-            if pretty:
-                json.dump(data, f, indent=2)
-            else:
-                json.dump(data, f)
+        _write_json(data, filename, pretty)
         
         print(f"Data exported to JSON: {filename}")
 
     @staticmethod
-    def export_to_excel(data: Union[Dict[str, pd.DataFrame], pd.DataFrame], filename: str) -> None:
+    def export_to_excel(data: Union[Dict[str, 'pd.DataFrame'], 'pd.DataFrame'], filename: str) -> None:
         """
         Export data to Excel file.
         
@@ -240,7 +494,9 @@ class DataExporter:
             filename (str): Output filename
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
+        
+        import pandas as pd
         
         # Check if data is a dict of DataFrames (for multiple sheets)
         if isinstance(data, dict):
@@ -264,17 +520,10 @@ class DataExporter:
             filename (str): Output filename
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
         
-        # Create D3 format data
-        d3_data = {
-            "nodes": nodes,
-            "links": links
-        }
-        
-        # Export to JSON
-        with open(filename, 'w') as f:
-            json.dump(d3_data, f, indent=2)
+        # Export to D3 format JSON, streaming nodes and links
+        _write_json_arrays(filename, {"nodes": nodes, "links": links})
         
         print(f"Network data exported for D3.js: {filename}")
 
@@ -288,20 +537,19 @@ class DataExporter:
             filename (str): Output filename
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
         
         # Format for Observable
         observable_data = {
             "data": data,
             "metadata": {
-                "exported_at": pd.Timestamp.now().isoformat(),
+                "exported_at": datetime.now().isoformat(),
                 "format_version": "1.0"
             }
         }
         
         # Export to JSON
-        with open(filename, 'w') as f:
-            json.dump(observable_data, f, indent=2)
+        _write_json(observable_data, filename)
         
         print(f"Data exported for Observable: {filename}")
 
@@ -319,52 +567,51 @@ class DataExporter:
             format (str, optional): Output format ('json' or 'csv'). Defaults to "json".
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
         
-        # Format data for charting
-        chart_data = []
-        
-        for item in data:
-            entry = {x_field: item.get(x_field)}
-            
-            for field in y_fields:
-                entry[field] = item.get(field)
-            
-            chart_data.append(entry)
+        fields = [x_field] + y_fields
         
         # Export based on format
         if format.lower() == "csv":
-            with open(filename, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=[x_field] + y_fields)
-                writer.writeheader()
-                writer.writerows(chart_data)
+            # Pull the chart columns straight out of each item; no intermediate rows are built
+            _write_csv_rows(filename, fields, data, extrasaction='ignore')
         else:
-            with open(filename, 'w') as f:
-                json.dump(chart_data, f, indent=2)
+            import pandas as pd
+            
+            # Project straight to the chart columns in one pass instead of a per-cell Python loop
+            df = pd.DataFrame(data, columns=fields, dtype=object)
+            # Missing fields come back as NaN; chart consumers expect null
+            chart_data = df.where(df.notna(), None).to_dict(orient='records')
+            _write_json(chart_data, filename)
         
         print(f"Time series data exported for charting: {filename}")
 
     @staticmethod
-    def export_for_dune(data: pd.DataFrame, filename: str) -> None:
+    def export_for_dune(data: 'pd.DataFrame', filename: str, format: str = "csv") -> None:
         """
         Export data in a format suitable for Dune Analytics.
         
         Args:
             data (pd.DataFrame): Data to export
             filename (str): Output filename
+            format (str, optional): 'csv', or 'parquet' to also write a Parquet sibling
+                for fast local reloads. Defaults to "csv".
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
         
         # Dune typically works with CSV files
-        data.to_csv(filename, index=False)
+        chunksize = _csv_chunksize(data)
+        data.to_csv(filename, index=False, chunksize=chunksize, compression='infer')
         
-        # Also create SQL-friendly column names
-        sql_friendly_df = data.copy()
-        sql_friendly_df.columns = [col.lower().replace(' ', '_') for col in sql_friendly_df.columns]
+        # Also create SQL-friendly column names, passed as header aliases rather than copying the frame
+        sql_columns = list(data.columns.str.lower().str.replace(' ', '_', regex=False))
         
         sql_filename = filename.replace('.csv', '_sql_friendly.csv')
-        sql_friendly_df.to_csv(sql_filename, index=False)
+        data.to_csv(sql_filename, index=False, header=sql_columns, chunksize=chunksize, compression='infer')
+        
+        if format.lower() == "parquet":
+            DataExporter.export_to_parquet(data, os.path.splitext(filename)[0] + '.parquet')
         
         print(f"Data exported for Dune Analytics: {filename} and {sql_filename}")
 
@@ -379,24 +626,24 @@ class DataExporter:
             filename (str): Output filename
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
         
-        # Create markdown content
-        markdown = f"# {title}\n\n"
-        markdown += f"*Generated on {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
+        # Create markdown content, collecting parts and joining once
+        parts = [
+            f"# {title}\n\n",
+            f"*Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
+        ]
         
         for section in sections:
-            markdown += f"## {section['title']}\n\n"
-            markdown += f"{section['content']}\n\n"
+            parts.append(f"## {section['title']}\n\n{section['content']}\n\n")
         
         # Write to file
-        with open(filename, 'w') as f:
-            f.write(markdown)
+        _write_text("".join(parts), filename)
         
         print(f"Markdown report exported: {filename}")
 
     @staticmethod
-    def export_interactive_html_table(data: pd.DataFrame, filename: str, title: str = "") -> None:
+    def export_interactive_html_table(data: 'pd.DataFrame', filename: str, title: str = "") -> None:
         """
         Export DataFrame as an interactive HTML table using DataTables.
         
@@ -406,7 +653,11 @@ class DataExporter:
             title (str, optional): Table title. Defaults to "".
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
+        
+        # pandas' formatter builds (and HTML-escapes) the table far faster than iterrows()
+        table_html = data.to_html(table_id='dataTable', classes='display', index=False, border=0, escape=True)
+        title = html_lib.escape(title)
         
         # Create HTML with DataTables
         html = f"""
@@ -429,18 +680,9 @@ class DataExporter:
         <body>
             <div class="container">
                 <h1>{title}</h1>
-                <p>Generated on {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
                 
-                <table id="dataTable" class="display">
-                    <thead>
-                        <tr>
-                            {" ".join([f"<th>{col}</th>" for col in data.columns])}
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {"".join(["<tr>" + " ".join([f"<td>{str(value)}</td>" for value in row]) + "</tr>" for _, row in data.iterrows()])}
-                    </tbody>
-                </table>
+                {table_html}
             </div>
             
             <script>
@@ -456,8 +698,7 @@ class DataExporter:
         """
         
         # Write to file
-        with open(filename, 'w') as f:
-            f.write(html)
+        _write_text(html, filename)
         
         print(f"Interactive HTML table exported: {filename}")
 
@@ -472,10 +713,12 @@ class DataExporter:
             filename (str): Output filename
         """
         # Ensure directory exists
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _ensure_dir(os.path.dirname(filename))
         
-        # Create HTML content
-        html = f"""
+        title = html_lib.escape(title)
+        
+        # Create HTML content, collecting parts and joining once instead of growing a string
+        parts = [f"""
         <!DOCTYPE html>
         <html>
         <head>
@@ -495,35 +738,34 @@ class DataExporter:
         <body>
             <div class="container">
                 <h1>{title}</h1>
-                <p>Generated on {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        """
+                <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+        """]
         
         for section in sections:
-            html += f"""
+            parts.append(f"""
                 <div class="section">
                     <h2>{section['title']}</h2>
                     <div class="content">
                         {section['content']}
                     </div>
-            """
+            """)
             
             if 'chart' in section:
-                html += f"""
+                parts.append(f"""
                     <div class="chart">
                         {section['chart']}
                     </div>
-                """
+                """)
             
-            html += "</div>"
+            parts.append("</div>")
         
-        html += """
+        parts.append("""
             </div>
         </body>
         </html>
-        """
+        """)
         
         # Write to file
-        with open(filename, 'w') as f:
-            f.write(html)
+        _write_text("".join(parts), filename)
         
         print(f"HTML report exported: {filename}")
\ No newline at end of file
@@ -4,23 +4,44 @@ Money Laundering Data Collection Script
 
 This script collects and analyzes data related to potential money laundering
 patterns on Solana using the Range, Helius, RugCheck, and Vybe APIs.
+
+If uvloop is installed it is used as the event loop, which speeds up the
+high-fanout request scheduling in the collectors; otherwise the default
+asyncio loop is used.
 """
 
 import os
 import json
-import time
 import argparse
+import importlib.util
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 import logging
 import asyncio # For potential async operations
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; the addresses file is then decoded in one piece
+    ijson = None
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (and unavailable on Windows); use the default loop
+    uvloop = None
+
 # Import custom API clients
 from collectors.range_client import RangeClient
 from collectors.helius_client import HeliusClient
 from collectors.rug_check_client import RugCheckClient
 from collectors.vybe_client import VybeClient
+from collectors.connection_pool import close_shared_connector
 
 # Import specialized collectors
 from collectors.mixer_collector import MixerCollector
@@ -52,6 +73,14 @@ parser.add_argument('--address-poisoning', action='store_true',
                    help='Analyze address poisoning attempts')
 parser.add_argument('--verbose', action='store_true',
                    help='Enable verbose output')
+parser.add_argument('--no-cache', action='store_true',
+                   help='Do not read or write the on-disk transaction cache')
+parser.add_argument('--concurrency', type=int, default=10,
+                   help='Maximum number of addresses collected at the same time')
+parser.add_argument('--graph-workers', type=int, default=0,
+                    help='Worker processes for parsing transactions into the graph (0 parses in-process)')
+parser.add_argument('--legacy-json', action='store_true',
+                   help='Also embed the full transaction graph in the results JSON')
 args = parser.parse_args()
 
 # Ensure output directory exists
@@ -63,39 +92,42 @@ helius_api_key = os.environ.get('HELIUS_API_KEY')
 rugcheck_jwt_token = os.environ.get('RUGCHECK_JWT_TOKEN')
 vybe_api_key = os.environ.get('VYBE_API_KEY')
 
-# Initialize API clients
+# Initialize API clients; their async sessions draw from one shared connection pool
 logging.info("Initializing API clients...")
 try:
-    range_client = RangeClient(range_api_key) if range_api_key else None
+    range_client = RangeClient(range_api_key, shared_pool=True) if range_api_key else None
     logging.info(f"RangeClient initialized: {'Yes' if range_client else 'No'}")
 except Exception as e:
     logging.error(f"Failed to initialize RangeClient: {e}")
     range_client = None
 
 try:
-    helius_client = HeliusClient(helius_api_key) if helius_api_key else None
+    helius_client = HeliusClient(helius_api_key, shared_pool=True) if helius_api_key else None
     logging.info(f"HeliusClient initialized: {'Yes' if helius_client else 'No'}")
 except Exception as e:
     logging.error(f"Failed to initialize HeliusClient: {e}")
     helius_client = None
 
 try:
-    rugcheck_client = RugCheckClient(rugcheck_jwt_token) if rugcheck_jwt_token else None
+    rugcheck_client = RugCheckClient(rugcheck_jwt_token, shared_pool=True) if rugcheck_jwt_token else None
     logging.info(f"RugCheckClient initialized: {'Yes' if rugcheck_client else 'No'}")
 except Exception as e:
     logging.error(f"Failed to initialize RugCheckClient: {e}")
     rugcheck_client = None
 
 try:
-    vybe_client = VybeClient(vybe_api_key) if vybe_api_key else None
+    vybe_client = VybeClient(vybe_api_key, shared_pool=True) if vybe_api_key else None
     logging.info(f"VybeClient initialized: {'Yes' if vybe_client else 'No'}")
 except Exception as e:
     logging.error(f"Failed to initialize VybeClient: {e}")
     vybe_client = None
 
 # Initialize collectors
-transaction_collector = TransactionCollector(helius_client=helius_client, range_client=range_client)
-mixer_collector = MixerCollector(helius_client=helius_client, range_client=range_client, vybe_client=vybe_client)
+tx_cache_path = "" if args.no_cache else None  # None selects the default cache location
+transaction_collector = TransactionCollector(helius_client=helius_client, range_client=range_client,
+                                             tx_cache_path=tx_cache_path)
+mixer_collector = MixerCollector(helius_client=helius_client, range_client=range_client, vybe_client=vybe_client,
+                                 tx_cache_path=tx_cache_path)
 address_poisoning_collector = AddressPoisoningCollector(helius_client=helius_client)
 sandwich_collector = SandwichCollector(helius_client=helius_client)
 
@@ -115,21 +147,39 @@ network_builder = NetworkBuilder(
     vybe_client=vybe_client
 )
 
+# One timestamp for the whole run, shared by the collected records and the exported files
+RUN_TS = datetime.now()
+
 # Initialize data exporter
-data_exporter = DataExporter(output_dir=args.output_dir)
+data_exporter = DataExporter(output_dir=args.output_dir, run_ts=RUN_TS)
+
+def load_addresses(path: str) -> List[str]:
+    """
+    Load addresses from a JSON file holding either a list of addresses or {"addresses": [...]}.
+
+    With ijson installed the addresses are streamed one at a time, so a large file (or one with
+    other large keys next to "addresses") is never decoded as a whole document.
+    """
+    with open(path, 'rb') as f:
+        if ijson is not None:
+            # The first non-whitespace byte tells a bare list from a wrapping object
+            head = f.read(4096).lstrip()
+            f.seek(0)
+            prefix = 'item' if head.startswith(b'[') else 'addresses.item'
+            return list(ijson.items(f, prefix))
+        addresses_data = _json_loads(f.read())
+
+    if isinstance(addresses_data, list):
+        return addresses_data
+    if isinstance(addresses_data, dict) and 'addresses' in addresses_data:
+        return addresses_data['addresses']
+    return []
 
 # Load addresses to analyze
 addresses_to_analyze = []
 if args.addresses:
     try:
-        with open(args.addresses, 'r') as f:
-            addresses_data = json.load(f)
-            
-        if isinstance(addresses_data, list):
-            addresses_to_analyze = addresses_data
-        elif isinstance(addresses_data, dict) and 'addresses' in addresses_data:
-            addresses_to_analyze = addresses_data['addresses']
-            
+        addresses_to_analyze = load_addresses(args.addresses)
         logging.info(f"Loaded {len(addresses_to_analyze)} addresses for analysis")
     except Exception as e:
         logging.error(f"Error loading addresses file: {str(e)}")
@@ -147,23 +197,16 @@ if not addresses_to_analyze:
 
 # Main collection functions
 
-async def collect_address_data(address: str) -> Dict:
+async def collect_addresses_data(addresses: List[str], now_iso: Optional[str] = None) -> List[Dict]:
     """
-    Collect comprehensive data about an address using TransactionCollector.
-    Ensures detailed transaction info is fetched if needed.
+    Collect comprehensive data about the addresses using TransactionCollector.
+    Detailed transaction info is fetched for all of them in pooled batch requests.
     """
-    logging.info(f"Analyzing address: {address}")
-    try:
-        # Use the transaction collector instead of analyzer directly
-        analysis_result = await transaction_collector.fetch_address_data(address, fetch_details=True)
-        return analysis_result
-    except Exception as e:
-        logging.error(f"Error collecting data for address {address}: {e}")
-        return {
-            "address": address,
-            "error": str(e),
-            "timestamp": datetime.now().isoformat()
-        }
+    logging.info(f"Analyzing {len(addresses)} addresses")
+    # Use the transaction collector instead of analyzer directly
+    return await transaction_collector.fetch_addresses_data(
+        addresses, fetch_details=True, now_iso=now_iso, concurrency=args.concurrency
+    )
 
 async def perform_mixer_analysis_enhanced() -> Dict:
     """Enhanced mixer analysis using the MixerCollector."""
@@ -176,11 +219,17 @@ async def perform_mixer_analysis_enhanced() -> Dict:
             "error": "MixerCollector not initialized"
         }
     
-    # Use the dedicated mixer collector
+    # Use the dedicated mixer collector, with exchange labels loaded up front
+    await mixer_collector.prewarm()
     return await mixer_collector.analyze_mixers(limit_per_mixer=500)
 
-async def analyze_address_poisoning_enhanced() -> Dict:
-    """Enhanced address poisoning analysis using AddressPoisoningCollector."""
+async def analyze_address_poisoning_enhanced(valid_addresses: List[str]) -> Dict:
+    """
+    Enhanced address poisoning analysis using AddressPoisoningCollector.
+
+    Args:
+        valid_addresses: Addresses whose data was collected without errors
+    """
     logging.info("Analyzing address poisoning attempts (enhanced)...")
     
     if not address_poisoning_collector:
@@ -191,96 +240,145 @@ async def analyze_address_poisoning_enhanced() -> Dict:
         }
     
     # Collect transactions for the addresses we're analyzing
-    transactions_to_check = await address_poisoning_collector.collect_address_transactions(
-        [data.get('address') for data in address_data_list if data.get('address') and 'error' not in data]
-    )
+    transactions_to_check = await address_poisoning_collector.collect_address_transactions(valid_addresses)
     
     # Analyze the transactions
     return await address_poisoning_collector.analyze_poisoning_attempts(transactions_to_check)
 
-def create_transaction_graph(address_data_list: List[Dict]) -> Dict:
+def create_transaction_graph(address_data_list: List[Dict], workers: int = 0) -> Dict:
     """
     Create a transaction graph from collected address data.
+
+    With workers > 0 the transactions are parsed in that many worker processes.
     """
     logging.info("Creating transaction graph from collected data...")
-    all_transactions_details = []
-
-    for data in address_data_list:
-        # Check if detailed transactions are stored directly 
-        if data and "error" not in data:
-             # Assuming details are stored under a key like 'detailed_transactions'
-             details = data.get("detailed_transactions", [])
-             if not details and "transaction_summary" in data:
-                  logging.warning(f"Detailed transactions not found for {data.get('address')}, graph may be incomplete.")
-             all_transactions_details.extend(details)
-
-    if not all_transactions_details:
+    seen_signatures = set()
+
+    def iter_unique_transactions():
+        # Stream transactions straight into edge extraction, skipping ones already seen
+        # under another address, so no combined list of every transaction is built
+        for data in address_data_list:
+            # Check if detailed transactions are stored directly 
+            if not data or "error" in data:
+                continue
+            # Assuming details are stored under a key like 'detailed_transactions'
+            details = data.get("detailed_transactions", [])
+            if not details and "transaction_summary" in data:
+                logging.warning(f"Detailed transactions not found for {data.get('address')}, graph may be incomplete.")
+            for tx in details:
+                signature = (tx.get("transaction", {}).get("signatures") or [None])[0]
+                if signature is None or signature in seen_signatures:
+                    continue
+                seen_signatures.add(signature)
+                yield tx
+
+    if workers > 0:
+        graph_data = transaction_collector.build_transaction_graph_parallel(iter_unique_transactions(), workers)
+    else:
+        graph_data = transaction_collector.build_transaction_graph_streaming(iter_unique_transactions())
+
+    if not seen_signatures:
          logging.warning("No transaction details available to build graph. Graph will be empty.")
          return {"nodes": [], "links": [], "message": "No transaction details found."}
 
-    # Deduplicate transactions by signature
-    unique_transactions = {tx.get("transaction", {}).get("signatures", [None])[0]: tx
-                           for tx in all_transactions_details if tx.get("transaction", {}).get("signatures", [None])[0]}
-
-    logging.info(f"Building graph from {len(unique_transactions)} unique transactions...")
-    
-    # Use TransactionCollector to build the graph
-    graph_data = transaction_collector.build_transaction_graph(list(unique_transactions.values()))
-    
+    logging.info(f"Built graph from {len(seen_signatures)} unique transactions.")
     logging.info(f"Created graph with {len(graph_data['nodes'])} nodes and {len(graph_data['links'])} links.")
     return graph_data
 
+def export_transaction_graph(transaction_graph: Dict) -> Dict:
+    """
+    Write the transaction graph to its own files and return a small manifest describing them.
+
+    Nodes and links are streamed to the D3 visualization JSON and, when pyarrow is installed,
+    also written as Parquet tables, so the results JSON doesn't have to hold the whole graph.
+    """
+    nodes = transaction_graph.get("nodes", [])
+    links = transaction_graph.get("links", [])
+    manifest = {
+        "node_count": len(nodes),
+        "link_count": len(links),
+        "files": {}
+    }
+    if "message" in transaction_graph:
+        manifest["message"] = transaction_graph["message"]
+    if not nodes:
+        return manifest
+
+    # Export specific datasets for visualizations
+    manifest["files"]["d3_json"] = data_exporter.export_graph_data(
+        nodes=nodes,
+        links=links,
+        name="money_laundering",
+        metadata={
+            "description": "Money laundering transaction graph",
+            "address_count": len(addresses_to_analyze),
+            "generated_at": RUN_TS.isoformat()
+        }
+    )
+
+    # Columnar copies for analysis tooling; compact and much faster to load than the JSON
+    if importlib.util.find_spec("pyarrow") is not None:
+        graph_dir = os.path.join(args.output_dir, "graph")
+        for key, rows in (("nodes", nodes), ("links", links)):
+            filename = os.path.join(graph_dir, f"transaction_graph_{key}.parquet")
+            try:
+                DataExporter.export_to_parquet(rows, filename)
+                manifest["files"][f"{key}_parquet"] = filename
+            except Exception as e:
+                logging.error(f"Failed to export graph {key} to Parquet: {e}")
+
+    return manifest
+
 # --- Main Execution ---
 async def main():
     logging.info("Starting data collection process")
-    global address_data_list # Use the global list modified in the loop
-    address_data_list = []
-
-    # Collect data for each address using the transaction collector
-    for address in addresses_to_analyze:
-        try:
-            data = await collect_address_data(address)
-            address_data_list.append(data)
-            time.sleep(0.2)  # Small wait between addresses
-        except Exception as e:
-            logging.error(f"Error processing address {address}: {str(e)}")
+    now_iso = RUN_TS.isoformat()  # One timestamp for the whole batch of addresses
 
-    # Perform additional analyses concurrently using specialized collectors
+    # Mixer analysis doesn't depend on the per-address data, so it runs alongside the collection
     mixer_task = asyncio.create_task(perform_mixer_analysis_enhanced()) if args.mixer_analysis else None
+
+    # Collect data for the addresses concurrently, with detail requests pooled across addresses
+    address_data_list = await collect_addresses_data(addresses_to_analyze, now_iso)
+
+    # Perform additional analyses concurrently using specialized collectors
     # bridge_task = asyncio.create_task(perform_bridge_analysis_enhanced()) if args.bridge_analysis else None # Add enhanced version
-    poisoning_task = asyncio.create_task(analyze_address_poisoning_enhanced()) if args.address_poisoning else None
+    valid_addresses = [data['address'] for data in address_data_list if data.get('address') and 'error' not in data]
+    poisoning_task = (asyncio.create_task(analyze_address_poisoning_enhanced(valid_addresses))
+                      if args.address_poisoning else None)
+
+    # Building the graph is CPU-bound; run it off the event loop so the analyses keep going
+    graph_task = asyncio.create_task(
+        asyncio.to_thread(create_transaction_graph, address_data_list, args.graph_workers)
+    )
+
+    async def no_analysis() -> Dict:
+        return {}
+
+    mixer_results, poisoning_results, transaction_graph = await asyncio.gather(
+        mixer_task or no_analysis(),
+        poisoning_task or no_analysis(),
+        graph_task
+    )
 
     results = {
         "addresses_analyzed": address_data_list,
-        "mixer_analysis": await mixer_task if mixer_task else {},
+        "mixer_analysis": mixer_results,
         # "bridge_analysis": await bridge_task if bridge_task else {},
         "bridge_analysis": {}, # Placeholder until enhanced bridge analysis is added
-        "address_poisoning": await poisoning_task if poisoning_task else {}
+        "address_poisoning": poisoning_results
     }
 
-    # Create transaction graph using the transaction collector
-    transaction_graph = create_transaction_graph(address_data_list)
-    results["transaction_graph"] = transaction_graph
-
     # Save results
     logging.info("Saving final results")
 
+    # The graph goes to its own files; the results reference them through a manifest
+    graph_manifest = export_transaction_graph(transaction_graph)
+    data_exporter.export_json(graph_manifest, "transaction_graph_manifest.json")
+    results["transaction_graph"] = transaction_graph if args.legacy_json else graph_manifest
+
     # Save complete results
     data_exporter.export_json(results, "money_laundering_analysis_results.json")
 
-    # Export specific datasets for visualizations
-    if transaction_graph and transaction_graph.get("nodes"):
-        data_exporter.export_graph_data(
-            nodes=transaction_graph.get("nodes", []),
-            links=transaction_graph.get("links", []),
-            name="money_laundering",
-            metadata={
-                "description": "Money laundering transaction graph",
-                "address_count": len(addresses_to_analyze),
-                "generated_at": datetime.now().isoformat()
-            }
-        )
-
     # Export mixer analysis data if available
     if args.mixer_analysis and results.get("mixer_analysis"):
         data_exporter.export_for_visualization(
@@ -299,6 +397,18 @@ async def main():
 
     logging.info("Data collection and analysis complete")
 
+async def run():
+    """Run main(), then close the clients' sessions and their shared connection pool on the same event loop."""
+    try:
+        await main()
+    finally:
+        for client in (helius_client, range_client, rugcheck_client, vybe_client):
+            if client is not None:
+                await client.close_async()
+        await close_shared_connector()
+
 if __name__ == "__main__":
     # Run the main function in an event loop
-    asyncio.run(main())
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.install()
+    asyncio.run(run())
\ No newline at end of file